@@ -0,0 +1,93 @@
+import os
+import time
+import statistics
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+import django
+
+__all__ = ["setup_django", "benchmark_database", "measure", "compare"]
+
+
+def setup_django() -> None:
+    """
+    Configures Django for a standalone benchmark script.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "insta_clone.settings")
+    django.setup()
+
+
+@contextmanager
+def benchmark_database() -> Iterator[None]:
+    """
+    Creates a throwaway test database for the duration of a benchmark,
+    built straight from the current models, and destroys it afterwards.
+    """
+    from django.apps import apps
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    settings.MIGRATION_MODULES = {
+        app.label: None for app in apps.get_app_configs()
+    }
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func: Callable[[], object], repeat: int = 50, warmup: int = 5) -> Dict[str, float]:
+    """
+    Calls a function repeatedly and returns latency statistics in milliseconds.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    samples.sort()
+    return {
+        "median": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def compare(
+    baseline: Callable[[], object],
+    candidate: Callable[[], object],
+    repeat: int = 20,
+    warmup: int = 3
+) -> Dict[str, float]:
+    """
+    Times two functions in alternation, so drift in the environment affects
+    both equally, and returns their median latencies in milliseconds along
+    with the relative overhead of the candidate.
+    """
+    for _ in range(warmup):
+        baseline()
+        candidate()
+
+    baseline_samples, candidate_samples = [], []
+    for _ in range(repeat):
+        for func, samples in ((baseline, baseline_samples), (candidate, candidate_samples)):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+
+    baseline_median = statistics.median(baseline_samples)
+    candidate_median = statistics.median(candidate_samples)
+    return {
+        "baseline": baseline_median,
+        "candidate": candidate_median,
+        "overhead": (candidate_median - baseline_median) / baseline_median,
+    }
@@ -0,0 +1,128 @@
+"""
+Measures the latency overhead of block/mute filtering on the post feed,
+the active stories list and the comment list.
+
+The viewer follows 100 users with 5 posts each and has blocked or muted 150
+other users, so the filtered and unfiltered requests return the same rows
+and only the cost of the hidden-user filter itself is compared.
+
+Usage (from the directory containing manage.py):
+    python -m benchmarks.feed_filtering
+"""
+from unittest import mock
+
+from benchmarks._setup import setup_django, benchmark_database, compare
+
+setup_django()
+
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import CustomUser, Follow, Block, Mute
+from posts.models import Post
+from comments.models import Comment
+from stories.models import Story
+from posts.views import PostListAPIView
+from stories.views import ActiveStoriesAPIView
+from comments.views import CommentListAPIView
+
+FOLLOWED = 100
+POSTS_PER_USER = 5
+BLOCKED = 100
+MUTED = 50
+MAX_OVERHEAD = 0.05
+
+
+def identity(queryset, *args, **kwargs):
+    """
+    Stand-in for exclude_hidden_users that applies no filtering.
+    """
+    return queryset
+
+
+def populate() -> CustomUser:
+    """
+    Creates the viewer, the followed users and their content.
+    """
+    viewer = CustomUser.objects.create_user(email="viewer@example.com", password="benchmark")
+    users = CustomUser.objects.bulk_create([
+        CustomUser(email=f"user{i}@example.com", slug=f"user-{i}")
+        for i in range(FOLLOWED + BLOCKED + MUTED)
+    ])
+    followed = users[:FOLLOWED]
+    blocked = users[FOLLOWED:FOLLOWED + BLOCKED]
+    muted = users[FOLLOWED + BLOCKED:]
+
+    Follow.objects.bulk_create([Follow(follower=viewer, followed=user) for user in followed])
+    Block.objects.bulk_create([Block(blocker=viewer, blocked=user) for user in blocked])
+    Mute.objects.bulk_create([Mute(muter=viewer, muted=user) for user in muted])
+
+    Post.objects.bulk_create([
+        Post(user=user, image="posts/benchmark.jpg", caption=f"Post {n}")
+        for user in followed
+        for n in range(POSTS_PER_USER)
+    ])
+    Story.objects.bulk_create([
+        Story(user=user, image="stories/images/benchmark.jpg",
+              expires_at=timezone.now() + timedelta(hours=12))
+        for user in followed
+    ])
+    post = Post.objects.first()
+    Comment.objects.bulk_create([
+        Comment(post=post, user=user, text="Nice")
+        for user in followed
+    ])
+    return viewer
+
+
+def run_case(name: str, view, path: str, patch_target: str, viewer: CustomUser, **kwargs) -> bool:
+    """
+    Times a view with and without the hidden-user filter and prints the overhead.
+    """
+    factory = APIRequestFactory()
+    view_func = view.as_view()
+
+    def call() -> None:
+        request = factory.get(path)
+        force_authenticate(request, user=viewer)
+        response = view_func(request, **kwargs)
+        assert response.status_code == 200
+
+    def unfiltered_call() -> None:
+        with mock.patch(patch_target, identity):
+            call()
+
+    result = compare(unfiltered_call, call)
+    print(
+        f"{name:<16} baseline {result['baseline']:8.2f} ms   "
+        f"filtered {result['candidate']:8.2f} ms   overhead {result['overhead']:+.2%}"
+    )
+    return result["overhead"] < MAX_OVERHEAD
+
+
+def main() -> None:
+    with benchmark_database():
+        viewer = populate()
+        post_id = Post.objects.values_list("id", flat=True).first()
+
+        results = [
+            run_case(
+                "post feed", PostListAPIView, "/api/v1/posts/post-list/",
+                "posts.views.post_views.exclude_hidden_users", viewer
+            ),
+            run_case(
+                "active stories", ActiveStoriesAPIView, "/api/v1/stories/active/",
+                "stories.views.story_views.exclude_hidden_users", viewer
+            ),
+            run_case(
+                "comment list", CommentListAPIView, f"/api/v1/comments/posts/{post_id}/comments/",
+                "comments.views.comment_view.exclude_hidden_users", viewer, post_id=post_id
+            ),
+        ]
+
+    print("PASS" if all(results) else f"FAIL: overhead above {MAX_OVERHEAD:.0%}")
+
+
+if __name__ == "__main__":
+    main()
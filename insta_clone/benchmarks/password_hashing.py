@@ -0,0 +1,142 @@
+"""
+Measures post feed latency while a burst of logins is being processed.
+
+Logins and feed requests are served by threads of the same process, like
+the threads of one web worker. The feed is first timed on its own, then
+under the burst twice: once with passwords
+hashed inline on every login thread, as before, and once on the bounded
+password hashing pool, which caps the cores spent on hashing and sheds the
+logins it cannot queue with 503. Shed clients wait for Retry-After.
+
+Usage (from the directory containing manage.py):
+    python -m benchmarks.password_hashing
+"""
+from unittest import mock
+
+from benchmarks._setup import setup_django, benchmark_database
+
+setup_django()
+
+import statistics
+import threading
+import time
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import CustomUser, Follow
+from users.views import LoginView
+from posts.models import Post
+from posts.views import PostListAPIView
+from utils.worker_pool import BoundedWorkerPool
+
+LOGIN_THREADS = 16
+FEED_THREADS = 2
+DURATION = 10
+FOLLOWED = 20
+POSTS_PER_USER = 5
+PASSWORD = "benchmark-password"
+
+
+def populate() -> CustomUser:
+    """
+    Creates the viewer, the accounts logging in and the feed content.
+    """
+    viewer = CustomUser.objects.create_user(email="viewer@example.com", password=PASSWORD)
+    for i in range(LOGIN_THREADS):
+        CustomUser.objects.create_user(email=f"login{i}@example.com", password=PASSWORD)
+
+    users = CustomUser.objects.bulk_create([
+        CustomUser(email=f"user{i}@example.com", slug=f"user-{i}")
+        for i in range(FOLLOWED)
+    ])
+    Follow.objects.bulk_create([Follow(follower=viewer, followed=user) for user in users])
+    Post.objects.bulk_create([
+        Post(user=user, image="posts/benchmark.jpg", caption=f"Post {n}")
+        for user in users
+        for n in range(POSTS_PER_USER)
+    ])
+    return viewer
+
+
+def run_burst(viewer: CustomUser, login_threads: int = LOGIN_THREADS) -> dict:
+    """
+    Runs logins and feed requests concurrently for DURATION seconds.
+    """
+    factory = APIRequestFactory()
+    login_view = LoginView.as_view()
+    feed_view = PostListAPIView.as_view()
+    stop = threading.Event()
+    feed_samples = []
+    login_statuses = []
+
+    def login_loop(i: int) -> None:
+        while not stop.is_set():
+            request = factory.post(
+                "/api/v1/users/login/",
+                {"email": f"login{i}@example.com", "password": PASSWORD}
+            )
+            response = login_view(request)
+            login_statuses.append(response.status_code)
+            if response.status_code == 503:
+                # Well-behaved clients wait as long as Retry-After asks.
+                stop.wait(int(response["Retry-After"]))
+        connection.close()
+
+    def feed_loop() -> None:
+        while not stop.is_set():
+            request = factory.get("/api/v1/posts/post-list/")
+            force_authenticate(request, user=viewer)
+            started = time.perf_counter()
+            response = feed_view(request)
+            feed_samples.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200
+        connection.close()
+
+    threads = [threading.Thread(target=login_loop, args=(i,)) for i in range(login_threads)]
+    threads += [threading.Thread(target=feed_loop) for _ in range(FEED_THREADS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    feed_samples.sort()
+    return {
+        "feed_median": statistics.median(feed_samples),
+        "feed_p95": feed_samples[int(len(feed_samples) * 0.95) - 1],
+        "feed_requests": len(feed_samples),
+        "logins": login_statuses.count(200),
+        "shed": login_statuses.count(503),
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name:<8} feed median {result['feed_median']:8.2f} ms   p95 {result['feed_p95']:8.2f} ms   "
+        f"feed requests {result['feed_requests']:5}   logins {result['logins']:4}   shed {result['shed']:4}"
+    )
+
+
+def main() -> None:
+    with benchmark_database():
+        viewer = populate()
+
+        idle = run_burst(viewer, login_threads=0)
+
+        inline_run = lambda func, *args, **kwargs: func(*args, **kwargs)
+        with mock.patch("users.models.user.password_hashing_pool.run", inline_run):
+            inline = run_burst(viewer)
+
+        pool = BoundedWorkerPool("password_hashing_benchmark", max_workers=1, max_queue=4)
+        with mock.patch("users.models.user.password_hashing_pool", pool):
+            pooled = run_burst(viewer)
+
+    report("idle", idle)
+    report("inline", inline)
+    report("pooled", pooled)
+    print("PASS" if pooled["feed_p95"] < inline["feed_p95"] else "FAIL: pool did not improve feed p95")
+
+
+if __name__ == "__main__":
+    main()
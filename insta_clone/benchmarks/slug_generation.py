@@ -0,0 +1,96 @@
+"""
+Measures unique slug generation when 10,000 users already share a name.
+
+Compares the previous probing algorithm, which issues one EXISTS query per
+taken suffix, with generate_unique_slug, which finds the next free suffix
+in a single query, and then registers more users with the colliding name.
+
+Usage (from the directory containing manage.py):
+    python -m benchmarks.slug_generation
+"""
+from benchmarks._setup import setup_django, benchmark_database, measure
+
+setup_django()
+
+from django.db import connection
+
+from users.models import CustomUser
+from utils.slug import convert_to_slug
+from utils.slug_manager import generate_unique_slug
+
+COLLISIONS = 10_000
+REGISTRATIONS = 200
+NAME = "John Smith"
+
+
+def probing_slug(base_name: str, model_class) -> str:
+    """
+    The previous algorithm: tries "slug", "slug-1", "slug-2", ... in turn.
+    """
+    base_slug = convert_to_slug(base_name)
+    slug = base_slug
+    counter = 1
+    while model_class.objects.filter(slug=slug).exists():
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
+
+def populate() -> None:
+    """
+    Creates COLLISIONS users whose slugs all derive from NAME.
+    """
+    base_slug = convert_to_slug(NAME)
+    CustomUser.objects.bulk_create([
+        CustomUser(
+            email=f"john{i}@example.com",
+            slug=base_slug if i == 0 else f"{base_slug}-{i}"
+        )
+        for i in range(COLLISIONS)
+    ], batch_size=2000)
+
+
+def run_case(name: str, func) -> None:
+    """
+    Prints the latency and query count of generating the next slug.
+    """
+    queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_queries):
+        slug = func(NAME, CustomUser)
+    timings = measure(lambda: func(NAME, CustomUser), repeat=5, warmup=1)
+    print(
+        f"{name:<10} next slug {slug:<18} queries {queries:>6}   "
+        f"median {timings['median']:9.2f} ms"
+    )
+
+
+def main() -> None:
+    with benchmark_database():
+        populate()
+
+        run_case("probing", probing_slug)
+        run_case("max-suffix", generate_unique_slug)
+
+        timings = measure(
+            lambda: CustomUser.objects.create(
+                email=f"new{CustomUser.objects.count()}@example.com",
+                first_name="John",
+                last_name="Smith"
+            ),
+            repeat=REGISTRATIONS,
+            warmup=0
+        )
+        print(
+            f"registering {REGISTRATIONS} more \"{NAME}\" users: "
+            f"median {timings['median']:.2f} ms, p95 {timings['p95']:.2f} ms per user"
+        )
+
+
+if __name__ == "__main__":
+    main()
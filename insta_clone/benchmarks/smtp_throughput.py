@@ -0,0 +1,120 @@
+"""
+Measures email throughput against a local aiosmtpd server.
+
+The same messages are sent three ways: with send_mail, which opens a new
+SMTP session for every email as send_verification_email used to; one at a
+time over the pooled connection, as send_verification_email does now; and
+queued and drained in batches by send_queued_emails. The stand-in server
+speaks plain SMTP on localhost, so the gap only covers the connect and SMTP
+handshake. Against a real mail host the TLS handshake and login come on top
+of it.
+
+Requires aiosmtpd (pip install aiosmtpd) and the Redis server the mail
+queue is kept in.
+
+Usage (from the directory containing manage.py):
+    python -m benchmarks.smtp_throughput
+"""
+from benchmarks._setup import setup_django
+
+setup_django()
+
+import time
+from aiosmtpd.controller import Controller
+from django.core.mail import EmailMessage, send_mail
+from django.test.utils import override_settings
+
+from users.tasks import send_queued_emails
+from utils.mail_queue import mail_queue
+from utils.smtp_pool import PooledSMTPConnection, smtp_connection
+
+MESSAGES = 500
+BATCH_SIZE = 100
+PORT = 8025
+
+
+class CountingHandler:
+    """
+    Accepts every message and counts them.
+    """
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.received += 1
+        return "250 Message accepted for delivery"
+
+
+def make_message(i: int) -> EmailMessage:
+    return EmailMessage(
+        "Email Verification",
+        f"Your verification code is: {i:06d}",
+        "noreply@example.com",
+        [f"user{i}@example.com"],
+    )
+
+
+def per_message_session() -> None:
+    for i in range(MESSAGES):
+        send_mail(
+            "Email Verification",
+            f"Your verification code is: {i:06d}",
+            "noreply@example.com",
+            [f"user{i}@example.com"],
+            fail_silently=False,
+        )
+
+
+def pooled_single() -> None:
+    pool = PooledSMTPConnection(keepalive=30, max_messages=MESSAGES)
+    for i in range(MESSAGES):
+        pool.send_messages([make_message(i)])
+    pool.close()
+
+
+def queued_batches() -> None:
+    for i in range(MESSAGES):
+        message = make_message(i)
+        mail_queue.push(message.subject, message.body, message.to, message.from_email)
+    send_queued_emails()
+    smtp_connection.close()
+
+
+def main() -> None:
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=PORT)
+    controller.start()
+
+    results = {}
+    try:
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=PORT,
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            EMAIL_BATCH_SIZE=BATCH_SIZE,
+        ):
+            for name, func in (
+                ("session", per_message_session),
+                ("pooled", pooled_single),
+                ("batched", queued_batches),
+            ):
+                received = handler.received
+                started = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - started
+                assert handler.received - received == MESSAGES
+                results[name] = MESSAGES / elapsed
+    finally:
+        controller.stop()
+
+    for name, throughput in results.items():
+        print(f"{name:<8} {throughput:10.1f} emails/s   {results[name] / results['session']:5.2f}x")
+    print("PASS" if results["pooled"] > results["session"] else "FAIL: pooling did not raise throughput")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from typing import Any, Dict
 from comments.models import Comment
 from comments.serializers import CommentSerializer
 from posts.models import Post
+from services.users import exclude_hidden_users
 
 __all__ = [
     "CommentCreateAPIView",
@@ -82,7 +83,11 @@ class CommentListAPIView(APIView):
             A Response object containing a list of comments.
         """
         post = get_object_or_404(Post, id=post_id)
-        comments = post.comments.all()
+        comments = exclude_hidden_users(
+            post.comments.all(), 
+            request.user.id, 
+            include_muted=False
+        )
         serializer = CommentSerializer(comments, many=True)
         logger.info(f"Retrieved comments for post {post_id}.")
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,16 @@
+import pytest
+from django.core.cache import cache
+
+from services.users.user_cache import local_cache
+from users.models.daily_message_limit import local_config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """
+    Clears the Redis and process-local caches before each test, so cached
+    entries never leak between tests that reuse the same ids or slugs.
+    """
+    cache.clear()
+    local_cache.clear()
+    local_config.clear()
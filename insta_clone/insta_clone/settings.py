@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from kombu import Queue
 
 load_dotenv()
 
@@ -55,6 +56,7 @@ INSTALLED_APPS = [
     "likes",
     "comments",
     "stories",
+    "uploads",
 ]
 
 MIDDLEWARE = [
@@ -73,8 +75,15 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Templates are compiled once per process and reused until the
+            # next deploy, instead of being read and parsed on every render.
+            "loaders": [
+                ("django.template.loaders.cached.Loader", [
+                    "django.template.loaders.filesystem.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ]),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -154,11 +163,12 @@ SIMPLE_JWT = {
     "ALGORITHM": "HS256",
     "SIGNING_KEY": os.getenv("JWT_SIGNING_KEY", SECRET_KEY),
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.auth.token_refresh.CachedTokenRefreshSerializer",
 }
 
 REST_FRAMEWORK = { 
 	"DEFAULT_AUTHENTICATION_CLASSES": [ 
-		"rest_framework_simplejwt.authentication.JWTAuthentication", 
+		"users.authentication.CachedJWTAuthentication", 
 	], 
 }
 
@@ -167,6 +177,143 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_BROKER_URL = os.getenv("REDIS_URL", default="redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("REDIS_URL", default="redis://localhost:6379/0")
+CELERY_RESULT_EXPIRES = timedelta(hours=1)
+
+# Each kind of work has its own queue, so a backlog of heavy jobs never
+# delays a verification email. Run one worker per queue group:
+# - email: transactional emails, short tasks, -c 4
+# - default,fanout: bulk emails and fan-out to followers, -c 4
+# - media: image and video processing, -c 2 --prefetch-multiplier=1
+# - maintenance: periodic purges and syncs, -c 1 --prefetch-multiplier=1
+# A worker started without -Q consumes every queue, as in development.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_QUEUES = [
+    Queue("default"),
+    Queue("email"),
+    Queue("fanout"),
+    Queue("media"),
+    Queue("maintenance"),
+]
+CELERY_TASK_ROUTES = {
+    "users.tasks.send_verification_email": {"queue": "email"},
+    "users.tasks.send_queued_emails": {"queue": "fanout"},
+    "users.tasks.purge_*": {"queue": "maintenance"},
+    "users.tasks.sync_token_blacklist_task": {"queue": "maintenance"},
+    "stories.tasks.sweep_expired_stories": {"queue": "maintenance"},
+    "stories.tasks.delete_story_media": {"queue": "media"},
+    "uploads.tasks.purge_stale_upload_sessions": {"queue": "maintenance"},
+}
+CELERY_BEAT_SCHEDULE = {
+    "purge-expired-verification-rows": {
+        "task": "users.tasks.purge_expired_verification_rows",
+        "schedule": timedelta(hours=1),
+    },
+    "purge-expired-tokens": {
+        "task": "users.tasks.purge_expired_tokens",
+        "schedule": timedelta(hours=1),
+    },
+    "sync-token-blacklist": {
+        "task": "users.tasks.sync_token_blacklist_task",
+        "schedule": timedelta(minutes=5),
+    },
+    "send-queued-emails": {
+        "task": "users.tasks.send_queued_emails",
+        "schedule": timedelta(seconds=10),
+    },
+    "relay-outbox": {
+        "task": "users.tasks.relay_outbox_task",
+        "schedule": timedelta(seconds=5),
+    },
+    "purge-dispatched-outbox": {
+        "task": "users.tasks.purge_dispatched_outbox",
+        "schedule": timedelta(hours=1),
+    },
+    "sweep-expired-stories": {
+        "task": "stories.tasks.sweep_expired_stories",
+        "schedule": timedelta(minutes=15),
+    },
+    "purge-stale-upload-sessions": {
+        "task": "uploads.tasks.purge_stale_upload_sessions",
+        "schedule": timedelta(hours=1),
+    },
+}
+
+# Outbox messages published per relay batch, and how long dispatched
+# messages are kept so their dedupe keys still drop duplicates
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_RETENTION = int(os.getenv("OUTBOX_RETENTION", 3600))
+
+# Access to /metrics/: a static bearer token for the scraper, and/or the
+# addresses or networks (comma separated) allowed without one
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", default="")
+METRICS_ALLOWED_IPS = [
+    network.strip()
+    for network in os.getenv("METRICS_ALLOWED_IPS", default="127.0.0.1,::1").split(",")
+    if network.strip()
+]
+
+# How often each Celery worker process merges its task metrics into Redis
+TASK_METRICS_FLUSH_INTERVAL = int(os.getenv("TASK_METRICS_FLUSH_INTERVAL", 10))
+
+# Rows deleted per primary-key range by the periodic purge tasks
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", 1000))
+
+# Expired stories deleted per transaction by the story sweeper
+STORY_SWEEP_BATCH_SIZE = int(os.getenv("STORY_SWEEP_BATCH_SIZE", 500))
+
+# Resumable uploads: where partial files are kept, the largest chunk and
+# file accepted, how long an unfinished upload can be resumed, and how many
+# unfinished uploads a user may have open at once
+UPLOAD_TEMP_DIR = os.getenv("UPLOAD_TEMP_DIR", os.path.join(BASE_DIR, "upload_sessions"))
+UPLOAD_CHUNK_MAX_SIZE = int(os.getenv("UPLOAD_CHUNK_MAX_SIZE", 8 * 1024 * 1024))
+UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", 100 * 1024 * 1024))
+UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL", 86400))
+UPLOAD_MAX_OPEN_SESSIONS = int(os.getenv("UPLOAD_MAX_OPEN_SESSIONS", 5))
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": os.getenv("REDIS_CACHE_URL", default="redis://localhost:6379/1"),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    }
+}
+
+# User lookup cache (slug -> id -> profile summary)
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 300))
+USER_CACHE_NEGATIVE_TTL = int(os.getenv("USER_CACHE_NEGATIVE_TTL", 60))
+USER_CACHE_LOCAL_TTL = int(os.getenv("USER_CACHE_LOCAL_TTL", 10))
+USER_CACHE_LOCAL_SIZE = int(os.getenv("USER_CACHE_LOCAL_SIZE", 2048))
+
+# Per-viewer blocked/muted user sets used to filter feeds
+HIDDEN_USERS_CACHE_TTL = int(os.getenv("HIDDEN_USERS_CACHE_TTL", 600))
+
+# How long the Redis mirror of the token blacklist is trusted before the
+# next sync rebuilds it
+TOKEN_BLACKLIST_SYNC_TTL = int(os.getenv("TOKEN_BLACKLIST_SYNC_TTL", 3600))
+
+# Verification code storage ("redis" or "database") and lifetime in seconds
+VERIFICATION_CODE_BACKEND = os.getenv("VERIFICATION_CODE_BACKEND", default="redis")
+VERIFICATION_CODE_TTL = int(os.getenv("VERIFICATION_CODE_TTL", 180))
+
+# How long each process trusts its copy of the DailyMessageLimit configuration
+DAILY_MESSAGE_LIMIT_LOCAL_TTL = int(os.getenv("DAILY_MESSAGE_LIMIT_LOCAL_TTL", 10))
+
+# Threads that hash passwords, and how many hashes may wait for one before
+# further logins are answered with 503
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", 2))
+PASSWORD_HASHING_QUEUE_SIZE = int(os.getenv("PASSWORD_HASHING_QUEUE_SIZE", 16))
+
+# Failed logins allowed per window before the email or client IP is locked
+# out; each further lockout doubles, from LOGIN_LOCKOUT_BASE up to LOGIN_LOCKOUT_MAX
+LOGIN_FAILURE_WINDOW = int(os.getenv("LOGIN_FAILURE_WINDOW", 900))
+LOGIN_FAILURE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_FAILURE_LIMIT_PER_EMAIL", 5))
+LOGIN_FAILURE_LIMIT_PER_IP = int(os.getenv("LOGIN_FAILURE_LIMIT_PER_IP", 20))
+LOGIN_LOCKOUT_BASE = int(os.getenv("LOGIN_LOCKOUT_BASE", 60))
+LOGIN_LOCKOUT_MAX = int(os.getenv("LOGIN_LOCKOUT_MAX", 3600))
 
 # Path and URL of media files
 MEDIA_URL = "/media/" 
@@ -181,6 +328,14 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 
+# Each worker process keeps one SMTP session open: it is checked with NOOP
+# after SMTP_KEEPALIVE idle seconds and replaced after
+# SMTP_CONNECTION_MAX_MESSAGES messages. Queued emails are sent
+# EMAIL_BATCH_SIZE at a time.
+SMTP_KEEPALIVE = int(os.getenv("SMTP_KEEPALIVE", 30))
+SMTP_CONNECTION_MAX_MESSAGES = int(os.getenv("SMTP_CONNECTION_MAX_MESSAGES", 100))
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 100))
+
 
 # Swagger configuration
 SWAGGER_SETTINGS = {
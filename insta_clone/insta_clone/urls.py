@@ -21,6 +21,7 @@ from django.conf.urls.static import static
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from insta_clone.views import MetricsView
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -81,6 +82,13 @@ urlpatterns = [
         name="token_verify"
     ),
     
+    # Process metrics for monitoring
+    path(
+        "metrics/",
+        MetricsView.as_view(),
+        name="metrics"
+    ),
+
     # API paths
     path(
         "api/v1/", 
@@ -101,6 +109,10 @@ urlpatterns = [
     path(
         "api/v1/",
         include("stories.urls")    
+    ),
+    path(
+        "api/v1/",
+        include("uploads.urls")
     )
     
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
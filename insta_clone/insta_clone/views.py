@@ -0,0 +1,62 @@
+import hmac
+import ipaddress
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.permissions import BasePermission
+from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
+
+from utils.metrics import metrics
+from utils.task_metrics import task_metrics
+
+__all__ = ["HasMetricsAccess", "MetricsView"]
+
+
+class HasMetricsAccess(BasePermission):
+    """
+    Allows a scraper that presents METRICS_TOKEN as a bearer token, or that
+    connects from an address in METRICS_ALLOWED_IPS.
+
+    Both are static, unlike a staff JWT, so a Prometheus job can be
+    configured with them once.
+    """
+
+    def has_permission(self, request, view) -> bool:
+        token = getattr(settings, "METRICS_TOKEN", "")
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        if token and scheme.lower() == "bearer" and hmac.compare_digest(credentials, token):
+            return True
+
+        try:
+            address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+        except ValueError:
+            return False
+        return any(
+            address in ipaddress.ip_network(network, strict=False)
+            for network in getattr(settings, "METRICS_ALLOWED_IPS", [])
+        )
+
+
+class MetricsView(APIView):
+    """
+    Exposes the metrics of the current process, followed by the Celery task
+    metrics of every worker, in the Prometheus text format.
+
+    Requests are not authenticated as users; access is decided by
+    HasMetricsAccess.
+    """
+    authentication_classes = []
+    permission_classes = [HasMetricsAccess]
+
+    @swagger_auto_schema(auto_schema=None)
+    def get(self, request) -> HttpResponse:
+        """
+        Returns every recorded counter, gauge, summary and task histogram.
+        """
+        # Observations this process made outside a task, e.g. relaying the
+        # outbox after a commit, are only in its memory until flushed.
+        task_metrics.flush(force=True)
+        return HttpResponse(
+            metrics.render() + task_metrics.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -2,6 +2,7 @@ from django.db import models
 from django.conf import settings
 from posts.models import Post
 from typing import Type
+from utils.leaderboard import POST_LIKES_LEADERBOARD
 
 
 class PostLike(models.Model):
@@ -33,6 +34,7 @@ class PostLike(models.Model):
         
         If the user has not liked the post, it creates a like entry.
         If the user has already liked the post, it removes the like entry.
+        The post likes leaderboard is updated to match.
 
         Args:
             user (User): The user who wants to like/unlike the post.
@@ -46,7 +48,9 @@ class PostLike(models.Model):
             post=post
         )
         if created:
+            POST_LIKES_LEADERBOARD.incr(post.id)
             return True
         
         like_obj.delete()
+        POST_LIKES_LEADERBOARD.incr(post.id, -1)
         return False
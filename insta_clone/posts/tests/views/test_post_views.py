@@ -3,7 +3,7 @@ from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from posts.models import Post
-from users.models import Follow
+from users.models import Follow, Mute
 from django.core.files.uploadedfile import SimpleUploadedFile
 from io import BytesIO
 from PIL import Image
@@ -122,6 +122,35 @@ def test_post_list(
     response = client.get("/api/v1/posts/post-list/")
     assert response.status_code == status.HTTP_200_OK
 
+@pytest.mark.django_db
+def test_post_list_excludes_muted_users(
+        client: APIClient, user: get_user_model(), 
+        other_user: get_user_model()
+    ) -> None:
+
+    """Test that posts from muted users are left out of the feed."""
+    client.force_authenticate(user=user)
+    Follow.objects.create(follower=user, followed=other_user)
+
+    Post.objects.create(
+        user=other_user,
+        image=SimpleUploadedFile(
+            "test_image.jpg", 
+            b"file_content", 
+            content_type="image/jpeg"
+        ),
+        caption="Other user post",
+    )
+
+    response = client.get("/api/v1/posts/post-list/")
+    assert len(response.data) == 1
+
+    Mute.objects.create(muter=user, muted=other_user)
+
+    response = client.get("/api/v1/posts/post-list/")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 0
+
 @pytest.mark.django_db
 def test_post_detail(
         client: APIClient, user: get_user_model(), post: Post
@@ -15,6 +15,12 @@ urlpatterns = [
         name="post-create"
     ),
     
+    path(
+        "posts/leaderboard/", 
+        TopPostsAPIView.as_view(), 
+        name="post-leaderboard"
+    ),
+
     path(
         "posts/<int:id>/", 
         PostDetailAPIView.as_view(), 
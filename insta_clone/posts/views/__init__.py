@@ -1 +1,2 @@
-from .post_views import *
\ No newline at end of file
+from .post_views import *
+from .leaderboard import *
\ No newline at end of file
@@ -0,0 +1,87 @@
+import logging
+from rest_framework.views import APIView, Response, status
+from rest_framework import permissions
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from posts.models import Post
+from services.users import exclude_hidden_users
+from utils.leaderboard import POST_LIKES_LEADERBOARD
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+__all__ = ["TopPostsAPIView"]
+
+DEFAULT_LEADERBOARD_LIMIT = 10
+MAX_LEADERBOARD_LIMIT = 100
+
+
+class TopPostsAPIView(APIView):
+    """
+    API view to list the most-liked posts.
+
+    The ranking is read from a Redis sorted set kept up to date by
+    PostLike.toggle_like, so the cost does not grow with the likes table.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Get the most-liked posts",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Number of posts to return (max {MAX_LEADERBOARD_LIMIT})",
+                type=openapi.TYPE_INTEGER,
+                required=False
+            ),
+        ],
+        responses={status.HTTP_200_OK: "Most-liked posts", status.HTTP_400_BAD_REQUEST: "Invalid request"}
+    )
+    def get(self, request, *args, **kwargs) -> Response:
+        """
+        Handles GET requests to fetch the most-liked posts.
+
+        Args:
+            request: The incoming HTTP request with an optional "limit" query parameter.
+
+        Returns:
+            Response: The posts in descending order of like count.
+        """
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LEADERBOARD_LIMIT))
+        except ValueError:
+            return Response(
+                {"error": "The \"limit\" query parameter must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not 1 <= limit <= MAX_LEADERBOARD_LIMIT:
+            return Response(
+                {"error": f"The \"limit\" query parameter must be between 1 and {MAX_LEADERBOARD_LIMIT}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        entries = POST_LIKES_LEADERBOARD.top(limit)
+        posts = exclude_hidden_users(
+            Post.objects.filter(
+                id__in=[post_id for post_id, _ in entries]
+            ).select_related("user"),
+            request.user.id
+        ).in_bulk()
+
+        results = [
+            {
+                "id": post_id,
+                "user": posts[post_id].user.slug,
+                "image": request.build_absolute_uri(posts[post_id].image.url),
+                "caption": posts[post_id].caption,
+                "like_count": like_count,
+            }
+            for post_id, like_count in entries
+            if post_id in posts
+        ]
+        logger.info(f"Fetched top {len(results)} posts by likes for user {request.user.id}")
+
+        return Response(results, status=status.HTTP_200_OK)
@@ -10,6 +10,8 @@ from drf_yasg import openapi
 from posts.models import Post
 from users.models import Follow
 from posts.serializers import PostSerializer
+from services.users import exclude_hidden_users
+from utils.leaderboard import POST_LIKES_LEADERBOARD
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -82,6 +84,7 @@ class PostListAPIView(APIView):
         user = request.user
         followed_users = Follow.objects.filter(follower=user).values_list("followed__id", flat=True)
         posts = Post.objects.filter(user_id__in=followed_users).order_by("-created_at")
+        posts = exclude_hidden_users(posts, user.id)
         logger.info(f"Fetched {posts.count()} posts from followed users for user {user.id}")
         serializer = PostSerializer(posts, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -140,5 +143,6 @@ class PostDeleteAPIView(APIView):
         post = get_object_or_404(Post, id=id)
         self.check_object_permissions(request, post)
         post.delete()
+        POST_LIKES_LEADERBOARD.remove(id)
         logger.info(f"Post {id} deleted successfully by user {request.user.id}")
         return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -1 +1,5 @@
-from .auth import *
\ No newline at end of file
+from .auth import *
+from .users import *
+from .outbox import *
+from .stories import *
+from .uploads import *
\ No newline at end of file
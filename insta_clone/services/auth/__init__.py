@@ -1,3 +1,6 @@
 from .email_service import *
 from .user_services import *
-from .verification_service import *
\ No newline at end of file
+from .verification_service import *
+from .verification_store import *
+from .token_blacklist import *
+from .login_throttle import *
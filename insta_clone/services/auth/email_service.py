@@ -1,43 +1,71 @@
 import logging
-from users.models import VerificationCode
+from typing import Optional, Tuple
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.translation import gettext
+
+from services.auth.verification_store import get_verification_code_store, VERIFICATION_CODE_TTL
 from utils.verification_code import generate_verification_code
 
-__all__ = ["create_verification_code"]
+__all__ = ["create_verification_code", "build_verification_email"]
 
 logger = logging.getLogger(__name__)
 
 
-def create_verification_code(email: str) -> str:
+def create_verification_code(email: str) -> Tuple[str, str]:
     """
-    Generate a new verification code for the given email, delete any existing unverified codes,
-    and store the new code in the database.
+    Generate a new verification code for the given email and store it,
+    replacing any code previously sent to that address.
 
     Args:
         email (str): The email address for which the verification code is generated.
 
     Returns:
-        str: The generated verification code.
+        tuple: The generated verification code and the mail ticket to send it with.
     """
     code: str = generate_verification_code()
     logger.info(f"Generated verification code for email: {email}.")
 
-    # Check and delete existing code
-    deleted_count = VerificationCode.objects.filter(
-        email=email, 
-        is_verified=False
-    ).delete()
-    logger.info(
-        f"Deleted {deleted_count[0]} existing verification code(s) for email: {email}."
-    )
-
-    # Add the new code to the DB
-    VerificationCode.objects.create(
-        email=email,
-        verification_code=code,
-        is_verified=False
-    )
+    ticket = get_verification_code_store().save(email, code)
     logger.info(
         f"New verification code created and stored for email: {email}."
     )
 
-    return code
\ No newline at end of file
+    return code, ticket
+
+
+def build_verification_email(
+    email: str,
+    verification_code: str,
+    language: Optional[str] = None
+) -> EmailMultiAlternatives:
+    """
+    Builds the verification email with a plain-text body and an HTML
+    alternative, both rendered from the users/emails templates.
+
+    Templates come from the cached loader, so they are parsed once per
+    process and each message only pays for rendering the context.
+
+    Args:
+        email (str): The email address the code is sent to.
+        verification_code (str): The code to include in the email.
+        language (Optional[str]): The language to render in, LANGUAGE_CODE if omitted.
+
+    Returns:
+        EmailMultiAlternatives: The message, ready to be sent.
+    """
+    context = {
+        "verification_code": verification_code,
+        "expires_in": max(VERIFICATION_CODE_TTL // 60, 1),
+    }
+
+    with translation.override(language or settings.LANGUAGE_CODE):
+        subject = gettext("Email Verification")
+        text_body = render_to_string("users/emails/verification_code.txt", context)
+        html_body = render_to_string("users/emails/verification_code.html", context)
+
+    message = EmailMultiAlternatives(subject, text_body, settings.EMAIL_HOST_USER, [email])
+    message.attach_alternative(html_body, "text/html")
+    return message
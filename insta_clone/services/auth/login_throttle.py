@@ -0,0 +1,197 @@
+import logging
+from typing import Dict, Optional
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.throttling import BaseThrottle
+
+__all__ = [
+    "LoginThrottle",
+    "login_throttle",
+    "get_client_ip",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def get_client_ip(request) -> Optional[str]:
+    """
+    Returns the client address of a request, honouring NUM_PROXIES like
+    DRF's own throttles.
+    """
+    if request is None:
+        return None
+    return BaseThrottle().get_ident(request)
+
+
+class LoginThrottle:
+    """
+    Counts failed logins per client IP and per email in Redis and locks
+    either one out once it fails too often within the window.
+
+    Every lockout of the same IP or email doubles the next one, up to
+    `lockout_max` seconds. A locked login is rejected before any password
+    is hashed, so a brute-force attempt costs one Redis round trip instead
+    of a full PBKDF2 run.
+    """
+
+    FAILURES_KEY = "login:failures:{}:{}"
+    LOCKOUTS_KEY = "login:lockouts:{}:{}"
+    LOCK_KEY = "login:lock:{}:{}"
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        window: int,
+        lockout_base: int,
+        lockout_max: int
+    ) -> None:
+        """
+        Args:
+            limits (Dict[str, int]): The allowed failures per window of each
+                scope, i.e. "ip" and "email".
+            window (int): How long failures are counted, in seconds.
+            lockout_base (int): The length of the first lockout, in seconds.
+            lockout_max (int): The longest lockout, in seconds.
+        """
+        self.limits = limits
+        self.window = window
+        self.lockout_base = lockout_base
+        self.lockout_max = lockout_max
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    @staticmethod
+    def _identifiers(ip: Optional[str], email: Optional[str]) -> Dict[str, str]:
+        identifiers = {}
+        if ip:
+            identifiers["ip"] = ip
+        if email:
+            identifiers["email"] = email.strip().lower()
+        return identifiers
+
+    def retry_after(self, ip: Optional[str], email: Optional[str]) -> int:
+        """
+        Returns how many seconds the IP or email stays locked out, or 0.
+        """
+        identifiers = self._identifiers(ip, email)
+        if not identifiers:
+            return 0
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for scope, identifier in identifiers.items():
+                pipe.ttl(self.LOCK_KEY.format(scope, identifier))
+            return max(max(pipe.execute()), 0)
+        except RedisError as e:
+            logger.error(f"Login throttle is unavailable, allowing {email}: {e}")
+            return 0
+
+    def register_failure(self, ip: Optional[str], email: Optional[str]) -> int:
+        """
+        Counts a failed login and locks out every scope over its limit.
+
+        Returns:
+            int: The seconds until the login is allowed again, or 0.
+        """
+        identifiers = self._identifiers(ip, email)
+        retry_after = 0
+
+        try:
+            pipe = self.redis.pipeline()
+            for scope, identifier in identifiers.items():
+                key = self.FAILURES_KEY.format(scope, identifier)
+                # The window starts at the first failure; INCR keeps the TTL.
+                pipe.set(key, 0, ex=self.window, nx=True)
+                pipe.incr(key)
+            counts = pipe.execute()[1::2]
+
+            for (scope, identifier), count in zip(identifiers.items(), counts):
+                if count >= self.limits[scope]:
+                    retry_after = max(retry_after, self._lock_out(scope, identifier))
+        except RedisError as e:
+            logger.error(f"Could not record failed login for {email}: {e}")
+
+        return retry_after
+
+    def _lock_out(self, scope: str, identifier: str) -> int:
+        lockouts_key = self.LOCKOUTS_KEY.format(scope, identifier)
+        lockouts = self.redis.incr(lockouts_key)
+        duration = min(self.lockout_base * 2 ** (lockouts - 1), self.lockout_max)
+
+        pipe = self.redis.pipeline()
+        # Remember previous lockouts long enough for the next one to double.
+        pipe.expire(lockouts_key, duration + self.lockout_max)
+        pipe.set(self.LOCK_KEY.format(scope, identifier), 1, ex=duration)
+        pipe.delete(self.FAILURES_KEY.format(scope, identifier))
+        pipe.execute()
+
+        logger.warning(f"Login locked out for {scope} {identifier} for {duration}s.")
+        return duration
+
+    def register_success(self, email: str) -> None:
+        """
+        Clears the failures of an email after a successful login. The IP's
+        failures are kept, since one IP may be guessing many accounts.
+        """
+        self.unlock("email", email)
+
+    def locked(self, scope: str) -> Dict[str, int]:
+        """
+        Lists the IPs or emails currently locked out.
+
+        Args:
+            scope (str): "ip" or "email".
+
+        Returns:
+            Dict[str, int]: The seconds left of each lockout, by IP or email.
+        """
+        prefix = self.LOCK_KEY.format(scope, "")
+        try:
+            keys = list(self.redis.scan_iter(match=f"{prefix}*", count=1000))
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.ttl(key)
+            ttls = pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Could not list login lockouts for {scope}: {e}")
+            return {}
+
+        return {
+            key.decode()[len(prefix):]: ttl
+            for key, ttl in zip(keys, ttls) if ttl > 0
+        }
+
+    def unlock(self, scope: str, identifier: str) -> None:
+        """
+        Removes the failures, lockout history and current lockout of an IP
+        or email.
+
+        Args:
+            scope (str): "ip" or "email".
+            identifier (str): The IP address or email.
+        """
+        if scope == "email":
+            identifier = identifier.strip().lower()
+
+        try:
+            self.redis.delete(
+                self.FAILURES_KEY.format(scope, identifier),
+                self.LOCKOUTS_KEY.format(scope, identifier),
+                self.LOCK_KEY.format(scope, identifier)
+            )
+        except RedisError as e:
+            logger.warning(f"Could not unlock login for {scope} {identifier}: {e}")
+
+
+login_throttle = LoginThrottle(
+    limits={
+        "ip": getattr(settings, "LOGIN_FAILURE_LIMIT_PER_IP", 20),
+        "email": getattr(settings, "LOGIN_FAILURE_LIMIT_PER_EMAIL", 5),
+    },
+    window=getattr(settings, "LOGIN_FAILURE_WINDOW", 900),
+    lockout_base=getattr(settings, "LOGIN_LOCKOUT_BASE", 60),
+    lockout_max=getattr(settings, "LOGIN_LOCKOUT_MAX", 3600)
+)
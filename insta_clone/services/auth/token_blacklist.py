@@ -0,0 +1,148 @@
+import logging
+from datetime import datetime
+from django.conf import settings
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+__all__ = [
+    "CachedRefreshToken",
+    "is_token_blacklisted",
+    "mirror_blacklisted_token",
+    "sync_token_blacklist",
+]
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY = "jwt:blacklist:{}"
+BLACKLIST_SYNCED_KEY = "jwt:blacklist:synced"
+# The mirror is only trusted for this long, so a key lost to eviction is
+# restored by the next sync instead of being missed forever.
+BLACKLIST_SYNC_TTL: int = getattr(settings, "TOKEN_BLACKLIST_SYNC_TTL", 3600)
+
+
+def mirror_blacklisted_token(jti: str, expires_at: datetime) -> None:
+    """
+    Records a blacklisted token in Redis until the token itself expires.
+
+    If the write fails, the mirror is marked incomplete, so blacklist checks
+    go to the database until the next sync has copied the token.
+
+    Args:
+        jti (str): The token's unique identifier.
+        expires_at (datetime): When the token expires.
+    """
+    ttl = int((expires_at - now()).total_seconds())
+    if ttl <= 0:
+        return
+
+    redis = get_redis_connection("default")
+    try:
+        redis.set(BLACKLIST_KEY.format(jti), 1, ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Could not mirror blacklisted token {jti}: {e}")
+        try:
+            redis.delete(BLACKLIST_SYNCED_KEY)
+        except RedisError as e:
+            logger.error(f"Could not mark the token blacklist mirror as incomplete: {e}")
+
+
+def is_token_blacklisted(jti: str) -> bool:
+    """
+    Checks whether a token is blacklisted, reading Redis instead of the database.
+
+    The database is only queried when Redis is unavailable or its mirror has
+    not been populated yet, e.g. right after a flush.
+
+    Args:
+        jti (str): The token's unique identifier.
+
+    Returns:
+        bool: True if the token is blacklisted.
+    """
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        pipe.exists(BLACKLIST_KEY.format(jti))
+        pipe.exists(BLACKLIST_SYNCED_KEY)
+        blacklisted, synced = pipe.execute()
+
+        if blacklisted:
+            return True
+        if synced:
+            return False
+    except RedisError as e:
+        logger.warning(f"Token blacklist mirror is unavailable: {e}")
+
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def sync_token_blacklist(batch_size: int = 1000, force: bool = False) -> int:
+    """
+    Copies every unexpired blacklisted token from the database into Redis and
+    marks the mirror as complete for TOKEN_BLACKLIST_SYNC_TTL seconds.
+
+    New entries are mirrored as they are created, so this only does work
+    when the mirror is missing or its mark has expired, unless forced.
+
+    Args:
+        batch_size (int): The number of keys written per round trip.
+        force (bool): Rebuild even if the mirror is already marked complete.
+
+    Returns:
+        int: The number of tokens mirrored.
+    """
+    redis = get_redis_connection("default")
+    if not force and redis.exists(BLACKLIST_SYNCED_KEY):
+        return 0
+
+    current_time = now()
+    tokens = BlacklistedToken.objects.filter(
+        token__expires_at__gt=current_time
+    ).values_list("token__jti", "token__expires_at").iterator(chunk_size=batch_size)
+
+    total = 0
+    pipe = redis.pipeline(transaction=False)
+    for jti, expires_at in tokens:
+        pipe.set(BLACKLIST_KEY.format(jti), 1, ex=max(int((expires_at - current_time).total_seconds()), 1))
+        total += 1
+        if total % batch_size == 0:
+            pipe.execute()
+    pipe.set(BLACKLIST_SYNCED_KEY, 1, ex=BLACKLIST_SYNC_TTL)
+    pipe.execute()
+
+    logger.info(f"Mirrored {total} blacklisted tokens into Redis.")
+    return total
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    A refresh token whose blacklist check is answered from Redis.
+    """
+
+    def check_blacklist(self) -> None:
+        """
+        Raises TokenError if this token is blacklisted.
+        """
+        if is_token_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> tuple:
+        """
+        Adds this token to the blacklist.
+
+        Tokens issued by this app are already in the outstanding list, so the
+        user lookup done by simplejwt is skipped unless the row is missing.
+        """
+        outstanding = OutstandingToken.objects.filter(
+            jti=self.payload[api_settings.JTI_CLAIM]
+        ).first()
+
+        if outstanding is None:
+            return super().blacklist()
+
+        return BlacklistedToken.objects.get_or_create(token=outstanding)
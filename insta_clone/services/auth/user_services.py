@@ -1,9 +1,10 @@
 import random
 import logging
 from django.contrib.auth import get_user_model
-from users.models import VerificationCode
+from services.auth.verification_store import get_verification_code_store
 
 __all__ = [
+    "check_verification_code",
     "validate_verification_code"
 ]
 
@@ -12,30 +13,34 @@ logger = logging.getLogger(__name__)
 User = get_user_model() 
 
 
-def validate_verification_code(email: str, verification_code: str) -> VerificationCode:
+def check_verification_code(email: str, verification_code: str) -> None:
     """
-    Checks whether the provided email address and stored code are correct and valid.
+    Checks whether the provided email address and stored code are correct and valid,
+    without consuming the code. Used while validating a request, so a code is only
+    consumed once the rest of the request has been accepted.
 
     :param email: The user's email address.
-    :param verification_code: The sent deletion code.
-    :return: Returns a VerificationCode object if the code is valid.
-    :raises ValueError: If the code is invalid or has already been used.
+    :param verification_code: The sent verification code.
+    :raises ValueError: If the code is invalid, expired or has already been used.
+    """
+    if not get_verification_code_store().exists(email, verification_code):
+        logger.warning(f"Invalid or expired verification code for email: {email}")
+        raise ValueError("Invalid or expired verification code.")
+
+
+def validate_verification_code(email: str, verification_code: str) -> None:
+    """
+    Checks whether the provided email address and stored code are correct and valid,
+    and consumes the code so it cannot be used again.
+
+    :param email: The user's email address.
+    :param verification_code: The sent verification code.
+    :raises ValueError: If the code is invalid, expired or has already been used.
     """
     logger.info(f"Validating verification code for email: {email}")
-    try:
-        record = VerificationCode.objects.get(
-            email=email, 
-            verification_code=verification_code
-        )
-    except VerificationCode.DoesNotExist:
+
+    if not get_verification_code_store().consume(email, verification_code):
         logger.warning(f"Invalid or expired verification code for email: {email}")
         raise ValueError("Invalid or expired verification code.")
     
-    if record.is_verified or record.is_expired():
-        logger.warning(
-            f"Verification code for email: {email} is either already verified or expired."
-        )
-        raise ValueError("Verification code is invalid or expired.")
-    
-    logger.info(f"Verification code for email: {email} is valid.")
-    return record
\ No newline at end of file
+    logger.info(f"Verification code for email: {email} is valid.")
\ No newline at end of file
@@ -1,18 +1,94 @@
 import logging
-from django.utils.timezone import now
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from django.db import transaction
+from django.utils.translation import get_language
 
-from users.models.daily_message_limit import DailyMessageLimit
 from users.models.daily_messages import DailyMessage
-from users.models import VerificationCode
+from services.auth.email_service import create_verification_code
 
-from utils.verification_code import generate_verification_code
-from users.tasks import send_verification_email
+from services.outbox import enqueue_task
+from utils.rate_limiter import SlidingWindowRateLimiter
 
-__all__ = ["reset_password_send_code"]
+__all__ = [
+    "check_message_rate_limit",
+    "send_verification_code",
+    "reset_password_send_code",
+]
 
 logger = logging.getLogger(__name__)
 
+message_rate_limiter = SlidingWindowRateLimiter("ratelimit:messages")
+
+
+def check_message_rate_limit(email: str) -> Optional[str]:
+    """
+    Records a verification email for the given address if the daily message
+    limits allow it.
+
+    Applies the DailyMessageLimit settings: at most `limit` messages within
+    `reset_time`, and at least `expiration_time` between two messages.
+
+    Args:
+        email (str): The email address the message is sent to.
+
+    Returns:
+        Optional[str]: A message explaining when to try again, or None if the
+        message may be sent.
+    """
+    limit_obj = DailyMessage.get_limit_info()
+
+    result = message_rate_limiter.hit(
+        email,
+        limit=limit_obj.limit,
+        window=limit_obj.reset_time.total_seconds(),
+        cooldown=limit_obj.expiration_time.total_seconds()
+    )
+
+    if result.allowed:
+        return None
+
+    remaining_time = DailyMessage.format_remaining_time(result.retry_after)
+
+    if result.reason == "limit":
+        return (
+            "You have reached your daily message limit. "
+            f"Please try again in {remaining_time} minutes."
+        )
+
+    return f"Please, try again in {remaining_time} seconds."
+
+
+def send_verification_code(email: str) -> None:
+    """
+    Generates a verification code, stores it once and queues the email
+    that delivers it.
+
+    Storing the code replaces any code previously sent to the address, so
+    nothing has to be deleted beforehand, and the task only sends. The
+    email is rendered in the language active for the current request.
+
+    The task is given the mail ticket the store returned instead of the
+    code, so the plain code is never written to the broker or the outbox
+    table.
+
+    The task goes through the outbox, so it is only published once the
+    current transaction commits. That transaction only covers the code
+    when VERIFICATION_CODE_BACKEND is "database"; the Redis store writes
+    the code and its ticket straight away. If the transaction rolls back,
+    they are left behind unused and expire after VERIFICATION_CODE_TTL.
+
+    Args:
+        email (str): The email address the code is sent to.
+    """
+    with transaction.atomic():
+        _, ticket = create_verification_code(email)
+        enqueue_task(
+            "users.tasks.send_verification_email",
+            args=[email, ticket, get_language()]
+        )
+    logger.info(f"Verification email queued for {email}.")
+
+
 def reset_password_send_code(email: str) -> Dict[str, Any]:
     """
     Sends a verification code to the given email for password reset.
@@ -25,38 +101,13 @@ def reset_password_send_code(email: str) -> Dict[str, Any]:
     """
     logger.info(f"Starting password reset process for email: {email}")
     
-    # Get daily message limit
-    limit_obj = DailyMessage.get_limit_info()
-    reset_time = limit_obj.reset_time
-
     # Daily limit check
-    limit_message = DailyMessage.check_daily_limit(
-        email, 
-        limit_obj.limit, 
-        reset_time
-    )
+    limit_message = check_message_rate_limit(email)
 
     if limit_message:
         logger.warning(f"Daily limit reached for email: {email}")
         return {"email": email, "message": limit_message}
 
-    verification_code = generate_verification_code()
-    logger.debug(
-        f"Generated verification code: {verification_code} for email: {email}"
-    )
-    
-    VerificationCode.objects.create(
-        email=email, 
-        verification_code=verification_code
-    )
-    logger.info(
-        f"Verification code for {email} has been saved to the database."
-    )
-    
-    send_verification_email.delay(email)
-    logger.info(f"Verification email sent to {email}.")
-
-    # Add the new message to the database
-    DailyMessage.objects.create(email=email)
+    send_verification_code(email)
     
-    return {"email": email, "message": "Verification code sent."}
\ No newline at end of file
+    return {"email": email, "message": "Verification code sent."}
@@ -0,0 +1,285 @@
+import hmac
+import hashlib
+import logging
+import secrets
+from datetime import timedelta
+from typing import Optional
+from django.conf import settings
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from users.models import VerificationCode
+
+__all__ = [
+    "VerificationCodeUnavailable",
+    "RedisVerificationCodeStore",
+    "DatabaseVerificationCodeStore",
+    "get_verification_code_store",
+    "read_mail_ticket",
+    "delete_mail_ticket",
+]
+
+logger = logging.getLogger(__name__)
+
+VERIFICATION_CODE_TTL: int = getattr(settings, "VERIFICATION_CODE_TTL", 180)
+
+
+class VerificationCodeUnavailable(Exception):
+    """
+    Raised when a verification code cannot be stored because the store
+    is unreachable.
+    """
+
+
+class RedisVerificationCodeStore:
+    """
+    Stores verification codes as Redis keys that expire on their own.
+
+    Codes are validated without being stored in plain text: each one is
+    kept as a key named after an HMAC of the email and code. Validating a
+    code is then a single DEL, which atomically checks and consumes it, so
+    a code can only ever be used once even under concurrent requests.
+
+    Until it is emailed, the plain code is also kept under a random mail
+    ticket, so the task that sends it only carries the ticket.
+    """
+
+    CODE_KEY = "verification:code:{}"
+    CURRENT_KEY = "verification:current:{}"
+    MAIL_TICKET_KEY = "verification:mail:{}"
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    @staticmethod
+    def hash_code(email: str, code: str) -> str:
+        """
+        Returns the keyed hash under which a code is stored.
+        """
+        return hmac.new(
+            settings.SECRET_KEY.encode(),
+            f"{email}:{code}".encode(),
+            hashlib.sha256
+        ).hexdigest()
+
+    def save(self, email: str, code: str) -> str:
+        """
+        Stores a new code for the email, invalidating the previous one.
+
+        Args:
+            email (str): The email address the code was sent to.
+            code (str): The verification code.
+
+        Returns:
+            str: The mail ticket the code can be read back with until it expires.
+
+        Raises:
+            VerificationCodeUnavailable: If Redis cannot be reached.
+        """
+        code_hash = self.hash_code(email, code)
+        current_key = self.CURRENT_KEY.format(email)
+        ticket = secrets.token_urlsafe(16)
+
+        try:
+            previous_hash = self.redis.getset(current_key, code_hash)
+            pipe = self.redis.pipeline()
+            if previous_hash:
+                pipe.delete(self.CODE_KEY.format(previous_hash.decode()))
+            pipe.set(self.CODE_KEY.format(code_hash), email, ex=VERIFICATION_CODE_TTL)
+            pipe.expire(current_key, VERIFICATION_CODE_TTL)
+            pipe.set(self.MAIL_TICKET_KEY.format(ticket), code, ex=VERIFICATION_CODE_TTL)
+            pipe.execute()
+        except RedisError as e:
+            logger.error(f"Could not store verification code for email: {email}: {e}")
+            raise VerificationCodeUnavailable("Verification codes are temporarily unavailable.") from e
+        return ticket
+
+    def exists(self, email: str, code: str) -> bool:
+        """
+        Checks a code without consuming it.
+
+        Args:
+            email (str): The email address the code was sent to.
+            code (str): The verification code entered by the user.
+
+        Returns:
+            bool: True if the code is valid and unexpired.
+        """
+        try:
+            return self.redis.exists(self.CODE_KEY.format(self.hash_code(email, code))) == 1
+        except RedisError as e:
+            logger.error(f"Could not check verification code for email: {email}: {e}")
+            return False
+
+    def consume(self, email: str, code: str) -> bool:
+        """
+        Atomically checks a code and removes it so it cannot be reused.
+
+        Args:
+            email (str): The email address the code was sent to.
+            code (str): The verification code entered by the user.
+
+        Returns:
+            bool: True if the code was valid and unexpired.
+        """
+        try:
+            return self.redis.delete(self.CODE_KEY.format(self.hash_code(email, code))) == 1
+        except RedisError as e:
+            logger.error(f"Could not check verification code for email: {email}: {e}")
+            return False
+
+    def delete(self, email: str) -> None:
+        """
+        Removes the current code of an email, if any.
+
+        Raises:
+            VerificationCodeUnavailable: If Redis cannot be reached.
+        """
+        try:
+            previous_hash = self.redis.getdel(self.CURRENT_KEY.format(email))
+            if previous_hash:
+                self.redis.delete(self.CODE_KEY.format(previous_hash.decode()))
+        except RedisError as e:
+            logger.error(f"Could not delete verification code for email: {email}: {e}")
+            raise VerificationCodeUnavailable("Verification codes are temporarily unavailable.") from e
+
+    def read_ticket(self, ticket: str) -> Optional[str]:
+        """
+        Returns the code kept under a mail ticket, or None once it has expired.
+        """
+        code = self.redis.get(self.MAIL_TICKET_KEY.format(ticket))
+        return code.decode() if code is not None else None
+
+    def delete_ticket(self, ticket: str) -> None:
+        """
+        Removes a mail ticket once its code has been sent.
+        """
+        try:
+            self.redis.delete(self.MAIL_TICKET_KEY.format(ticket))
+        except RedisError as e:
+            logger.warning(f"Could not delete verification mail ticket: {e}")
+
+
+class DatabaseVerificationCodeStore:
+    """
+    Stores verification codes in the VerificationCode table.
+
+    Kept as a fallback for deployments without Redis. Codes are consumed
+    with a single conditional UPDATE, so they can only be used once. The
+    mail ticket of a code is the id of its row.
+    """
+
+    def save(self, email: str, code: str) -> str:
+        """
+        Stores a new code for the email, deleting any unverified ones.
+
+        Returns:
+            str: The mail ticket the code can be read back with until it expires.
+        """
+        deleted_count, _ = VerificationCode.objects.filter(
+            email=email,
+            is_verified=False
+        ).delete()
+        logger.info(
+            f"Deleted {deleted_count} existing verification code(s) for email: {email}."
+        )
+
+        verification_code = VerificationCode.objects.create(
+            email=email,
+            verification_code=code,
+            is_verified=False
+        )
+        return str(verification_code.pk)
+
+    def exists(self, email: str, code: str) -> bool:
+        """
+        Checks an unexpired, unverified code without consuming it.
+
+        Returns:
+            bool: True if the code is valid and unexpired.
+        """
+        return VerificationCode.objects.filter(
+            email=email,
+            verification_code=code,
+            is_verified=False,
+            created_at__gt=now() - timedelta(seconds=VERIFICATION_CODE_TTL)
+        ).exists()
+
+    def consume(self, email: str, code: str) -> bool:
+        """
+        Marks an unexpired, unverified code as verified.
+
+        Returns:
+            bool: True if the code was valid and unexpired.
+        """
+        updated = VerificationCode.objects.filter(
+            email=email,
+            verification_code=code,
+            is_verified=False,
+            created_at__gt=now() - timedelta(seconds=VERIFICATION_CODE_TTL)
+        ).update(is_verified=True)
+        return updated > 0
+
+    def delete(self, email: str) -> None:
+        """
+        Removes every code of an email.
+        """
+        VerificationCode.objects.filter(email=email).delete()
+
+    def read_ticket(self, ticket: str) -> Optional[str]:
+        """
+        Returns the code of the row a mail ticket names, or None once it
+        has expired, been used or been replaced.
+        """
+        if not ticket.isdigit():
+            return None
+        return VerificationCode.objects.filter(
+            pk=int(ticket),
+            is_verified=False,
+            created_at__gt=now() - timedelta(seconds=VERIFICATION_CODE_TTL)
+        ).values_list("verification_code", flat=True).first()
+
+    def delete_ticket(self, ticket: str) -> None:
+        """
+        Does nothing, as the row is still needed to validate the code.
+        """
+
+
+VERIFICATION_CODE_STORES = {
+    "redis": RedisVerificationCodeStore,
+    "database": DatabaseVerificationCodeStore,
+}
+
+
+def get_verification_code_store():
+    """
+    Returns the verification code store selected by VERIFICATION_CODE_BACKEND.
+
+    Returns:
+        RedisVerificationCodeStore | DatabaseVerificationCodeStore: The store instance.
+    """
+    backend = getattr(settings, "VERIFICATION_CODE_BACKEND", "redis")
+    return VERIFICATION_CODE_STORES[backend]()
+
+
+def read_mail_ticket(ticket: str) -> Optional[str]:
+    """
+    Returns the code kept under a mail ticket by the selected store, or
+    None once it has expired.
+
+    Args:
+        ticket (str): The mail ticket returned when the code was saved.
+
+    Returns:
+        Optional[str]: The verification code, if it can still be sent.
+    """
+    return get_verification_code_store().read_ticket(ticket)
+
+
+def delete_mail_ticket(ticket: str) -> None:
+    """
+    Removes a mail ticket from the selected store once its code has been sent.
+    """
+    get_verification_code_store().delete_ticket(ticket)
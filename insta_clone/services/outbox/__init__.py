@@ -0,0 +1 @@
+from .dispatch import *
\ No newline at end of file
@@ -0,0 +1,109 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from celery import current_app
+from django.db import transaction
+from django.utils.timezone import now
+from kombu.exceptions import OperationalError
+
+from users.models import OutboxMessage
+from utils.metrics import metrics
+from utils.task_metrics import task_metrics
+
+__all__ = [
+    "enqueue_task",
+    "relay_outbox",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(
+    task_name: str,
+    args: Sequence[Any] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    dedupe_key: Optional[str] = None
+) -> bool:
+    """
+    Writes a task to the outbox as part of the current transaction and
+    publishes it as soon as that transaction commits.
+
+    If publishing fails, for instance because the broker is down, the
+    message stays in the outbox until the relay_outbox_task picks it up.
+    Arguments must be JSON serializable.
+
+    Args:
+        task_name (str): The registered name of the task, e.g. "users.tasks.send_verification_email".
+        args (Sequence[Any]): The positional arguments of the task.
+        kwargs (Optional[Dict[str, Any]]): The keyword arguments of the task.
+        dedupe_key (Optional[str]): If a message with this key already exists, nothing is written.
+
+    Returns:
+        bool: False if the message was dropped as a duplicate.
+    """
+    fields = {"task_name": task_name, "args": list(args), "kwargs": kwargs or {}}
+
+    if dedupe_key is None:
+        message = OutboxMessage.objects.create(**fields)
+    else:
+        message, created = OutboxMessage.objects.get_or_create(dedupe_key=dedupe_key, defaults=fields)
+        if not created:
+            metrics.incr("outbox_deduplicated_total")
+            logger.info(f"Dropped duplicate outbox message {dedupe_key}.")
+            return False
+
+    metrics.incr("outbox_enqueued_total")
+    # robust: the data is committed either way, the relay task retries later.
+    transaction.on_commit(lambda: relay_outbox(ids=[message.pk]), robust=True)
+    return True
+
+
+def relay_outbox(batch_size: int = 100, ids: Optional[List[int]] = None) -> int:
+    """
+    Publishes up to `batch_size` pending outbox messages, oldest first, and
+    marks them as dispatched.
+
+    Rows are locked with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent
+    relays split the pending messages between them instead of publishing
+    any twice. A message whose publish fails stays pending, along with
+    every message after it.
+
+    Its metrics go to the shared task metrics rather than the process
+    registry, since the relays that matter, after a broker outage, run in
+    a worker whose registry is never rendered.
+
+    Args:
+        batch_size (int): The maximum number of messages to publish.
+        ids (Optional[List[int]]): Only publish these messages, if given.
+
+    Returns:
+        int: The number of messages published.
+    """
+    started = time.perf_counter()
+    dispatched = []
+
+    with transaction.atomic():
+        pending = OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+            dispatched_at__isnull=True
+        )
+        if ids is not None:
+            pending = pending.filter(pk__in=ids)
+
+        for message in pending.order_by("pk")[:batch_size]:
+            try:
+                current_app.send_task(message.task_name, args=message.args, kwargs=message.kwargs)
+            except OperationalError as e:
+                task_metrics.incr("outbox_publish_failed_total", message.task_name)
+                logger.warning(f"Could not publish outbox message {message.pk}: {e}")
+                break
+            dispatched.append(message)
+
+        if dispatched:
+            OutboxMessage.objects.filter(pk__in=[message.pk for message in dispatched]).update(dispatched_at=now())
+
+    for message in dispatched:
+        task_metrics.incr("outbox_dispatched_total", message.task_name)
+    if dispatched:
+        task_metrics.observe("outbox_relay_seconds", "", time.perf_counter() - started)
+    task_metrics.flush()
+    return len(dispatched)
@@ -0,0 +1 @@
+from .seen_stories import *
\ No newline at end of file
@@ -0,0 +1,69 @@
+import logging
+from typing import Iterable, Set
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = [
+    "mark_stories_seen",
+    "get_seen_story_ids",
+]
+
+logger = logging.getLogger(__name__)
+
+SEEN_STORIES_KEY = "stories:seen:{}"
+# A story is active for at most 24 hours, so older entries are never read.
+SEEN_STORIES_TTL: int = getattr(settings, "SEEN_STORIES_TTL", 86400)
+
+
+def mark_stories_seen(viewer_id: int, story_ids: Iterable[int]) -> None:
+    """
+    Records that a viewer has seen the given stories.
+
+    The viewer's set expires a full story lifetime after the latest view,
+    so it never outlives the stories it refers to.
+
+    Args:
+        viewer_id (int): The id of the viewer.
+        story_ids (Iterable[int]): The ids of the stories seen.
+    """
+    story_ids = list(story_ids)
+    if not story_ids:
+        return
+
+    key = SEEN_STORIES_KEY.format(viewer_id)
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        pipe.sadd(key, *story_ids)
+        pipe.expire(key, SEEN_STORIES_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not record seen stories for user {viewer_id}: {e}")
+
+
+def get_seen_story_ids(viewer_id: int, story_ids: Iterable[int]) -> Set[int]:
+    """
+    Returns which of the given stories the viewer has seen, in one round trip.
+
+    If Redis is unavailable every story is reported as unseen.
+
+    Args:
+        viewer_id (int): The id of the viewer.
+        story_ids (Iterable[int]): The ids of the stories to check.
+
+    Returns:
+        Set[int]: The ids of the stories already seen.
+    """
+    story_ids = list(story_ids)
+    if not story_ids:
+        return set()
+
+    try:
+        flags = get_redis_connection("default").smismember(
+            SEEN_STORIES_KEY.format(viewer_id), story_ids
+        )
+    except RedisError as e:
+        logger.warning(f"Could not read seen stories for user {viewer_id}: {e}")
+        return set()
+
+    return {story_id for story_id, seen in zip(story_ids, flags) if seen}
@@ -0,0 +1 @@
+from .chunked_upload import *
\ No newline at end of file
@@ -0,0 +1,189 @@
+import os
+import re
+import fcntl
+import hashlib
+import logging
+import mimetypes
+from typing import BinaryIO, Tuple
+from django.core.files.uploadedfile import UploadedFile
+
+from uploads.models import UploadSession
+from utils.metrics import metrics
+
+__all__ = [
+    "UploadConflictError",
+    "AssembledUpload",
+    "parse_content_range",
+    "write_chunk",
+    "verify_checksum",
+    "open_assembled_upload",
+    "discard_upload",
+]
+
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+# Bytes copied from the request to disk, and from disk to the hash, at a time.
+BLOCK_SIZE = 64 * 1024
+
+
+class UploadConflictError(Exception):
+    """
+    Raised when a chunk does not start at the offset the server has
+    received, or another request is writing to the same upload.
+    """
+
+
+class AssembledUpload(UploadedFile):
+    """
+    The fully received file of an upload session.
+
+    Exposing the path of the file lets form validation open it directly,
+    and lets FileSystemStorage move it into MEDIA_ROOT instead of copying.
+    """
+
+    def temporary_file_path(self) -> str:
+        """
+        Returns the path of the assembled file on disk.
+
+        Returns:
+            str: The absolute path of the file.
+        """
+        return self.file.name
+
+
+def parse_content_range(header: str) -> Tuple[int, int, int]:
+    """
+    Parses a "bytes start-end/total" Content-Range header.
+
+    Args:
+        header (str): The value of the header.
+
+    Returns:
+        tuple: The first byte, the last byte (inclusive) and the total size.
+
+    Raises:
+        ValueError: If the header is missing or malformed.
+    """
+    match = CONTENT_RANGE_RE.match(header or "")
+    if not match:
+        raise ValueError("Content-Range must be of the form 'bytes start-end/total'.")
+
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end >= total:
+        raise ValueError("Content-Range is not a valid byte range.")
+    return start, end, total
+
+
+def write_chunk(session: UploadSession, start: int, stream: BinaryIO, length: int) -> int:
+    """
+    Streams a chunk from the request body into the session's partial file.
+
+    The body is copied in small blocks, so a chunk never has to fit in
+    memory. If the client disconnects part way, the bytes already written
+    are kept and the offset moves past them, so the next chunk resumes
+    from the last byte that actually arrived.
+
+    Args:
+        session (UploadSession): The upload session.
+        start (int): The offset the chunk starts at.
+        stream (BinaryIO): The request body.
+        length (int): The number of bytes the chunk declares.
+
+    Returns:
+        int: The new offset of the session.
+
+    Raises:
+        UploadConflictError: If the chunk does not start at the received
+            offset, or another chunk is being written at the same time.
+    """
+    path = session.temp_path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+
+    with open(path, "ab+") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadConflictError("Another chunk of this upload is being written.")
+
+        # Re-read the offset under the lock, as a concurrent chunk may have moved it.
+        session.refresh_from_db(fields=["offset", "status"])
+        if session.status != UploadSession.Status.PENDING or start != session.offset:
+            raise UploadConflictError(f"Expected a chunk starting at byte {session.offset}.")
+
+        # Drop anything past the offset left by a chunk that failed to record itself.
+        f.truncate(start)
+        try:
+            while written < length:
+                block = stream.read(min(BLOCK_SIZE, length - written))
+                if not block:
+                    break
+                f.write(block)
+                written += len(block)
+        except OSError as e:
+            logger.warning(f"Upload {session.id} interrupted after {written} bytes: {e}")
+        f.flush()
+
+        UploadSession.objects.filter(pk=session.pk, offset=start).update(offset=start + written)
+
+    session.offset = start + written
+    metrics.incr("upload_bytes_received_total", written)
+    return session.offset
+
+
+def verify_checksum(session: UploadSession) -> bool:
+    """
+    Checks the received file against the size and SHA-256 checksum
+    declared when the session was created.
+
+    Args:
+        session (UploadSession): The upload session.
+
+    Returns:
+        bool: True if the file is intact, otherwise False.
+    """
+    try:
+        if os.path.getsize(session.temp_path) != session.size:
+            return False
+        digest = hashlib.sha256()
+        with open(session.temp_path, "rb") as f:
+            for block in iter(lambda: f.read(BLOCK_SIZE), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return False
+
+    return digest.hexdigest() == session.checksum
+
+
+def open_assembled_upload(session: UploadSession) -> AssembledUpload:
+    """
+    Opens the received file as an uploaded file, ready to be assigned to
+    the image or video field of a Story or Post.
+
+    Args:
+        session (UploadSession): The upload session.
+
+    Returns:
+        AssembledUpload: The uploaded file. The caller closes it.
+    """
+    content_type, _ = mimetypes.guess_type(session.filename)
+    return AssembledUpload(
+        file=open(session.temp_path, "rb"),
+        name=session.filename,
+        content_type=content_type or "application/octet-stream",
+        size=session.size
+    )
+
+
+def discard_upload(session: UploadSession) -> None:
+    """
+    Removes the partial file of an upload session, if it is still there.
+
+    Args:
+        session (UploadSession): The upload session.
+    """
+    try:
+        os.remove(session.temp_path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,2 @@
+from .user_cache import *
+from .hidden_users import *
\ No newline at end of file
@@ -0,0 +1,238 @@
+import logging
+from typing import Any, Dict, Iterable, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.db import router
+
+from utils.lru_cache import LocalLRUCache
+
+__all__ = [
+    "resolve_user",
+    "resolve_user_id",
+    "get_cached_user",
+    "get_user_summary",
+    "invalidate_user_cache",
+    "invalidate_slug_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+SLUG_KEY = "users:slug:{}"
+SUMMARY_KEY = "users:summary:{}"
+
+# Stored instead of an id for slugs that do not exist.
+MISSING = 0
+
+SUMMARY_FIELDS = (
+    "id",
+    "email",
+    "slug",
+    "first_name",
+    "last_name",
+    "bio",
+    "profile_picture",
+    "is_active",
+)
+
+USER_CACHE_TTL: int = getattr(settings, "USER_CACHE_TTL", 300)
+USER_CACHE_NEGATIVE_TTL: int = getattr(settings, "USER_CACHE_NEGATIVE_TTL", 60)
+
+local_cache = LocalLRUCache(
+    maxsize=getattr(settings, "USER_CACHE_LOCAL_SIZE", 2048),
+    ttl=getattr(settings, "USER_CACHE_LOCAL_TTL", 10),
+)
+
+
+def _cache_get(key: str) -> Any:
+    """
+    Reads a key from the process-local tier first, then from Redis.
+    """
+    value = local_cache.get(key)
+    if value is not None:
+        return value
+
+    value = cache.get(key)
+    if value is not None:
+        local_cache.set(key, value)
+    return value
+
+
+def _cache_set(key: str, value: Any, timeout: int) -> None:
+    """
+    Writes a key to both cache tiers.
+    """
+    local_cache.set(key, value, ttl=min(timeout, local_cache.ttl))
+    cache.set(key, value, timeout)
+
+
+def _cache_delete(*keys: str) -> None:
+    """
+    Removes keys from both cache tiers.
+    """
+    for key in keys:
+        local_cache.delete(key)
+    cache.delete_many(keys)
+
+
+def _store_summary(summary: Dict[str, Any]) -> None:
+    """
+    Caches both the slug -> id mapping and the id -> summary entry of a user.
+    """
+    _cache_set(SLUG_KEY.format(summary["slug"]), summary["id"], USER_CACHE_TTL)
+    _cache_set(SUMMARY_KEY.format(summary["id"]), summary, USER_CACHE_TTL)
+
+
+def _load_by_slug(slug: str) -> Optional[Dict[str, Any]]:
+    """
+    Loads a user summary by slug from the database and caches the result,
+    including a negative entry when the slug does not exist.
+    """
+    summary = User.objects.filter(slug=slug).values(*SUMMARY_FIELDS).first()
+
+    if summary is None:
+        logger.info(f"Caching unknown slug: {slug}")
+        _cache_set(SLUG_KEY.format(slug), MISSING, USER_CACHE_NEGATIVE_TTL)
+        return None
+
+    _store_summary(summary)
+    return summary
+
+
+def get_user_summary(user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached profile summary of a user, loading it on a miss.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        Optional[Dict[str, Any]]: The summary fields of the user, or None if
+        the user does not exist.
+    """
+    summary = _cache_get(SUMMARY_KEY.format(user_id))
+    if summary is not None:
+        return summary
+
+    summary = User.objects.filter(id=user_id).values(*SUMMARY_FIELDS).first()
+    if summary is not None:
+        _store_summary(summary)
+    return summary
+
+
+def _resolve_summary(slug: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolves a slug to a user summary through the slug -> id and id -> summary caches.
+    """
+    user_id = _cache_get(SLUG_KEY.format(slug))
+
+    if user_id == MISSING:
+        return None
+
+    if user_id is None:
+        return _load_by_slug(slug)
+
+    summary = get_user_summary(user_id)
+
+    # The slug may have been renamed since the mapping was cached.
+    if summary is None or summary["slug"] != slug:
+        _cache_delete(SLUG_KEY.format(slug))
+        return _load_by_slug(slug)
+
+    return summary
+
+
+def resolve_user_id(slug: str) -> Optional[int]:
+    """
+    Returns the id of the user with the given slug.
+
+    Args:
+        slug (str): The slug of the user.
+
+    Returns:
+        Optional[int]: The id of the user, or None if no user has this slug.
+    """
+    summary = _resolve_summary(slug)
+    return summary["id"] if summary else None
+
+
+def _build_user(summary: Dict[str, Any]) -> User:
+    """
+    Builds a user instance from a cached summary. Fields outside the summary
+    are deferred and loaded on first access.
+    """
+    # from_db expects the values in the model's concrete field order.
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in summary
+    ]
+    return User.from_db(
+        router.db_for_read(User),
+        field_names,
+        [summary[name] for name in field_names],
+    )
+
+
+def resolve_user(slug: str) -> Optional[User]:
+    """
+    Returns a user instance for the given slug without querying the database
+    when the summary is cached.
+
+    Fields outside the cached summary are deferred and loaded on first access.
+
+    Args:
+        slug (str): The slug of the user.
+
+    Returns:
+        Optional[User]: The user, or None if no user has this slug.
+    """
+    summary = _resolve_summary(slug)
+    if summary is None:
+        return None
+    return _build_user(summary)
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Returns a user instance for the given id without querying the database
+    when the summary is cached.
+
+    Fields outside the cached summary are deferred and loaded on first access.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        Optional[User]: The user, or None if no user has this id.
+    """
+    summary = get_user_summary(user_id)
+    if summary is None:
+        return None
+    return _build_user(summary)
+
+
+def invalidate_user_cache(user_id: int, *slugs: str) -> None:
+    """
+    Drops the cached summary of a user and the given slug mappings.
+
+    Args:
+        user_id (int): The id of the user whose summary changed.
+        *slugs (str): The slugs whose mappings should be dropped.
+    """
+    keys = [SUMMARY_KEY.format(user_id)]
+    keys.extend(SLUG_KEY.format(slug) for slug in slugs if slug)
+    _cache_delete(*keys)
+
+
+def invalidate_slug_cache(slugs: Iterable[str]) -> None:
+    """
+    Drops the cached mappings of many slugs at once, e.g. the negative
+    entries of slugs given to users inserted without post_save.
+
+    Args:
+        slugs (Iterable[str]): The slugs whose mappings should be dropped.
+    """
+    _cache_delete(*(SLUG_KEY.format(slug) for slug in slugs if slug))
@@ -1 +1,2 @@
-from .story_admin import StoryAdmin
\ No newline at end of file
+from .story_admin import StoryAdmin
+from .highlight_admin import StoryHighlightAdmin
\ No newline at end of file
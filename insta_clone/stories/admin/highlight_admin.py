@@ -0,0 +1,31 @@
+from django.contrib import admin
+from ..models import StoryHighlight
+from typing import Any
+
+
+@admin.register(StoryHighlight)
+class StoryHighlightAdmin(admin.ModelAdmin):
+    list_display = (
+        "user", 
+        "created_at", 
+        "archived_at"
+    )
+    search_fields = (
+        "user__email",
+    )
+    list_filter = (
+        "created_at",
+    )
+
+    def get_queryset(self, request: Any) -> "QuerySet":
+        """
+        Return the queryset of StoryHighlight objects with related user data.
+
+        Args:
+            request (Any): The request object passed by the Django admin.
+
+        Returns:
+            QuerySet: The optimized queryset with related user data.
+        """
+        queryset = super().get_queryset(request)
+        return queryset.select_related("user")
@@ -1 +1,2 @@
-from .stories import Story
\ No newline at end of file
+from .stories import Story
+from .highlights import StoryHighlight
\ No newline at end of file
@@ -0,0 +1,52 @@
+from django.db import models
+from django.conf import settings
+
+
+class StoryHighlight(models.Model):
+    """
+    An expired story its author chose to keep on their profile.
+
+    Highlights are moved out of the Story table by the story sweeper, so
+    that table only ever holds about a day of stories while highlights are
+    kept indefinitely. The media files are carried over as they are.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="story_highlights"
+    )
+    story_id = models.BigIntegerField(
+        unique=True
+    )
+    image = models.ImageField(
+        upload_to="stories/images/",
+        blank=True,
+        null=True
+    )
+    video = models.FileField(
+        upload_to="stories/videos/",
+        blank=True,
+        null=True
+    )
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(
+        auto_now_add=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="highlight_user_created_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the highlight, 
+        including the user's id and the original story's creation time.
+
+        Returns:
+            str: A string representation of the highlight.
+        """
+        return f"Highlight of user {self.user_id} - {self.created_at}"
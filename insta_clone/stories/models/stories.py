@@ -24,6 +24,15 @@ class Story(models.Model):
         auto_now_add=True
     )
     expires_at = models.DateTimeField()
+    is_highlight = models.BooleanField(
+        default=False
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "expires_at"]),
+            models.Index(fields=["expires_at"]),
+        ]
 
     def save(self, *args, **kwargs) -> None:
         """
@@ -1 +1,3 @@
-from .story_serializers import StorySerializer
\ No newline at end of file
+from .story_serializers import StorySerializer
+from .story_tray import StoryTraySerializer, StorySeenSerializer
+from .highlights import StoryHighlightSerializer
\ No newline at end of file
@@ -0,0 +1,28 @@
+from django.utils.timezone import localtime
+from rest_framework import serializers
+from stories.models import StoryHighlight
+
+
+class StoryHighlightSerializer(serializers.ModelSerializer):
+    created_at = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StoryHighlight
+        fields = [
+            "id",
+            "image",
+            "video",
+            "created_at",
+        ]
+
+    def get_created_at(self, obj: StoryHighlight) -> str:
+        """
+        Returns the formatted creation date of the original story in local time.
+
+        Args:
+            obj (StoryHighlight): The highlight object.
+
+        Returns:
+            str: The formatted creation date.
+        """
+        return localtime(obj.created_at).strftime("%d %B %Y, %H:%M:%S")
@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.utils.timezone import localtime
+from rest_framework import serializers
+from stories.models import Story
+
+User = get_user_model()
+
+
+class TrayUserSerializer(serializers.ModelSerializer):
+    """
+    The author shown on a story tray entry.
+    """
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "email",
+            "slug",
+            "profile_picture",
+        ]
+
+
+class TrayStorySerializer(serializers.ModelSerializer):
+    """
+    A story inside a tray entry.
+
+    Expects `like_count` to be annotated on the queryset and the ids of the
+    stories the viewer has seen in the "seen_story_ids" context entry, so
+    serializing a story never queries the database.
+    """
+    like_count = serializers.IntegerField(read_only=True)
+    created_at = serializers.SerializerMethodField()
+    expires_at = serializers.SerializerMethodField()
+    seen = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Story
+        fields = [
+            "id",
+            "image",
+            "video",
+            "created_at",
+            "expires_at",
+            "like_count",
+            "seen",
+        ]
+
+    def get_created_at(self, obj: Story) -> str:
+        """
+        Returns the formatted creation date of the story in local time.
+        """
+        return localtime(obj.created_at).strftime("%d %B %Y, %H:%M:%S")
+
+    def get_expires_at(self, obj: Story) -> str:
+        """
+        Returns the formatted expiration date of the story in local time.
+        """
+        return localtime(obj.expires_at).strftime("%d %B %Y, %H:%M:%S")
+
+    def get_seen(self, obj: Story) -> bool:
+        """
+        Returns whether the viewer has already seen the story.
+        """
+        return obj.id in self.context.get("seen_story_ids", set())
+
+
+class StoryTraySerializer(serializers.Serializer):
+    """
+    The active stories of one author, oldest first, with an unseen flag
+    that is set while any of them has not been seen by the viewer.
+    """
+    user = TrayUserSerializer(read_only=True)
+    has_unseen = serializers.BooleanField(read_only=True)
+    stories = TrayStorySerializer(many=True, read_only=True)
+
+
+class StorySeenSerializer(serializers.Serializer):
+    """
+    The ids of the stories a viewer has just watched.
+    """
+    story_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=100
+    )
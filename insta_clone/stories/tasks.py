@@ -0,0 +1,110 @@
+import logging
+from celery import shared_task
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from stories.models import Story, StoryHighlight
+from services.outbox import enqueue_task
+from utils.task_metrics import task_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def sweep_expired_stories() -> str:
+    """
+    Removes expired stories from the Story table in batches of
+    STORY_SWEEP_BATCH_SIZE, each in its own short transaction.
+
+    Stories marked as highlights are moved to StoryHighlight along with
+    their media. The image and video files of the other stories are handed
+    to delete_story_media through the outbox, so they are only removed once
+    the rows are gone, and the slow storage calls run on the media queue.
+
+    Returns:
+        str: A summary of the number of stories archived and deleted.
+    """
+    batch_size = getattr(settings, "STORY_SWEEP_BATCH_SIZE", 500)
+    cutoff = timezone.now()
+    archived = 0
+    total = 0
+
+    while True:
+        with transaction.atomic():
+            batch = list(
+                Story.objects.select_for_update(skip_locked=True)
+                .filter(expires_at__lt=cutoff)
+                .order_by("pk")[:batch_size]
+            )
+            if not batch:
+                break
+
+            highlights = [story for story in batch if story.is_highlight]
+            StoryHighlight.objects.bulk_create(
+                [
+                    StoryHighlight(
+                        user_id=story.user_id,
+                        story_id=story.pk,
+                        image=story.image.name,
+                        video=story.video.name,
+                        created_at=story.created_at,
+                    )
+                    for story in highlights
+                ],
+                ignore_conflicts=True
+            )
+
+            Story.objects.filter(pk__in=[story.pk for story in batch]).delete()
+
+            files = [
+                field.name
+                for story in batch if not story.is_highlight
+                for field in (story.image, story.video) if field
+            ]
+            if files:
+                enqueue_task("stories.tasks.delete_story_media", args=[files])
+
+        archived += len(highlights)
+        total += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    task_metrics.incr("stories_swept_total", sweep_expired_stories.name, total)
+    task_metrics.incr("stories_archived_total", sweep_expired_stories.name, archived)
+    logger.info(f"Swept {total} expired stories, {archived} kept as highlights.")
+    return f"Archived {archived} and deleted {total - archived} expired stories"
+
+
+@shared_task(ignore_result=True)
+def delete_story_media(names: list) -> str:
+    """
+    Deletes story media files from storage and reports the space reclaimed
+    in the shared task metrics, as story_media_bytes_reclaimed_total.
+
+    Files that are already gone are skipped, so a retried task does not fail.
+
+    Args:
+        names (list): The storage names of the files.
+
+    Returns:
+        str: A summary of the number of files and bytes reclaimed.
+    """
+    deleted = 0
+    reclaimed = 0
+
+    for name in names:
+        try:
+            size = default_storage.size(name)
+            default_storage.delete(name)
+        except OSError as e:
+            logger.warning(f"Could not delete story media {name}: {e}")
+            continue
+        deleted += 1
+        reclaimed += size
+
+    task_metrics.incr("story_media_deleted_total", delete_story_media.name, deleted)
+    task_metrics.incr("story_media_bytes_reclaimed_total", delete_story_media.name, reclaimed)
+    logger.info(f"Deleted {deleted} story media files, reclaimed {reclaimed} bytes.")
+    return f"Deleted {deleted} files, reclaimed {reclaimed} bytes"
@@ -0,0 +1,92 @@
+import pytest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from typing import Any
+
+from stories.models import Story, StoryHighlight
+from stories.tasks import sweep_expired_stories, delete_story_media
+from users.models import OutboxMessage
+from utils.task_metrics import task_metrics
+
+User = get_user_model()
+
+
+@pytest.fixture
+def media_root(settings, tmp_path) -> Any:
+    """Store uploaded media in a temporary directory.
+
+    Returns:
+        Path: The temporary media root.
+    """
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def author() -> Any:
+    """Create the author of the stories.
+
+    Returns:
+        user: The created test user.
+    """
+    return User.objects.create_user(email="author@example.com", password="password123")
+
+def create_story(author: Any, expired: bool, name: str, is_highlight: bool = False) -> Story:
+    """Create a story with a small image file."""
+    story = Story(
+        user=author,
+        expires_at=timezone.now() + (timedelta(hours=-1) if expired else timedelta(hours=1)),
+        is_highlight=is_highlight
+    )
+    story.image.save(name, ContentFile(b"x" * 100), save=False)
+    story.save()
+    return story
+
+@pytest.mark.django_db
+def test_sweep_deletes_expired_stories_in_batches(settings, media_root: Any, author: Any) -> None:
+    """Test that only expired stories are deleted and their files queued for removal per batch."""
+    settings.STORY_SWEEP_BATCH_SIZE = 2
+    for i in range(5):
+        create_story(author, expired=True, name=f"old{i}.jpg")
+    active = create_story(author, expired=False, name="new.jpg")
+
+    assert sweep_expired_stories() == "Archived 0 and deleted 5 expired stories"
+    assert list(Story.objects.values_list("pk", flat=True)) == [active.pk]
+
+    messages = list(OutboxMessage.objects.filter(task_name="stories.tasks.delete_story_media"))
+    assert [len(message.args[0]) for message in messages] == [2, 2, 1]
+
+@pytest.mark.django_db
+def test_sweep_moves_highlights(media_root: Any, author: Any) -> None:
+    """Test that expired highlights are moved to the archive table with their media kept."""
+    highlight = create_story(author, expired=True, name="keep.jpg", is_highlight=True)
+    dropped = create_story(author, expired=True, name="drop.jpg")
+
+    assert sweep_expired_stories() == "Archived 1 and deleted 1 expired stories"
+    assert not Story.objects.exists()
+
+    archived = StoryHighlight.objects.get()
+    assert archived.story_id == highlight.pk
+    assert archived.image.name == highlight.image.name
+    assert archived.created_at == highlight.created_at
+
+    message = OutboxMessage.objects.get(task_name="stories.tasks.delete_story_media")
+    assert message.args == [[dropped.image.name]]
+
+@pytest.mark.django_db
+def test_delete_story_media_reports_bytes(media_root: Any, author: Any) -> None:
+    """Test that media files are removed and the reclaimed bytes reported, skipping missing files."""
+    story = create_story(author, expired=True, name="old.jpg")
+    path = media_root / story.image.name
+    assert path.exists()
+
+    task_metrics.clear()
+
+    result = delete_story_media([story.image.name, "stories/images/missing.jpg"])
+
+    assert result == "Deleted 1 files, reclaimed 100 bytes"
+    assert not path.exists()
+    task_metrics.flush(force=True)
+    assert task_metrics.get("story_media_bytes_reclaimed_total", "stories.tasks.delete_story_media") == 100
+    assert task_metrics.get("story_media_deleted_total", "stories.tasks.delete_story_media") == 1
@@ -0,0 +1,143 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from datetime import timedelta
+from django.utils import timezone
+from typing import Any
+
+from stories.models import Story, StoryHighlight
+from users.models import Block, OutboxMessage
+
+User = get_user_model()
+
+
+@pytest.fixture
+def author() -> Any:
+    """Create the user whose highlights are listed.
+
+    Returns:
+        author: The created test user.
+    """
+    return User.objects.create_user(
+        email="author@example.com",
+        password="password123",
+        first_name="Highlight",
+        last_name="Author"
+    )
+
+@pytest.fixture
+def viewer() -> Any:
+    """Create the user reading the highlights.
+
+    Returns:
+        viewer: The created test user.
+    """
+    return User.objects.create_user(email="viewer@example.com", password="password123")
+
+@pytest.fixture
+def api_client(viewer: Any) -> APIClient:
+    """Create an APIClient authenticated as the viewer.
+
+    Returns:
+        APIClient: The created APIClient instance.
+    """
+    client = APIClient()
+    client.force_authenticate(user=viewer)
+    return client
+
+@pytest.mark.django_db
+def test_toggle_highlight(author: Any) -> None:
+    """Test that only the author can mark an active story as a highlight."""
+    story = Story.objects.create(user=author, image="stories/images/dummy.jpg")
+    client = APIClient()
+    client.force_authenticate(user=author)
+
+    response = client.post(f"/api/v1/stories/{story.id}/highlight/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"is_highlight": True}
+
+    response = client.post(f"/api/v1/stories/{story.id}/highlight/")
+    assert response.data == {"is_highlight": False}
+
+@pytest.mark.django_db
+def test_toggle_highlight_other_users_story(api_client: APIClient, author: Any) -> None:
+    """Test that a story of another user cannot be marked as a highlight."""
+    story = Story.objects.create(user=author, image="stories/images/dummy.jpg")
+
+    response = api_client.post(f"/api/v1/stories/{story.id}/highlight/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_toggle_highlight_expired_story(author: Any) -> None:
+    """Test that a story past its expiry, about to be swept, cannot be toggled."""
+    story = Story.objects.create(user=author, image="stories/images/dummy.jpg")
+    Story.objects.filter(pk=story.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+    client = APIClient()
+    client.force_authenticate(user=author)
+
+    response = client.post(f"/api/v1/stories/{story.id}/highlight/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not Story.objects.get().is_highlight
+
+@pytest.mark.django_db
+def test_delete_archived_highlight(api_client: APIClient, author: Any) -> None:
+    """Test that only the author can remove an archived highlight, and its media is queued for deletion."""
+    highlight = StoryHighlight.objects.create(
+        user=author,
+        story_id=1,
+        image="stories/images/1.jpg",
+        created_at=timezone.now()
+    )
+
+    response = api_client.delete(f"/api/v1/stories/highlights/{highlight.id}/")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    client = APIClient()
+    client.force_authenticate(user=author)
+    response = client.delete(f"/api/v1/stories/highlights/{highlight.id}/")
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not StoryHighlight.objects.exists()
+    message = OutboxMessage.objects.get(task_name="stories.tasks.delete_story_media")
+    assert message.args == [["stories/images/1.jpg"]]
+
+@pytest.mark.django_db
+def test_list_highlights_paginated(api_client: APIClient, author: Any) -> None:
+    """Test that highlights are listed newest first, one cursor page at a time."""
+    now = timezone.now()
+    StoryHighlight.objects.bulk_create([
+        StoryHighlight(
+            user=author,
+            story_id=i,
+            image=f"stories/images/{i}.jpg",
+            created_at=now - timedelta(days=i)
+        )
+        for i in range(1, 6)
+    ])
+
+    response = api_client.get(f"/api/v1/users/{author.slug}/highlights/?limit=2")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["image"].rsplit("/", 1)[-1] for item in response.data["results"]] == ["1.jpg", "2.jpg"]
+
+    next_page = api_client.get(response.data["next"])
+    assert [item["image"].rsplit("/", 1)[-1] for item in next_page.data["results"]] == ["3.jpg", "4.jpg"]
+
+@pytest.mark.django_db
+def test_list_highlights_hidden_from_blocked_users(api_client: APIClient, author: Any, viewer: Any) -> None:
+    """Test that a user who blocked the viewer does not expose their highlights."""
+    Block.toggle_block(author, viewer)
+
+    response = api_client.get(f"/api/v1/users/{author.slug}/highlights/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_list_highlights_unknown_user(api_client: APIClient) -> None:
+    """Test that an unknown slug returns 404."""
+    response = api_client.get("/api/v1/users/nobody/highlights/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
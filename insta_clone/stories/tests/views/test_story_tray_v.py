@@ -0,0 +1,114 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_redis import get_redis_connection
+from datetime import timedelta
+from django.utils import timezone
+from typing import Any, List
+
+from likes.models import StoryLike
+from stories.models import Story
+from users.models import Follow
+
+User = get_user_model()
+
+
+@pytest.fixture
+def viewer() -> Any:
+    """Create the user whose tray is requested, with no seen stories.
+
+    Returns:
+        viewer: The created test user.
+    """
+    user = User.objects.create_user(email="viewer@example.com", password="password123")
+    get_redis_connection("default").delete(f"stories:seen:{user.id}")
+    return user
+
+@pytest.fixture
+def api_client(viewer: Any) -> APIClient:
+    """Create an APIClient authenticated as the viewer.
+
+    Returns:
+        APIClient: The created APIClient instance.
+    """
+    client = APIClient()
+    client.force_authenticate(user=viewer)
+    return client
+
+def create_authors(viewer: Any, count: int, stories_per_author: int = 2, prefix: str = "author") -> List[Any]:
+    """Create followed authors, each with a few active stories that have a like.
+
+    Returns:
+        list: The created authors.
+    """
+    authors = []
+    for i in range(count):
+        author = User.objects.create_user(email=f"{prefix}{i}@example.com", password="password123")
+        Follow.objects.create(follower=viewer, followed=author)
+        for _ in range(stories_per_author):
+            story = Story.objects.create(user=author, image="stories/images/dummy.jpg")
+            StoryLike.objects.create(user=viewer, story=story)
+        authors.append(author)
+    return authors
+
+@pytest.mark.django_db
+def test_tray_grouped_per_author(api_client: APIClient, viewer: Any) -> None:
+    """Test that stories are grouped per author, newest author first, oldest story first."""
+    first, second = create_authors(viewer, 2)
+    Story.objects.create(user=first, image="stories/images/dummy.jpg")
+    Story.objects.create(
+        user=second,
+        image="stories/images/dummy.jpg",
+        expires_at=timezone.now() - timedelta(minutes=1)
+    )
+
+    response = api_client.get("/api/v1/stories/tray/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [tray["user"]["email"] for tray in response.data] == [first.email, second.email]
+    assert len(response.data[0]["stories"]) == 3
+    assert len(response.data[1]["stories"]) == 2
+
+    story_ids = [story["id"] for story in response.data[0]["stories"]]
+    assert story_ids == sorted(story_ids)
+    assert response.data[0]["stories"][0]["like_count"] == 1
+
+@pytest.mark.django_db
+def test_tray_unseen_flag(api_client: APIClient, viewer: Any) -> None:
+    """Test that an author stays unseen until every one of their stories is seen."""
+    create_authors(viewer, 1)
+    story_ids = [story["id"] for story in api_client.get("/api/v1/stories/tray/").data[0]["stories"]]
+
+    api_client.post("/api/v1/stories/seen/", {"story_ids": story_ids[:1]}, format="json")
+    tray = api_client.get("/api/v1/stories/tray/").data[0]
+    assert tray["has_unseen"]
+    assert [story["seen"] for story in tray["stories"]] == [True, False]
+
+    response = api_client.post("/api/v1/stories/seen/", {"story_ids": story_ids}, format="json")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not api_client.get("/api/v1/stories/tray/").data[0]["has_unseen"]
+
+@pytest.mark.django_db
+def test_tray_query_count_constant(api_client: APIClient, viewer: Any) -> None:
+    """Test that the number of queries does not grow with the size of the tray."""
+    create_authors(viewer, 1)
+    api_client.get("/api/v1/stories/tray/")
+    with CaptureQueriesContext(connection) as small:
+        api_client.get("/api/v1/stories/tray/")
+
+    create_authors(viewer, 5, stories_per_author=3, prefix="more")
+    with CaptureQueriesContext(connection) as large:
+        response = api_client.get("/api/v1/stories/tray/")
+
+    assert len(response.data) == 6
+    assert len(large.captured_queries) == len(small.captured_queries)
+
+@pytest.mark.django_db
+def test_seen_requires_story_ids(api_client: APIClient) -> None:
+    """Test that marking stories as seen without ids is rejected."""
+    response = api_client.post("/api/v1/stories/seen/", {"story_ids": []}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
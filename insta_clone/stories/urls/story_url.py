@@ -13,4 +13,29 @@ urlpatterns = [
         ActiveStoriesAPIView.as_view(), 
         name="active-stories"
     ),
+    path(
+        "stories/tray/", 
+        StoryTrayAPIView.as_view(), 
+        name="story-tray"
+    ),
+    path(
+        "stories/seen/", 
+        StorySeenAPIView.as_view(), 
+        name="story-seen"
+    ),
+    path(
+        "stories/<int:id>/highlight/", 
+        StoryHighlightToggleAPIView.as_view(), 
+        name="story-highlight-toggle"
+    ),
+    path(
+        "stories/highlights/<int:id>/", 
+        StoryHighlightAPIView.as_view(), 
+        name="story-highlight"
+    ),
+    path(
+        "users/<slug:username>/highlights/", 
+        UserHighlightsAPIView.as_view(), 
+        name="user-highlights"
+    ),
 ]
@@ -1 +1,2 @@
-from .story_views import *
\ No newline at end of file
+from .story_views import *
+from .highlight_views import *
\ No newline at end of file
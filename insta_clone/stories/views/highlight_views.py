@@ -0,0 +1,142 @@
+import logging
+from django.db import transaction
+from django.db.models import F
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework.views import APIView, Response, status
+from rest_framework.pagination import CursorPagination
+from rest_framework import permissions
+from drf_yasg.utils import swagger_auto_schema
+from stories.models import Story, StoryHighlight
+from stories.serializers import StoryHighlightSerializer
+from services.users import resolve_user_id, get_hidden_user_ids
+from services.outbox import enqueue_task
+
+__all__ = [
+    "StoryHighlightToggleAPIView",
+    "StoryHighlightAPIView",
+    "UserHighlightsAPIView",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class HighlightPagination(CursorPagination):
+    """
+    Pages through highlights newest first with a keyset cursor, so every
+    page is one range scan of the per-user index however deep it is.
+    """
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
+class StoryHighlightToggleAPIView(APIView):
+    """
+    API view to toggle whether an active story is kept as a highlight
+    once it expires. Only the author of the story may change it.
+
+    The flag is flipped with a single conditional UPDATE, so a story the
+    sweeper deletes in the meantime is reported as not found.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Toggle keeping a story as a profile highlight.",
+        responses={status.HTTP_200_OK: "Highlight toggled", status.HTTP_404_NOT_FOUND: "Story not found"}
+    )
+    def post(self, request, id: int, *args, **kwargs) -> Response:
+        """
+        Toggle the highlight flag of one of the current user's active stories.
+
+        Args:
+            request: The HTTP request.
+            id: The ID of the story.
+
+        Returns:
+            Response: A response containing the new highlight state.
+        """
+        stories = Story.objects.filter(id=id, user=request.user, expires_at__gte=timezone.now())
+        if not stories.update(is_highlight=~F("is_highlight")):
+            return Response({"error": "Story not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        is_highlight = stories.values_list("is_highlight", flat=True).first()
+        if is_highlight is None:
+            # Swept right after the update, as it expired in between.
+            return Response({"error": "Story not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        logger.info(f"User {request.user.id} set highlight of story {id} to {is_highlight}")
+        return Response({"is_highlight": is_highlight}, status=status.HTTP_200_OK)
+
+
+class StoryHighlightAPIView(APIView):
+    """
+    API view to remove an archived highlight from the current user's
+    profile, along with its media.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Remove an archived story highlight.",
+        responses={status.HTTP_204_NO_CONTENT: "Highlight removed", status.HTTP_404_NOT_FOUND: "Highlight not found"}
+    )
+    def delete(self, request, id: int, *args, **kwargs) -> Response:
+        """
+        Delete one of the current user's archived highlights.
+
+        The media files are removed by delete_story_media once the row is gone.
+
+        Args:
+            request: The HTTP request.
+            id: The ID of the highlight.
+
+        Returns:
+            Response: An empty response.
+        """
+        with transaction.atomic():
+            highlight = get_object_or_404(StoryHighlight, id=id, user=request.user)
+            files = [field.name for field in (highlight.image, highlight.video) if field]
+            highlight.delete()
+            if files:
+                enqueue_task("stories.tasks.delete_story_media", args=[files])
+
+        logger.info(f"User {request.user.id} removed highlight {id}")
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UserHighlightsAPIView(APIView):
+    """
+    API view to list the story highlights of a user, newest first.
+    Requires user authentication.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Retrieve a user's story highlights.",
+        responses={status.HTTP_200_OK: StoryHighlightSerializer(many=True)}
+    )
+    def get(self, request, username: str, *args, **kwargs) -> Response:
+        """
+        Retrieve a page of the highlights of the user with the given slug.
+
+        Args:
+            request: The HTTP request, with optional "cursor" and "limit" query parameters.
+            username: The username (slug) of the user.
+
+        Returns:
+            Response: A response containing a page of highlights and the next and previous cursors.
+        """
+        user_id = resolve_user_id(username)
+
+        if user_id is None or user_id in get_hidden_user_ids(request.user.id, include_muted=False):
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        paginator = HighlightPagination()
+        page = paginator.paginate_queryset(
+            StoryHighlight.objects.filter(user_id=user_id),
+            request,
+            view=self
+        )
+        serializer = StoryHighlightSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -5,12 +5,17 @@ from rest_framework import permissions
 from drf_yasg.utils import swagger_auto_schema
 from stories.models import Story
 from users.models import Follow
-from stories.serializers import StorySerializer
+from stories.serializers import StorySerializer, StoryTraySerializer, StorySeenSerializer
+from services.users import exclude_hidden_users
+from services.stories import get_seen_story_ids, mark_stories_seen
+from django.db.models import Count
 from django.utils import timezone
 
 __all__ = [
     "StoryCreateAPIView",
-    "ActiveStoriesAPIView"
+    "ActiveStoriesAPIView",
+    "StoryTrayAPIView",
+    "StorySeenAPIView",
 ]
 
 logger = logging.getLogger(__name__)
@@ -85,5 +90,107 @@ class ActiveStoriesAPIView(APIView):
             user__in=followed_users, 
             expires_at__gte=timezone.now()
         )
+        # Drop stories of blocked and muted users in the same query
+        active_stories = exclude_hidden_users(active_stories, user.id)
+
         serializer = StorySerializer(active_stories, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class StoryTrayAPIView(APIView):
+    """
+    API view to retrieve the story tray: the active stories of followed
+    users grouped per author, authors with the newest story first.
+    Requires user authentication.
+
+    The whole tray is loaded in one query, with the author joined and like
+    counts annotated, and the seen flags are read from Redis in one round
+    trip, whatever the number of authors and stories.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Retrieve active stories of followed users, grouped per author.",
+        responses={status.HTTP_200_OK: StoryTraySerializer(many=True)}
+    )
+    def get(self, request, *args, **kwargs) -> Response:
+        """
+        Retrieve the story tray of the current user.
+
+        Args:
+            request: The HTTP request.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: A response containing one entry per author.
+        """
+        user = request.user
+
+        followed_users = Follow.objects.filter(
+            follower=user).values_list("followed", flat=True)
+
+        active_stories = Story.objects.filter(
+            user__in=followed_users,
+            expires_at__gte=timezone.now()
+        ).select_related("user").annotate(
+            like_count=Count("likes")
+        ).order_by("user_id", "created_at")
+        active_stories = exclude_hidden_users(active_stories, user.id)
+
+        trays = {}
+        for story in active_stories:
+            tray = trays.setdefault(story.user_id, {"user": story.user, "stories": []})
+            tray["stories"].append(story)
+
+        seen_story_ids = get_seen_story_ids(
+            user.id,
+            [story.id for tray in trays.values() for story in tray["stories"]]
+        )
+        for tray in trays.values():
+            tray["has_unseen"] = any(story.id not in seen_story_ids for story in tray["stories"])
+
+        ordered = sorted(
+            trays.values(),
+            key=lambda tray: tray["stories"][-1].created_at,
+            reverse=True
+        )
+
+        serializer = StoryTraySerializer(
+            ordered,
+            many=True,
+            context={"seen_story_ids": seen_story_ids}
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class StorySeenAPIView(APIView):
+    """
+    API view to mark stories as seen by the current user.
+    Requires user authentication.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Mark stories as seen.",
+        request_body=StorySeenSerializer,
+        responses={status.HTTP_204_NO_CONTENT: "Stories marked as seen"}
+    )
+    def post(self, request, *args, **kwargs) -> Response:
+        """
+        Record that the current user has watched the given stories.
+
+        Args:
+            request: The HTTP request containing the story ids.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: An empty response, or the validation errors.
+        """
+        serializer = StorySeenSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        mark_stories_seen(request.user.id, serializer.validated_data["story_ids"])
+        return Response(status=status.HTTP_204_NO_CONTENT)
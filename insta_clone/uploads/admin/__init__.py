@@ -0,0 +1 @@
+from .upload_session_admin import UploadSessionAdmin
\ No newline at end of file
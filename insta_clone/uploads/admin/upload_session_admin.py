@@ -0,0 +1,38 @@
+from django.contrib import admin
+from ..models import UploadSession
+from typing import Any
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "target",
+        "filename",
+        "offset",
+        "size",
+        "status",
+        "created_at"
+    )
+    search_fields = (
+        "user__email",
+        "filename"
+    )
+    list_filter = (
+        "target",
+        "status",
+        "created_at"
+    )
+
+    def get_queryset(self, request: Any) -> "QuerySet":
+        """
+        Return the queryset of UploadSession objects with related user data.
+
+        Args:
+            request (Any): The request object passed by the Django admin.
+
+        Returns:
+            QuerySet: The optimized queryset with related user data.
+        """
+        queryset = super().get_queryset(request)
+        return queryset.select_related("user")
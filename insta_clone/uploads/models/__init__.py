@@ -0,0 +1 @@
+from .upload_session import UploadSession
\ No newline at end of file
@@ -0,0 +1,95 @@
+import os
+import uuid
+from django.db import models
+from django.conf import settings
+
+
+class UploadSession(models.Model):
+    """
+    A resumable upload of a single story or post file.
+
+    The client declares the size and SHA-256 checksum of the file up front
+    and then sends it in byte ranges. The bytes are appended to a temporary
+    file outside the media storage, and `offset` records how many of them
+    have been received, so an interrupted upload resumes from there.
+    """
+    class Target(models.TextChoices):
+        STORY_IMAGE = "story_image", "Story image"
+        STORY_VIDEO = "story_video", "Story video"
+        POST_IMAGE = "post_image", "Post image"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        COMPLETED = "completed", "Completed"
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions"
+    )
+    target = models.CharField(
+        max_length=20,
+        choices=Target.choices
+    )
+    filename = models.CharField(
+        max_length=255
+    )
+    size = models.BigIntegerField()
+    checksum = models.CharField(
+        max_length=64
+    )
+    offset = models.BigIntegerField(
+        default=0
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"],
+                name="upload_status_created_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the upload session,
+        including its filename and progress.
+
+        Returns:
+            str: A string representation of the upload session.
+        """
+        return f"{self.filename} ({self.offset}/{self.size} bytes)"
+
+    @property
+    def temp_path(self) -> str:
+        """
+        The path of the temporary file the received bytes are written to.
+
+        Returns:
+            str: The absolute path of the partial file.
+        """
+        temp_dir = getattr(settings, "UPLOAD_TEMP_DIR", os.path.join(settings.BASE_DIR, "upload_sessions"))
+        return os.path.join(temp_dir, f"{self.id}.part")
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Checks whether every byte of the declared size has been received.
+
+        Returns:
+            bool: True if the whole file has been received, otherwise False.
+        """
+        return self.offset == self.size
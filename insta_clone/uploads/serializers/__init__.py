@@ -0,0 +1 @@
+from .upload_session import UploadSessionSerializer, UploadFinalizeSerializer
\ No newline at end of file
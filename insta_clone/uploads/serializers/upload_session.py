@@ -0,0 +1,83 @@
+from rest_framework import serializers
+from django.conf import settings
+from uploads.models import UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Creates an upload session from the declared file, and reports how
+    many of its bytes have been received so far.
+    """
+    checksum = serializers.RegexField(
+        regex=r"^[0-9a-fA-F]{64}$",
+        write_only=True,
+        error_messages={"invalid": "Checksum must be a hex encoded SHA-256 digest."}
+    )
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            "id",
+            "target",
+            "filename",
+            "size",
+            "checksum",
+            "offset",
+            "status",
+            "chunk_size",
+        ]
+        read_only_fields = [
+            "id",
+            "offset",
+            "status",
+        ]
+
+    def validate_size(self, value: int) -> int:
+        """
+        Ensures the declared size is within the upload limit.
+
+        Args:
+            value (int): The declared size of the file in bytes.
+
+        Returns:
+            int: The validated size.
+        """
+        max_size = getattr(settings, "UPLOAD_MAX_SIZE", 100 * 1024 * 1024)
+        if not 0 < value <= max_size:
+            raise serializers.ValidationError(f"Size must be between 1 and {max_size} bytes.")
+        return value
+
+    def validate_checksum(self, value: str) -> str:
+        """
+        Normalizes the checksum to lower case.
+
+        Args:
+            value (str): The declared SHA-256 checksum.
+
+        Returns:
+            str: The checksum in lower case.
+        """
+        return value.lower()
+
+    def get_chunk_size(self, obj: UploadSession) -> int:
+        """
+        Returns the largest chunk the server accepts in one request.
+
+        Args:
+            obj (UploadSession): The upload session.
+
+        Returns:
+            int: The maximum chunk size in bytes.
+        """
+        return getattr(settings, "UPLOAD_CHUNK_MAX_SIZE", 8 * 1024 * 1024)
+
+
+class UploadFinalizeSerializer(serializers.Serializer):
+    """
+    The optional details of the post created from a finished upload.
+    """
+    caption = serializers.CharField(
+        required=False,
+        allow_blank=True
+    )
@@ -0,0 +1,101 @@
+import os
+import time
+import uuid
+import logging
+from datetime import timedelta
+from celery import shared_task
+from django.conf import settings
+from django.utils.timezone import now
+
+from uploads.models import UploadSession
+from services.uploads import discard_upload
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def purge_stale_upload_sessions() -> str:
+    """
+    Deletes upload sessions created more than UPLOAD_SESSION_TTL seconds
+    ago, along with the partial files of the ones never finalized, in
+    batches of PURGE_BATCH_SIZE. Partial files older than that with no
+    session left, e.g. from a session deleted while a chunk was written,
+    are removed as well.
+
+    The worker running this task must see the same UPLOAD_TEMP_DIR as the
+    web process, which writes the files.
+
+    Returns:
+        str: A summary of the number of sessions and files purged.
+    """
+    ttl = getattr(settings, "UPLOAD_SESSION_TTL", 86400)
+    batch_size = getattr(settings, "PURGE_BATCH_SIZE", 1000)
+    stale = UploadSession.objects.filter(created_at__lt=now() - timedelta(seconds=ttl))
+    deleted = 0
+
+    while True:
+        batch = list(stale.only("id")[:batch_size])
+        if not batch:
+            break
+
+        for session in batch:
+            discard_upload(session)
+        UploadSession.objects.filter(pk__in=[session.pk for session in batch]).delete()
+
+        deleted += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    orphans = purge_orphaned_upload_files(ttl)
+
+    logger.info(f"Purged {deleted} stale upload sessions and {orphans} orphaned files.")
+    return f"Purged {deleted} upload sessions and {orphans} orphaned files"
+
+
+def purge_orphaned_upload_files(ttl: int) -> int:
+    """
+    Removes partial files in UPLOAD_TEMP_DIR not modified for `ttl` seconds
+    that no upload session refers to any more.
+
+    Args:
+        ttl (int): The age in seconds after which a file may be removed.
+
+    Returns:
+        int: The number of files removed.
+    """
+    temp_dir = getattr(settings, "UPLOAD_TEMP_DIR", os.path.join(settings.BASE_DIR, "upload_sessions"))
+    cutoff = time.time() - ttl
+    try:
+        candidates = {
+            entry.name[:-len(".part")]: entry.path
+            for entry in os.scandir(temp_dir)
+            if entry.name.endswith(".part") and entry.stat().st_mtime < cutoff
+        }
+    except FileNotFoundError:
+        return 0
+
+    live = {
+        str(session_id)
+        for session_id in UploadSession.objects.filter(
+            id__in=[name for name in candidates if _is_uuid(name)]
+        ).values_list("id", flat=True)
+    }
+
+    removed = 0
+    for name, path in candidates.items():
+        if name in live:
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,56 @@
+import os
+import time
+import pytest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from typing import Any
+
+from uploads.models import UploadSession
+from uploads.tasks import purge_stale_upload_sessions
+
+User = get_user_model()
+
+
+@pytest.fixture
+def temp_dir(settings, tmp_path) -> Any:
+    """Keep partial uploads in a temporary directory.
+
+    Returns:
+        Path: The temporary directory.
+    """
+    settings.UPLOAD_TEMP_DIR = str(tmp_path)
+    settings.UPLOAD_SESSION_TTL = 3600
+    return tmp_path
+
+def create_session(user: Any, age: timedelta) -> UploadSession:
+    """Create an upload session of the given age with a partial file."""
+    session = UploadSession.objects.create(
+        user=user,
+        target=UploadSession.Target.STORY_VIDEO,
+        filename="clip.mp4",
+        size=10,
+        checksum="0" * 64
+    )
+    UploadSession.objects.filter(pk=session.pk).update(created_at=timezone.now() - age)
+    with open(session.temp_path, "wb") as f:
+        f.write(b"x" * 5)
+    return session
+
+@pytest.mark.django_db
+def test_purge_stale_sessions_and_orphans(temp_dir: Any) -> None:
+    """Test that stale sessions, their files and old orphaned files are removed."""
+    user = User.objects.create_user(email="uploader@example.com", password="password123")
+    stale = create_session(user, timedelta(hours=2))
+    active = create_session(user, timedelta(minutes=5))
+
+    orphan = temp_dir / "00000000-0000-0000-0000-000000000000.part"
+    orphan.write_bytes(b"x")
+    old = time.time() - 7200
+    os.utime(orphan, (old, old))
+
+    assert purge_stale_upload_sessions() == "Purged 1 upload sessions and 1 orphaned files"
+    assert list(UploadSession.objects.values_list("pk", flat=True)) == [active.pk]
+    assert not os.path.exists(stale.temp_path)
+    assert os.path.exists(active.temp_path)
+    assert not orphan.exists()
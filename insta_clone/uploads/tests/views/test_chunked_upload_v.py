@@ -0,0 +1,188 @@
+import io
+import os
+import hashlib
+import pytest
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from typing import Any
+
+from posts.models import Post
+from stories.models import Story
+from uploads.models import UploadSession
+
+User = get_user_model()
+
+
+@pytest.fixture
+def upload_dirs(settings, tmp_path) -> Any:
+    """Keep media and partial uploads in temporary directories, with small chunks.
+
+    Returns:
+        Path: The temporary directory.
+    """
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    settings.UPLOAD_TEMP_DIR = str(tmp_path / "uploads")
+    settings.UPLOAD_CHUNK_MAX_SIZE = 100
+    return tmp_path
+
+@pytest.fixture
+def user() -> Any:
+    """Create the user uploading the files.
+
+    Returns:
+        user: The created test user.
+    """
+    return User.objects.create_user(email="uploader@example.com", password="password123")
+
+@pytest.fixture
+def api_client(user: Any) -> APIClient:
+    """Create an APIClient authenticated as the uploader.
+
+    Returns:
+        APIClient: The created APIClient instance.
+    """
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+@pytest.fixture
+def png() -> bytes:
+    """Create a small PNG image, larger than one chunk.
+
+    Returns:
+        bytes: The encoded image.
+    """
+    buffer = io.BytesIO()
+    Image.effect_noise((16, 16), 64).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def start_upload(client: APIClient, data: bytes, target: str, filename: str = "photo.png") -> Any:
+    """Create an upload session for the given bytes."""
+    return client.post("/api/v1/uploads/", {
+        "target": target,
+        "filename": filename,
+        "size": len(data),
+        "checksum": hashlib.sha256(data).hexdigest(),
+    }, format="json")
+
+def put_chunk(client: APIClient, session_id: str, data: bytes, start: int, end: int) -> Any:
+    """Send the bytes from start to end (inclusive) of the file."""
+    return client.put(
+        f"/api/v1/uploads/{session_id}/",
+        data=data[start:end + 1],
+        content_type="application/octet-stream",
+        HTTP_CONTENT_RANGE=f"bytes {start}-{end}/{len(data)}"
+    )
+
+def upload_all(client: APIClient, session_id: str, data: bytes) -> None:
+    """Send the whole file in chunks of at most 100 bytes."""
+    for start in range(0, len(data), 100):
+        response = put_chunk(client, session_id, data, start, min(start + 100, len(data)) - 1)
+        assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+def test_chunked_upload_creates_story(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a story image sent in chunks is verified and attached to a new story."""
+    response = start_upload(api_client, png, "story_image")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["offset"] == 0
+    assert response.data["chunk_size"] == 100
+    session_id = response.data["id"]
+
+    upload_all(api_client, session_id, png)
+    assert api_client.get(f"/api/v1/uploads/{session_id}/").data["offset"] == len(png)
+
+    response = api_client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    story = Story.objects.get()
+    with story.image.open("rb") as f:
+        assert f.read() == png
+    assert not os.listdir(upload_dirs / "uploads")
+    assert UploadSession.objects.get().status == UploadSession.Status.COMPLETED
+
+@pytest.mark.django_db
+def test_chunked_upload_creates_post(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a post image goes through the post validators and keeps its caption."""
+    session_id = start_upload(api_client, png, "post_image").data["id"]
+    upload_all(api_client, session_id, png)
+
+    response = api_client.post(f"/api/v1/uploads/{session_id}/finalize/", {"caption": "Resumed"}, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert Post.objects.get().caption == "Resumed"
+
+@pytest.mark.django_db
+def test_chunk_out_of_order_conflicts(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a chunk not starting at the received offset is rejected with that offset."""
+    session_id = start_upload(api_client, png, "story_image").data["id"]
+    put_chunk(api_client, session_id, png, 0, 99)
+
+    response = put_chunk(api_client, session_id, png, 150, 199)
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.data["offset"] == 100
+
+    response = put_chunk(api_client, session_id, png, 0, 99)
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+@pytest.mark.django_db
+def test_chunk_too_large_rejected(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a chunk above UPLOAD_CHUNK_MAX_SIZE is refused before it is read."""
+    session_id = start_upload(api_client, png, "story_image").data["id"]
+
+    response = put_chunk(api_client, session_id, png, 0, 199)
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert UploadSession.objects.get().offset == 0
+
+@pytest.mark.django_db
+def test_finalize_incomplete_upload(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that an upload cannot be finalized before every byte is received."""
+    session_id = start_upload(api_client, png, "story_image").data["id"]
+    put_chunk(api_client, session_id, png, 0, 99)
+
+    response = api_client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["offset"] == 100
+    assert not Story.objects.exists()
+
+@pytest.mark.django_db
+def test_finalize_checksum_mismatch_restarts(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a corrupted file is discarded and the upload restarts from zero."""
+    session_id = start_upload(api_client, png, "story_image").data["id"]
+    upload_all(api_client, session_id, png[:-1] + b"\x00")
+
+    response = api_client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert api_client.get(f"/api/v1/uploads/{session_id}/").data["offset"] == 0
+    assert not Story.objects.exists()
+
+@pytest.mark.django_db
+def test_upload_of_other_user_not_found(api_client: APIClient, upload_dirs: Any, png: bytes) -> None:
+    """Test that a user cannot see or write to another user's upload."""
+    session_id = start_upload(api_client, png, "story_image").data["id"]
+    other = APIClient()
+    other.force_authenticate(user=User.objects.create_user(email="other@example.com", password="password123"))
+
+    assert other.get(f"/api/v1/uploads/{session_id}/").status_code == status.HTTP_404_NOT_FOUND
+    assert put_chunk(other, session_id, png, 0, 99).status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_open_sessions_capped(api_client: APIClient, upload_dirs: Any, settings, png: bytes) -> None:
+    """Test that a user cannot open more than UPLOAD_MAX_OPEN_SESSIONS unfinished uploads."""
+    settings.UPLOAD_MAX_OPEN_SESSIONS = 2
+    first = start_upload(api_client, png, "story_image").data["id"]
+    start_upload(api_client, png, "story_image")
+
+    assert start_upload(api_client, png, "story_image").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    put_chunk(api_client, first, png, 0, 99)
+    response = api_client.delete(f"/api/v1/uploads/{first}/")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not os.listdir(upload_dirs / "uploads")
+
+    assert start_upload(api_client, png, "story_image").status_code == status.HTTP_201_CREATED
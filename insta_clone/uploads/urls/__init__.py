@@ -0,0 +1,5 @@
+from django.urls import path, include
+
+urlpatterns = [
+    path("", include("uploads.urls.upload_url"))
+]
\ No newline at end of file
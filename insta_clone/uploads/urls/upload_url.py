@@ -0,0 +1,21 @@
+from django.urls import path
+from uploads.views import *
+
+urlpatterns = [
+    # Resumable upload endpoints
+    path(
+        "uploads/", 
+        UploadSessionCreateAPIView.as_view(), 
+        name="create-upload"
+    ),
+    path(
+        "uploads/<uuid:id>/", 
+        UploadSessionAPIView.as_view(), 
+        name="upload-session"
+    ),
+    path(
+        "uploads/<uuid:id>/finalize/", 
+        UploadFinalizeAPIView.as_view(), 
+        name="finalize-upload"
+    ),
+]
@@ -0,0 +1 @@
+from .upload_views import *
\ No newline at end of file
@@ -0,0 +1,267 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from django.shortcuts import get_object_or_404
+from rest_framework.views import APIView, Response, status
+from rest_framework import permissions
+from drf_yasg.utils import swagger_auto_schema
+
+from uploads.models import UploadSession
+from uploads.serializers import UploadSessionSerializer, UploadFinalizeSerializer
+from posts.serializers import PostSerializer
+from stories.serializers import StorySerializer
+from services.uploads import (
+    UploadConflictError,
+    parse_content_range,
+    write_chunk,
+    verify_checksum,
+    open_assembled_upload,
+    discard_upload,
+)
+
+__all__ = [
+    "UploadSessionCreateAPIView",
+    "UploadSessionAPIView",
+    "UploadFinalizeAPIView",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSessionCreateAPIView(APIView):
+    """
+    API view to start a resumable upload of a story or post file.
+    Requires user authentication. A user may have at most
+    UPLOAD_MAX_OPEN_SESSIONS unfinished uploads at a time.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Start a resumable upload by declaring the file's size and SHA-256 checksum.",
+        request_body=UploadSessionSerializer,
+        responses={status.HTTP_201_CREATED: UploadSessionSerializer}
+    )
+    def post(self, request, *args, **kwargs) -> Response:
+        """
+        Create an upload session for the current user.
+
+        Args:
+            request: The HTTP request containing the target, filename, size and checksum.
+
+        Returns:
+            Response: A response containing the session id, offset and chunk size.
+        """
+        max_open = getattr(settings, "UPLOAD_MAX_OPEN_SESSIONS", 5)
+        ttl = getattr(settings, "UPLOAD_SESSION_TTL", 86400)
+        open_sessions = UploadSession.objects.filter(
+            user=request.user,
+            status=UploadSession.Status.PENDING,
+            created_at__gte=now() - timedelta(seconds=ttl)
+        ).count()
+        if open_sessions >= max_open:
+            logger.warning(f"User {request.user.id} has too many open upload sessions")
+            return Response(
+                {"error": f"You can have at most {max_open} unfinished uploads. Finish or cancel one first."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        serializer = UploadSessionSerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save(user=request.user)
+            logger.info(f"Upload session {serializer.instance.id} created by user {request.user.id}")
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        logger.warning(f"Failed to create upload session. Errors: {serializer.errors}")
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UploadSessionAPIView(APIView):
+    """
+    API view to query the progress of an upload, to send its chunks and
+    to cancel it. Only the owner of the upload can access it.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Retrieve the number of bytes received, to resume an interrupted upload.",
+        responses={status.HTTP_200_OK: UploadSessionSerializer}
+    )
+    def get(self, request, id: str, *args, **kwargs) -> Response:
+        """
+        Retrieve the current offset and status of an upload session.
+
+        Args:
+            request: The HTTP request.
+            id: The ID of the upload session.
+
+        Returns:
+            Response: A response containing the upload session.
+        """
+        session = get_object_or_404(UploadSession, id=id, user=request.user)
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Send the bytes described by the Content-Range header as the raw request body. "
+            "A chunk must start at the current offset."
+        ),
+        responses={
+            status.HTTP_200_OK: "Chunk stored",
+            status.HTTP_409_CONFLICT: "Chunk does not start at the current offset",
+        }
+    )
+    def put(self, request, id: str, *args, **kwargs) -> Response:
+        """
+        Append a chunk to an upload session.
+
+        The body is streamed to disk without being parsed or buffered.
+
+        Args:
+            request: The HTTP request with a Content-Range header and the raw bytes.
+            id: The ID of the upload session.
+
+        Returns:
+            Response: A response containing the new offset, or error details.
+        """
+        session = get_object_or_404(UploadSession, id=id, user=request.user)
+        if session.status != UploadSession.Status.PENDING:
+            return Response({"error": "Upload is already completed."}, status=status.HTTP_409_CONFLICT)
+
+        try:
+            start, end, total = parse_content_range(request.headers.get("Content-Range"))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        length = end - start + 1
+        max_chunk = getattr(settings, "UPLOAD_CHUNK_MAX_SIZE", 8 * 1024 * 1024)
+        if total != session.size:
+            return Response({"error": "Content-Range total does not match the upload size."}, status=status.HTTP_400_BAD_REQUEST)
+        if length > max_chunk:
+            return Response({"error": f"Chunks must not exceed {max_chunk} bytes."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if int(request.META.get("CONTENT_LENGTH") or 0) != length:
+            return Response({"error": "Content-Length does not match Content-Range."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            offset = write_chunk(session, start, request.stream, length)
+        except UploadConflictError as e:
+            return Response({"error": str(e), "offset": session.offset}, status=status.HTTP_409_CONFLICT)
+
+        return Response({"offset": offset}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_description="Cancel an unfinished upload and discard the bytes received.",
+        responses={status.HTTP_204_NO_CONTENT: "Upload cancelled"}
+    )
+    def delete(self, request, id: str, *args, **kwargs) -> Response:
+        """
+        Cancel an upload session, freeing its slot and its partial file.
+
+        Args:
+            request: The HTTP request.
+            id: The ID of the upload session.
+
+        Returns:
+            Response: An empty response.
+        """
+        session = get_object_or_404(UploadSession, id=id, user=request.user)
+        discard_upload(session)
+        session.delete()
+
+        logger.info(f"Upload {id} cancelled by user {request.user.id}")
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadFinalizeAPIView(APIView):
+    """
+    API view to turn a fully received upload into a story or a post.
+    Only the owner of the upload can finalize it.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Verify the checksum of a finished upload and create the story or post.",
+        request_body=UploadFinalizeSerializer,
+        responses={status.HTTP_201_CREATED: "Story or post created"}
+    )
+    def post(self, request, id: str, *args, **kwargs) -> Response:
+        """
+        Verify the received file and attach it to a new Story or Post.
+
+        A file that fails the checksum is discarded and the offset reset,
+        so the client uploads it again from the start.
+
+        Args:
+            request: The HTTP request, with an optional caption for posts.
+            id: The ID of the upload session.
+
+        Returns:
+            Response: A response containing the created story or post, or error details.
+        """
+        finalize = UploadFinalizeSerializer(data=request.data)
+        if not finalize.is_valid():
+            return Response(finalize.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            session = get_object_or_404(
+                UploadSession.objects.select_for_update(),
+                id=id,
+                user=request.user
+            )
+            if session.status != UploadSession.Status.PENDING:
+                return Response({"error": "Upload is already completed."}, status=status.HTTP_409_CONFLICT)
+            if not session.is_complete:
+                return Response(
+                    {"error": "Upload is not complete.", "offset": session.offset},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            if not verify_checksum(session):
+                discard_upload(session)
+                session.offset = 0
+                session.save(update_fields=["offset"])
+                logger.warning(f"Checksum mismatch for upload {session.id}, restarting it")
+                return Response({"error": "Checksum does not match, upload the file again."}, status=status.HTTP_400_BAD_REQUEST)
+
+            upload = open_assembled_upload(session)
+            try:
+                serializer = self.get_target_serializer(session, upload, finalize.validated_data, request)
+                if not serializer.is_valid():
+                    logger.warning(f"Failed to finalize upload {session.id}. Errors: {serializer.errors}")
+                    discard_upload(session)
+                    session.delete()
+                    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+                serializer.save(user=request.user)
+            finally:
+                upload.close()
+
+            discard_upload(session)
+            session.status = UploadSession.Status.COMPLETED
+            session.save(update_fields=["status"])
+
+        logger.info(f"Upload {session.id} finalized as {session.target} by user {request.user.id}")
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def get_target_serializer(self, session: UploadSession, upload, data: dict, request):
+        """
+        Builds the serializer that creates the story or post of an upload,
+        so the assembled file goes through the same validation as a
+        multipart upload.
+
+        Args:
+            session (UploadSession): The upload session.
+            upload: The assembled file.
+            data (dict): The validated finalize data.
+            request: The HTTP request.
+
+        Returns:
+            Serializer: The unvalidated StorySerializer or PostSerializer.
+        """
+        if session.target == UploadSession.Target.POST_IMAGE:
+            return PostSerializer(
+                data={"image": upload, "caption": data.get("caption", "")},
+                context={"request": request}
+            )
+        field = "video" if session.target == UploadSession.Target.STORY_VIDEO else "image"
+        return StorySerializer(data={field: upload})
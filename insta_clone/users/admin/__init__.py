@@ -1,5 +1,7 @@
 from .user import CustomUserAdmin
 from .followers import FollowAdmin
+from .blocks import BlockAdmin, MuteAdmin
 from .daily_message_limit import DailyMessageLimitAdmin
 from .daily_messages import DailyMessageAdmin
-from .email_verification import VerificationCodeAdmin
\ No newline at end of file
+from .email_verification import VerificationCodeAdmin
+from .outbox import OutboxMessageAdmin
\ No newline at end of file
@@ -0,0 +1,44 @@
+from django.contrib import admin
+from ..models import Block, Mute
+
+
+@admin.register(Block)
+class BlockAdmin(admin.ModelAdmin):
+    """
+    Admin class for managing the Block model in the Django admin panel.
+    """
+
+    list_display = (
+        "blocker", 
+        "blocked", 
+        "created_at"
+    )
+    list_filter = ("created_at",)
+    search_fields = (
+        "blocker__email", 
+        "blocked__email"
+    )
+    ordering = ("-created_at",)
+    list_select_related = ("blocker", "blocked")
+    readonly_fields = ("created_at",)
+
+
+@admin.register(Mute)
+class MuteAdmin(admin.ModelAdmin):
+    """
+    Admin class for managing the Mute model in the Django admin panel.
+    """
+
+    list_display = (
+        "muter", 
+        "muted", 
+        "created_at"
+    )
+    list_filter = ("created_at",)
+    search_fields = (
+        "muter__email", 
+        "muted__email"
+    )
+    ordering = ("-created_at",)
+    list_select_related = ("muter", "muted")
+    readonly_fields = ("created_at",)
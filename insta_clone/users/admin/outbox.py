@@ -0,0 +1,32 @@
+from django.contrib import admin
+from users.models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """
+    Admin interface for inspecting outbox messages.
+    """
+
+    list_display = (
+        "task_name",
+        "dedupe_key",
+        "created_at",
+        "dispatched_at",
+    )
+    list_filter = (
+        "task_name",
+        "dispatched_at",
+    )
+    search_fields = (
+        "task_name",
+        "dedupe_key",
+    )
+    readonly_fields = (
+        "task_name",
+        "args",
+        "kwargs",
+        "dedupe_key",
+        "created_at",
+        "dispatched_at",
+    )
@@ -3,6 +3,9 @@ from django.contrib.auth.admin import UserAdmin
 from django.utils.html import mark_safe
 from django.contrib.auth.models import User
 from django.http import HttpRequest
+from django.db.models import QuerySet
+
+from services.auth import login_throttle
 
 from ..forms import CustomUserCreationForm, CustomUserChangeForm
 from ..models import CustomUser
@@ -83,6 +86,22 @@ class CustomUserAdmin(UserAdmin):
     )
 
     filter_horizontal = ("groups", "user_permissions")
+    actions = ["unlock_login"]
+
+    @admin.action(description="Unlock login for selected users")
+    def unlock_login(self, request: HttpRequest, queryset: QuerySet) -> None:
+        """
+        Clears the failed login attempts and lockouts of the selected users.
+
+        Args:
+            request (HttpRequest): The admin request.
+            queryset (QuerySet): The selected users.
+        """
+        emails = list(queryset.values_list("email", flat=True))
+        for email in emails:
+            login_throttle.unlock("email", email)
+
+        self.message_user(request, f"Unlocked login for {len(emails)} user(s).")
 
     def profile_picture_preview(self, obj: CustomUser) -> str:
         """
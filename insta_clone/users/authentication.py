@@ -0,0 +1,50 @@
+import logging
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from services.users import get_cached_user
+
+__all__ = ["CachedJWTAuthentication"]
+
+logger = logging.getLogger(__name__)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds request.user from the cached user summary
+    (id, email, slug, is_active, ...) instead of selecting the user on every
+    request.
+
+    The summary is invalidated whenever the user is saved, which covers
+    password changes and deactivation, and on logout. Fields outside the
+    summary are loaded lazily on first access.
+    """
+
+    def get_user(self, validated_token):
+        """
+        Returns the user identified by the token's user id claim.
+
+        Raises:
+            InvalidToken: If the token has no user id claim.
+            AuthenticationFailed: If the user does not exist or is inactive.
+        """
+        # Revocation on password change needs the password hash, which is never cached.
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,85 @@
+import gzip
+from typing import IO, Dict, List, Tuple
+from django.apps import apps
+from django.core.management.base import CommandError
+from django.db import connection, models
+
+# Tables of the social graph and the columns that are exported for each one.
+# The primary key is left out so imported rows get fresh ids and duplicates
+# are detected through the natural-key unique constraints instead.
+SOCIAL_GRAPH_TABLES: Dict[str, Tuple[str, List[str]]] = {
+    "follows": (
+        "users.Follow",
+        ["follower_id", "followed_id", "created_at"]
+    ),
+    "post_likes": (
+        "likes.PostLike",
+        ["user_id", "post_id", "created_at"]
+    ),
+    "comment_likes": (
+        "likes.CommentLike",
+        ["user_id", "comment_id", "created_at"]
+    ),
+}
+
+FORMAT_EXTENSIONS: Dict[str, str] = {
+    "csv": "csv",
+    "binary": "bin",
+}
+
+
+def ensure_postgresql() -> None:
+    """
+    Raises a CommandError unless the default database is PostgreSQL,
+    since COPY is a PostgreSQL-only feature.
+    """
+    if connection.vendor != "postgresql":
+        raise CommandError(
+            f"COPY is only supported on PostgreSQL, not on {connection.vendor}."
+        )
+
+
+def get_table(name: str) -> Tuple[type[models.Model], List[str]]:
+    """
+    Returns the model and exported columns for a social graph table name.
+    """
+    try:
+        label, columns = SOCIAL_GRAPH_TABLES[name]
+    except KeyError:
+        raise CommandError(
+            f"Unknown table \"{name}\". Choose from: {', '.join(SOCIAL_GRAPH_TABLES)}."
+        )
+    return apps.get_model(label), columns
+
+
+def copy_options(file_format: str) -> str:
+    """
+    Returns the WITH clause options of a COPY statement for the given format.
+    """
+    if file_format == "binary":
+        return "FORMAT binary"
+    return "FORMAT csv, HEADER true"
+
+
+def quoted_columns(columns: List[str]) -> str:
+    """
+    Returns a comma-separated list of quoted column names.
+    """
+    return ", ".join(connection.ops.quote_name(column) for column in columns)
+
+
+def open_file(path: str, mode: str) -> IO[bytes]:
+    """
+    Opens a data file, transparently handling gzip compression for ".gz" paths.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def guess_format(path: str) -> str:
+    """
+    Guesses the COPY format of a data file from its extension.
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    return "binary" if name.endswith(".bin") else "csv"
@@ -0,0 +1,223 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Set
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from users.models import CustomUser
+from users.models.user import RESERVED_SLUGS
+from services.users import invalidate_slug_cache
+from utils.slug import convert_to_slug
+from ._social_graph import open_file
+
+USER_FIELDS = ("email", "password", "first_name", "last_name", "bio")
+INSERT_ATTEMPTS = 3
+
+
+def init_worker() -> None:
+    """
+    Prepares a hashing process; a no-op when it was forked from a set-up parent.
+    """
+    django.setup()
+
+
+class Command(BaseCommand):
+    """
+    Creates users in bulk from a CSV or JSON Lines file.
+
+    The file is read as a stream, one batch at a time. Passwords of a batch
+    are hashed in parallel on a process pool, slugs are assigned in memory
+    against the set of slugs already taken, and every batch is inserted
+    with a single bulk_create. Emails that already exist are skipped.
+
+    bulk_create does not call save() or send post_save signals.
+    """
+    help = "Create users in bulk from a CSV or JSONL file with email, password, first_name, last_name and bio."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "path",
+            help="Path of the CSV or JSONL file (\".gz\" files are decompressed).",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            default=None,
+            help="Format of the file. Guessed from the extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users hashed and inserted together.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of password hashing processes.",
+        )
+        parser.add_argument(
+            "--hashed-passwords",
+            action="store_true",
+            help="The password column already holds Django password hashes, e.g. "
+                 "when migrating accounts; they are stored as they are.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        file_format = options["format"] or self.guess_format(options["path"])
+        batch_size = options["batch_size"]
+        self.workers = options["workers"]
+        self.hashed_passwords = options["hashed_passwords"]
+        started = time.monotonic()
+
+        self.taken_slugs: Set[str] = set(
+            CustomUser.objects.values_list("slug", flat=True).iterator(chunk_size=10000)
+        )
+        self.taken_slugs.update(RESERVED_SLUGS)
+        self.next_suffix: Dict[str, int] = {}
+        seen_emails: Set[str] = set()
+        created = skipped = 0
+
+        with open_file(options["path"], "rt") as source, ProcessPoolExecutor(
+            max_workers=options["workers"], initializer=init_worker
+        ) as pool:
+            rows = self.read_rows(source, file_format)
+            while batch := list(islice(rows, batch_size)):
+                users = self.build_users(batch, seen_emails, pool)
+                inserted = self.insert(users)
+                created += inserted
+                skipped += len(batch) - inserted
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"Created {created} users ({skipped} skipped) in {elapsed:.1f}s "
+                    f"({created / max(elapsed, 1e-6):.0f} users/s)"
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} users, skipped {skipped}, in {time.monotonic() - started:.2f}s."
+        ))
+
+    @staticmethod
+    def guess_format(path: str) -> str:
+        """
+        Guesses the file format from its extension.
+        """
+        name = path[:-3] if path.endswith(".gz") else path
+        return "jsonl" if name.endswith((".jsonl", ".ndjson")) else "csv"
+
+    @staticmethod
+    def read_rows(source, file_format: str) -> Iterator[dict]:
+        """
+        Yields the rows of the file one at a time.
+        """
+        if file_format == "csv":
+            yield from csv.DictReader(source)
+            return
+
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f"Invalid JSON on line {line_number}: {e}")
+
+    def build_users(self, rows: List[dict], seen_emails: Set[str], pool: ProcessPoolExecutor) -> List[CustomUser]:
+        """
+        Turns a batch of rows into unsaved users with hashed passwords and
+        unique slugs, dropping emails that are invalid, repeated or taken.
+        """
+        candidates = {}
+        for row in rows:
+            email = CustomUser.objects.normalize_email((row.get("email") or "").strip())
+            if not email or email in seen_emails or email in candidates:
+                continue
+            candidates[email] = {field: row.get(field) or "" for field in USER_FIELDS}
+            candidates[email]["email"] = email
+
+        existing = set(
+            CustomUser.objects.filter(email__in=candidates).values_list("email", flat=True)
+        )
+        for email in existing:
+            del candidates[email]
+        seen_emails.update(candidates)
+
+        passwords = [data["password"] or None for data in candidates.values()]
+        if self.hashed_passwords:
+            hashes = [password or make_password(None) for password in passwords]
+        else:
+            chunksize = max(len(passwords) // (self.workers * 4), 1)
+            hashes = pool.map(make_password, passwords, chunksize=chunksize)
+
+        users = []
+        for data, password in zip(candidates.values(), hashes):
+            user = CustomUser(
+                email=data["email"],
+                password=password,
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                bio=data["bio"] or None,
+            )
+            user.slug = self.assign_slug(user)
+            users.append(user)
+        return users
+
+    def assign_slug(self, user: CustomUser) -> str:
+        """
+        Returns the first free slug for the user, the same way CustomUser.save
+        names users, but against the in-memory set of taken slugs.
+        """
+        full_name = f"{user.first_name} {user.last_name}".strip() or user.email.split("@")[0]
+        base_slug = convert_to_slug(full_name)
+
+        slug = base_slug
+        if slug in self.taken_slugs:
+            suffix = self.next_suffix.get(base_slug, 1)
+            while f"{base_slug}-{suffix}" in self.taken_slugs:
+                suffix += 1
+            slug = f"{base_slug}-{suffix}"
+            self.next_suffix[base_slug] = suffix + 1
+
+        self.taken_slugs.add(slug)
+        return slug
+
+    def insert(self, users: List[CustomUser]) -> int:
+        """
+        Inserts a batch, reassigning slugs and dropping emails that were
+        taken by concurrent registrations since the batch was built.
+
+        bulk_create skips post_save, so the cached slug mappings of the
+        batch, e.g. negative entries from earlier lookups, are dropped here.
+        """
+        for attempt in range(INSERT_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    CustomUser.objects.bulk_create(users)
+                invalidate_slug_cache(user.slug for user in users)
+                return len(users)
+            except IntegrityError:
+                if attempt == INSERT_ATTEMPTS - 1:
+                    raise
+
+            emails = set(CustomUser.objects.filter(
+                email__in=[user.email for user in users]
+            ).values_list("email", flat=True))
+            slugs = set(CustomUser.objects.filter(
+                slug__in=[user.slug for user in users]
+            ).values_list("slug", flat=True))
+            self.taken_slugs.update(slugs)
+
+            users = [user for user in users if user.email not in emails]
+            for user in users:
+                if user.slug in slugs:
+                    user.slug = self.assign_slug(user)
+        return 0
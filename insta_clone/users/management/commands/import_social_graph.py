@@ -0,0 +1,91 @@
+import time
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ._social_graph import (
+    SOCIAL_GRAPH_TABLES,
+    FORMAT_EXTENSIONS,
+    ensure_postgresql,
+    get_table,
+    copy_options,
+    quoted_columns,
+    open_file,
+    guess_format,
+)
+from .rebuild_leaderboards import LEADERBOARDS
+
+
+class Command(BaseCommand):
+    """
+    Streams a file produced by export_social_graph back into its table.
+
+    Rows are loaded with COPY FROM STDIN into a temporary staging table and
+    then moved into the target table with INSERT ... ON CONFLICT DO NOTHING,
+    so rows that already exist under the table's unique constraints
+    (unique_follow, unique_user_comment_like, ...) are skipped.
+
+    The raw INSERT bypasses the incremental leaderboard updates, so the
+    leaderboard derived from the table, if any, is rebuilt afterwards.
+    """
+    help = "Import a social graph table with PostgreSQL COPY, skipping duplicates."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "table",
+            choices=list(SOCIAL_GRAPH_TABLES),
+            help="The table the file belongs to.",
+        )
+        parser.add_argument(
+            "path",
+            help="Path of the export file (\".gz\" files are decompressed).",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(FORMAT_EXTENSIONS),
+            default=None,
+            help="COPY format of the file. Guessed from the extension by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        ensure_postgresql()
+
+        model, columns = get_table(options["table"])
+        file_format = options["format"] or guess_format(options["path"])
+        table = connection.ops.quote_name(model._meta.db_table)
+        staging = connection.ops.quote_name(f"{model._meta.db_table}_import")
+        column_list = quoted_columns(columns)
+
+        started = time.monotonic()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {table} WITH NO DATA"
+            )
+
+            with open_file(options["path"], "rb") as source:
+                cursor.copy_expert(
+                    f"COPY {staging} ({column_list}) FROM STDIN "
+                    f"WITH ({copy_options(file_format)})",
+                    source
+                )
+            copied = cursor.rowcount
+
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT {column_list} FROM {staging} "
+                f"ON CONFLICT DO NOTHING"
+            )
+            inserted = cursor.rowcount
+
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {inserted} of {copied} rows into {options['table']} "
+            f"({copied - inserted} duplicates skipped) in {elapsed:.2f}s "
+            f"({copied / max(elapsed, 1e-6):.0f} rows/s)."
+        ))
+
+        if options["table"] in LEADERBOARDS and inserted:
+            call_command("rebuild_leaderboards", table=[options["table"]], stdout=self.stdout)
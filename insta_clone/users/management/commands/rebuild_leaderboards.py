@@ -0,0 +1,57 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from users.models import Follow
+from likes.models import PostLike
+from utils.leaderboard import FOLLOWERS_LEADERBOARD, POST_LIKES_LEADERBOARD
+
+# The leaderboard derived from each social graph table, with the model and
+# the column whose rows are counted.
+LEADERBOARDS = {
+    "follows": (FOLLOWERS_LEADERBOARD, Follow, "followed_id"),
+    "post_likes": (POST_LIKES_LEADERBOARD, PostLike, "post_id"),
+}
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the most-followed and most-liked leaderboards from the database.
+
+    The leaderboards are normally updated incrementally; this command repairs
+    any drift, e.g. after a Redis flush or rows written outside the toggles.
+    """
+    help = "Rebuild the followers and post likes leaderboards in Redis."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of members written to Redis per round trip.",
+        )
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=list(LEADERBOARDS),
+            help="Only rebuild the leaderboard of this table. Can be repeated.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        tables = options["table"] or list(LEADERBOARDS)
+
+        for leaderboard, model, field in (LEADERBOARDS[table] for table in tables):
+            started = time.monotonic()
+            scores = (
+                model.objects.values(field)
+                .annotate(total=Count("id"))
+                .order_by()
+                .values_list(field, "total")
+                .iterator()
+            )
+            members = leaderboard.rebuild(scores, batch_size=options["batch_size"])
+            elapsed = time.monotonic() - started
+
+            self.stdout.write(self.style.SUCCESS(
+                f"Rebuilt {leaderboard.key} with {members} members in {elapsed:.2f}s"
+            ))
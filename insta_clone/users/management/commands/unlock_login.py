@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services.auth import login_throttle
+
+
+class Command(BaseCommand):
+    """
+    Lists or clears login lockouts of client IPs and emails.
+
+    The admin action only unlocks the emails of selected users; an IP shared
+    by many users, e.g. behind a NAT, is unlocked from here.
+    """
+    help = "List locked-out IPs and emails, or unlock the given ones."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--ip",
+            action="append",
+            default=[],
+            help="Client IP to unlock. May be repeated.",
+        )
+        parser.add_argument(
+            "--email",
+            action="append",
+            default=[],
+            help="Email to unlock. May be repeated.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="List the IPs and emails currently locked out.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["list"]:
+            for scope in ("ip", "email"):
+                for identifier, ttl in sorted(login_throttle.locked(scope).items()):
+                    self.stdout.write(f"{scope} {identifier} locked for {ttl}s")
+            return
+
+        targets = [("ip", ip) for ip in options["ip"]] + [("email", email) for email in options["email"]]
+        if not targets:
+            raise CommandError("Pass --list, or at least one --ip or --email to unlock.")
+
+        for scope, identifier in targets:
+            login_throttle.unlock(scope, identifier)
+            self.stdout.write(self.style.SUCCESS(f"Unlocked login for {scope} {identifier}"))
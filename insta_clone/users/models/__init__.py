@@ -1,5 +1,7 @@
 from .user import CustomUser
 from .followers import Follow
+from .blocks import Block, Mute
 from .daily_message_limit import DailyMessageLimit
 from .daily_messages import DailyMessage
-from .email_verification import VerificationCode
\ No newline at end of file
+from .email_verification import VerificationCode
+from .outbox import OutboxMessage
\ No newline at end of file
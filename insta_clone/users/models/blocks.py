@@ -0,0 +1,147 @@
+from django.db import models
+from django.db.models import Q
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from users.models.followers import Follow
+from utils.leaderboard import FOLLOWERS_LEADERBOARD
+
+User = get_user_model()
+
+
+class Block(models.Model):
+    """
+    Model representing a block between users.
+    A blocked user's content is hidden from the blocker and vice versa.
+    """
+
+    blocker = models.ForeignKey(
+        User,
+        related_name="blocked_users",
+        on_delete=models.CASCADE
+    )
+    blocked = models.ForeignKey(
+        User,
+        related_name="blocked_by_users",
+        on_delete=models.CASCADE
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["blocker", "blocked"],
+                name="unique_block"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["blocked", "blocker"]),
+        ]
+
+    def __str__(self) -> str:
+        """Returns a string representation of the block relationship."""
+        return f"{self.blocker.email} blocked {self.blocked.email}"
+
+    def clean(self) -> None:
+        """
+        Ensures that a user cannot block themselves.
+        Raises:
+            ValidationError: If the blocker and blocked are the same user.
+        """
+        if self.blocker == self.blocked:
+            raise ValidationError("A user cannot block themselves.")
+        super().clean()
+
+    @classmethod
+    def toggle_block(cls, blocker, blocked) -> bool:
+        """
+        Toggles the block status between two users.
+
+        Blocking also removes any follow relationship in both directions.
+
+        Args:
+            blocker (User): The user who wants to block/unblock.
+            blocked (User): The user who is being blocked/unblocked.
+
+        Returns:
+            bool: True if the block was created, False if it was removed.
+        """
+        block_obj, created = cls.objects.get_or_create(
+            blocker=blocker,
+            blocked=blocked
+        )
+        if created:
+            follows = Follow.objects.filter(
+                Q(follower=blocker, followed=blocked) |
+                Q(follower=blocked, followed=blocker)
+            )
+            for followed_id in follows.values_list("followed_id", flat=True):
+                FOLLOWERS_LEADERBOARD.incr(followed_id, -1)
+            follows.delete()
+            return True
+
+        block_obj.delete()
+        return False
+
+
+class Mute(models.Model):
+    """
+    Model representing a mute between users.
+    A muted user's posts and stories are hidden from the muter's feed,
+    without the muted user being notified or unfollowed.
+    """
+
+    muter = models.ForeignKey(
+        User,
+        related_name="muted_users",
+        on_delete=models.CASCADE
+    )
+    muted = models.ForeignKey(
+        User,
+        related_name="muted_by_users",
+        on_delete=models.CASCADE
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["muter", "muted"],
+                name="unique_mute"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Returns a string representation of the mute relationship."""
+        return f"{self.muter.email} muted {self.muted.email}"
+
+    def clean(self) -> None:
+        """
+        Ensures that a user cannot mute themselves.
+        Raises:
+            ValidationError: If the muter and muted are the same user.
+        """
+        if self.muter == self.muted:
+            raise ValidationError("A user cannot mute themselves.")
+        super().clean()
+
+    @classmethod
+    def toggle_mute(cls, muter, muted) -> bool:
+        """
+        Toggles the mute status between two users.
+
+        Args:
+            muter (User): The user who wants to mute/unmute.
+            muted (User): The user who is being muted/unmuted.
+
+        Returns:
+            bool: True if the mute was created, False if it was removed.
+        """
+        mute_obj, created = cls.objects.get_or_create(
+            muter=muter,
+            muted=muted
+        )
+        if created:
+            return True
+
+        mute_obj.delete()
+        return False
@@ -1,6 +1,18 @@
+import uuid
 from django.db import models
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.timezone import timedelta
-from typing import Optional
+
+from utils.lru_cache import LocalLRUCache
+
+CONFIG_VERSION_KEY = "users:daily_message_limit:version"
+CONFIG_KEY = "users:daily_message_limit:{}"
+
+local_config = LocalLRUCache(
+    maxsize=1,
+    ttl=getattr(settings, "DAILY_MESSAGE_LIMIT_LOCAL_TTL", 10)
+)
 
 
 class DailyMessageLimit(models.Model):
@@ -27,4 +39,54 @@ class DailyMessageLimit(models.Model):
             f"Daily Limit: {self.limit} "
             f"Expiration Time: {self.expiration_time} "
             f"Reset Time: {self.reset_time}"
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def get_config_version() -> str:
+        """
+        Returns the current configuration version, creating one if the cache has none.
+        """
+        version = cache.get(CONFIG_VERSION_KEY)
+        if version is None:
+            cache.add(CONFIG_VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(CONFIG_VERSION_KEY)
+        return version
+
+    @classmethod
+    def get_solo(cls) -> "DailyMessageLimit":
+        """
+        Returns the configuration singleton (id=1) without touching the database.
+
+        Each process keeps its own copy for DAILY_MESSAGE_LIMIT_LOCAL_TTL seconds.
+        After that it reloads the copy from the cache entry of the current
+        version. The database is only queried when that entry is missing.
+
+        Returns:
+            DailyMessageLimit: The daily message limit settings.
+        """
+        limit_obj = local_config.get("config")
+        if limit_obj is not None:
+            return limit_obj
+
+        version = cls.get_config_version()
+        key = CONFIG_KEY.format(version)
+        limit_obj = cache.get(key) if version is not None else None
+
+        if limit_obj is None:
+            limit_obj = cls.objects.filter(id=1).first()
+            if limit_obj is None:
+                limit_obj, _ = cls.objects.get_or_create(id=1)
+            if version is not None:
+                cache.set(key, limit_obj, None)
+
+        local_config.set("config", limit_obj)
+        return limit_obj
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Moves every process to a new configuration version. Other processes
+        pick up the change once their local copy expires.
+        """
+        cache.set(CONFIG_VERSION_KEY, uuid.uuid4().hex, None)
+        local_config.clear()
@@ -23,7 +23,7 @@ class VerificationCode(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["email"]),
+            models.Index(fields=["email", "created_at"]),
             models.Index(fields=["verification_code"]),
         ]
 
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from typing import Dict, Iterable
+from utils.leaderboard import FOLLOWERS_LEADERBOARD
 
 User = get_user_model()
 
@@ -52,6 +54,7 @@ class Follow(models.Model):
         
         If the follower is not following the followed user, it creates a follow entry.
         If the follower is already following, it removes the follow entry.
+        The followers leaderboard is updated to match.
 
         Args:
             follower (User): The user who wants to follow/unfollow.
@@ -65,7 +68,48 @@ class Follow(models.Model):
             followed=followed
         )
         if created:
+            FOLLOWERS_LEADERBOARD.incr(followed.id)
             return True
         
         follow_obj.delete()  
+        FOLLOWERS_LEADERBOARD.incr(followed.id, -1)
         return False
+
+    @classmethod
+    def relationship_status(cls, user, slugs: Iterable[str]) -> Dict[str, Dict[str, bool]]:
+        """
+        Returns the follow relationship between a user and a batch of other users.
+
+        Runs exactly two queries regardless of the number of slugs: one for the
+        users the given user follows and one for the users following them back.
+
+        Args:
+            user (User): The user from whose point of view the status is computed.
+            slugs (Iterable[str]): The slugs of the users to check.
+
+        Returns:
+            Dict[str, Dict[str, bool]]: A mapping of slug to its "following" and
+            "followed_by" flags.
+        """
+        slugs = list(dict.fromkeys(slugs))
+
+        following = set(
+            cls.objects.filter(
+                follower=user,
+                followed__slug__in=slugs
+            ).values_list("followed__slug", flat=True)
+        )
+        followed_by = set(
+            cls.objects.filter(
+                followed=user,
+                follower__slug__in=slugs
+            ).values_list("follower__slug", flat=True)
+        )
+
+        return {
+            slug: {
+                "following": slug in following,
+                "followed_by": slug in followed_by,
+            }
+            for slug in slugs
+        }
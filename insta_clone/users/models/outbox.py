@@ -0,0 +1,60 @@
+from django.db import models
+from django.db.models import Q
+
+
+class OutboxMessage(models.Model):
+    """
+    A Celery task waiting to be published to the broker.
+
+    The row is written in the same transaction as the data the task reads,
+    so the task is only published once that data is committed, and a
+    broker outage delays it instead of losing it. Rows are marked as
+    dispatched once published and purged after OUTBOX_RETENTION seconds.
+
+    Arguments are stored as plain JSON and shown in the admin, so they must
+    never carry secrets such as verification codes; pass a reference the
+    task can look up instead.
+
+    Attributes:
+        task_name (str): The registered name of the task.
+        args (list): The positional arguments of the task.
+        kwargs (dict): The keyword arguments of the task.
+        dedupe_key (str): An optional key; a second message with the same key is dropped.
+        created_at (datetime): When the message was written.
+        dispatched_at (datetime): When the message was published, if it has been.
+    """
+
+    task_name = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    dedupe_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=Q(dispatched_at__isnull=True),
+                name="outbox_pending_idx"
+            ),
+            models.Index(fields=["dispatched_at"]),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the outbox message.
+
+        Returns:
+            str: The task name and whether it has been dispatched.
+        """
+        state = "dispatched" if self.dispatched_at else "pending"
+        return f"{self.task_name} ({state})"
@@ -1,9 +1,15 @@
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.utils.translation import gettext_lazy as _
 
 from users.managers import CustomUserManager
 from utils.slug_manager import generate_unique_slug
+from utils.worker_pool import password_hashing_pool
+
+SLUG_SAVE_ATTEMPTS = 5
+# Slugs matching a fixed route under users/, which would shadow the profile.
+RESERVED_SLUGS = frozenset({"relationships", "leaderboard"})
 
 
 class CustomUser(AbstractUser):
@@ -41,14 +47,66 @@ class CustomUser(AbstractUser):
         """
         return self.email
 
+    def set_password(self, raw_password) -> None:
+        """
+        Hashes the password on the password hashing pool instead of the
+        request thread.
+
+        Raises:
+            PoolOverloaded: If too many passwords are already being hashed.
+        """
+        self.password = password_hashing_pool.run(make_password, raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password) -> bool:
+        """
+        Checks the password on the password hashing pool instead of the
+        request thread.
+
+        A hash that needs upgrading is re-hashed and saved on the calling
+        thread, since pool threads must not use the database.
+
+        Raises:
+            PoolOverloaded: If too many passwords are already being hashed.
+        """
+        needs_upgrade = []
+        is_correct = password_hashing_pool.run(
+            check_password, raw_password, self.password, needs_upgrade.append
+        )
+
+        if needs_upgrade:
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            self.save(update_fields=["password"])
+
+        return is_correct
+
     def save(self, *args, **kwargs) -> None:
         """
         Generates a unique slug for the user if it's not set.
         Uses the full name if available, otherwise derives from the email.
+        Slugs in RESERVED_SLUGS are never given out.
+
+        If a concurrent registration takes the same slug first, the insert
+        fails on the unique constraint and a fresh slug is generated.
         """
-        if not self.slug:
-            full_name = f"{self.first_name} {self.last_name}".strip()
-            if not full_name:
-                full_name = self.email.split("@")[0]
-            self.slug = generate_unique_slug(full_name, CustomUser)
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+
+        full_name = f"{self.first_name} {self.last_name}".strip()
+        if not full_name:
+            full_name = self.email.split("@")[0]
+
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            self.slug = generate_unique_slug(full_name, CustomUser, RESERVED_SLUGS)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                slug_taken = CustomUser.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                if not slug_taken or attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    self.slug = ""
+                    raise
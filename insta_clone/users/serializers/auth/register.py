@@ -1,8 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import serializers
 
-from users.models import VerificationCode
-from services.auth import validate_verification_code
+from services.auth import check_verification_code, validate_verification_code
 
 User = get_user_model()
 
@@ -66,9 +66,10 @@ class RegisterSerializer(serializers.ModelSerializer):
     def validate(self, data: dict) -> dict:
         """
         Validates the registration data by checking the verification code.
+        The code is only consumed when the user is created.
         """
         try:
-            validate_verification_code(
+            check_verification_code(
                 data["email"], 
                 data["verification_code"]
             )
@@ -84,7 +85,7 @@ class RegisterSerializer(serializers.ModelSerializer):
         Creates a new user instance with the validated data.
         """
         email = validated_data["email"]
-        validated_data.pop("verification_code")
+        verification_code = validated_data.pop("verification_code")
 
         # Check if email is already registered before creating a new user
         if User.objects.filter(email=email).exists():
@@ -92,11 +93,15 @@ class RegisterSerializer(serializers.ModelSerializer):
                 {"email": "This email is already registered."}
             )
 
-        # Create a new user
-        user = User.objects.create_user(**validated_data)
-        
-        # Mark the verification code as verified
-        VerificationCode.objects.filter(
-            email=email).update(is_verified=True)
+        # Create the user and consume the code together, so a failure in
+        # either leaves the other untouched
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
+            try:
+                validate_verification_code(email, verification_code)
+            except ValueError as e:
+                raise serializers.ValidationError(
+                    {"verification_code": str(e)}
+                )
 
         return user
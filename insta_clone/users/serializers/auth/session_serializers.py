@@ -1,7 +1,9 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import Throttled
 from django.contrib.auth import authenticate
 
+from services.auth import CachedRefreshToken, login_throttle, get_client_ip
+
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -24,24 +26,39 @@ class LoginSerializer(serializers.Serializer):
 
         Raises:
             serializers.ValidationError: If the email or password is invalid.
+            Throttled: If the email or client IP is locked out after too
+                many failed attempts.
         """
         email = data.get("email")
         password = data.get("password")
+        request = self.context.get("request")
+        ip = get_client_ip(request)
+
+        # Checked before authenticate, so locked-out attempts hash nothing
+        retry_after = login_throttle.retry_after(ip, email)
+        if retry_after:
+            raise Throttled(
+                wait=retry_after,
+                detail="Too many failed login attempts."
+            )
 
         # Authenticate the user using email instead of username
         user = authenticate(
-            request=self.context.get("request"),
+            request=request,
             email=email, 
             password=password
         )
 
         if not user:
+            login_throttle.register_failure(ip, email)
             raise serializers.ValidationError(
                 "Invalid email or password."
             )
 
+        login_throttle.register_success(email)
+
         # Generate and return JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = CachedRefreshToken.for_user(user)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -0,0 +1,10 @@
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
+from services.auth import CachedRefreshToken
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Serializer for refreshing JWT tokens that checks the blacklist in Redis.
+    """
+    token_class = CachedRefreshToken
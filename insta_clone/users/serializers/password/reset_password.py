@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import serializers
 
-from users.models import VerificationCode
+from services.auth import check_verification_code, validate_verification_code
 
 User = get_user_model()
 
@@ -23,7 +24,8 @@ class ResetPasswordSerializer(serializers.Serializer):
     def validate(self, data: dict) -> dict:
         """
         Validate the provided data to ensure the verification code 
-        is correct and not expired.
+        is correct and not expired. The code is only consumed when the
+        password is changed.
         
         Args:
             data (dict): The input data containing email, verification_code, 
@@ -47,18 +49,10 @@ class ResetPasswordSerializer(serializers.Serializer):
             )
 
         try:
-            record = VerificationCode.objects.get(
-                email=email,
-                verification_code=verification_code
-            )
-        except VerificationCode.DoesNotExist:
-            raise serializers.ValidationError(
-                {"verification_code": "Invalid or expired verification code."}
-            )
-
-        if record.is_verified or record.is_expired():
+            check_verification_code(email, verification_code)
+        except ValueError as e:
             raise serializers.ValidationError(
-                {"verification_code": "Verification code is invalid or expired."}
+                {"verification_code": str(e)}
             )
 
         return data
@@ -78,13 +72,15 @@ class ResetPasswordSerializer(serializers.Serializer):
         new_password = validated_data["new_password"]
         
         # We find the user by email
-        user = User.objects.get(email=email)
-        user.set_password(new_password)
-        user.save()
-
-        # Mark the verification code as used
-        VerificationCode.objects.filter(
-            email=email
-        ).update(is_verified=True)
+        with transaction.atomic():
+            user = User.objects.get(email=email)
+            user.set_password(new_password)
+            user.save()
+            try:
+                validate_verification_code(email, validated_data["verification_code"])
+            except ValueError as e:
+                raise serializers.ValidationError(
+                    {"verification_code": str(e)}
+                )
 
         return user
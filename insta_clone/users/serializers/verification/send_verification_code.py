@@ -1,8 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from users.models import VerificationCode
-from services.auth import create_verification_code
+from services.auth import send_verification_code
 
 User = get_user_model()
 
@@ -11,7 +10,7 @@ class SendVerificationCodeSerializer(serializers.Serializer):
     """
     Serializer for sending a verification code to the provided email address.
     
-    Validates the email and creates a verification code.
+    Validates the email, then generates, stores and sends a verification code.
     """
     email = serializers.EmailField()
 
@@ -20,7 +19,6 @@ class SendVerificationCodeSerializer(serializers.Serializer):
         Validates the email address. 
         
         - If the email is already registered, raise a ValidationError.
-        - If an existing verification code exists for the email, delete it.
         
         Args:
             value (str): The email address to be validated.
@@ -33,13 +31,13 @@ class SendVerificationCodeSerializer(serializers.Serializer):
                 "This email is already registered. "
                 "If you've forgotten your password, use the \"Reset Password\" section."
             )
-        
-        VerificationCode.objects.filter(email=value).delete()
+
         return value
 
     def create(self, validated_data: dict) -> dict:
         """
-        Creates and sends a verification code to the given email address.
+        Creates and sends a verification code to the given email address,
+        replacing any code sent to it before.
         
         Args:
             validated_data (dict): The validated data containing the email.
@@ -48,5 +46,5 @@ class SendVerificationCodeSerializer(serializers.Serializer):
             dict: A dictionary containing the email and a success message.
         """
         email = validated_data["email"]
-        create_verification_code(email)
+        send_verification_code(email)
         return {"email": email, "message": "Verification code sent."}
@@ -0,0 +1,57 @@
+from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.dispatch import receiver
+
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from users.models import CustomUser, Block, Mute, DailyMessageLimit
+from services.auth import mirror_blacklisted_token
+from services.users import invalidate_user_cache, invalidate_hidden_users
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance: CustomUser, **kwargs) -> None:
+    """
+    Drops the cached slug mapping and profile summary of a user whenever it
+    is saved or deleted, so renamed or new slugs are never served stale.
+    """
+    invalidate_user_cache(instance.pk, instance.slug)
+
+
+@receiver(post_save, sender=Block)
+@receiver(post_delete, sender=Block)
+def invalidate_cached_blocks(sender, instance: Block, **kwargs) -> None:
+    """
+    Drops the cached hidden-user sets of both sides of a block.
+    """
+    invalidate_hidden_users(instance.blocker_id, instance.blocked_id)
+
+
+@receiver(post_save, sender=Mute)
+@receiver(post_delete, sender=Mute)
+def invalidate_cached_mutes(sender, instance: Mute, **kwargs) -> None:
+    """
+    Drops the cached hidden-user set of the muting user.
+    """
+    invalidate_hidden_users(instance.muter_id)
+
+
+@receiver(post_save, sender=DailyMessageLimit)
+@receiver(post_delete, sender=DailyMessageLimit)
+def invalidate_cached_daily_message_limit(sender, instance: DailyMessageLimit, **kwargs) -> None:
+    """
+    Bumps the configuration version once an admin's edit to the daily
+    message limits is committed, so every process reloads them.
+    """
+    transaction.on_commit(DailyMessageLimit.invalidate_cache)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def mirror_blacklist_entry(sender, instance: BlacklistedToken, created: bool, **kwargs) -> None:
+    """
+    Copies every new blacklist entry into Redis, whether it comes from a
+    token refresh, a logout or the admin.
+    """
+    if created:
+        mirror_blacklisted_token(instance.token.jti, instance.token.expires_at)
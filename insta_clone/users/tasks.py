@@ -1,31 +1,200 @@
-import os
+import logging
+from datetime import timedelta
+from typing import Optional
 from celery import shared_task
-from django.core.mail import send_mail
+from django.conf import settings
+from django.utils.timezone import now
 
-from users.models import VerificationCode
-from services.auth.email_service import create_verification_code
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
+from users.models import VerificationCode, DailyMessage, DailyMessageLimit, OutboxMessage
+from services.auth.email_service import build_verification_email
+from services.auth.verification_store import read_mail_ticket, delete_mail_ticket
+from services.auth.token_blacklist import sync_token_blacklist
+from services.outbox import relay_outbox
+from utils.batch_delete import delete_in_batches
+from utils.mail_queue import mail_queue
+from utils.smtp_pool import EmailBatchError, is_connection_lost, smtp_connection
 
-@shared_task
-def send_verification_email(email: str) -> str:
+logger = logging.getLogger(__name__)
+
+@shared_task(ignore_result=True)
+def send_verification_email(email: str, ticket: str, language: Optional[str] = None) -> str:
     """
-    Sends a verification email with a generated verification code to the given email address.
+    Sends a verification email with the code kept under the given mail ticket.
+
+    The code is generated and stored by the caller before the task is
+    queued, so the task itself writes nothing. Only the ticket travels
+    through the broker; it is removed once the email is sent. A ticket
+    that has already expired means the code has too, so nothing is sent.
 
     Args:
         email (str): The email address to which the verification code will be sent.
+        ticket (str): The mail ticket issued for the code.
+        language (Optional[str]): The language of the email, LANGUAGE_CODE if omitted.
+
+    Returns:
+        str: A message indicating whether the email has been sent.
+    """
+    verification_code = read_mail_ticket(ticket)
+    if verification_code is None:
+        return f"Verification code for {email} expired before it was sent"
+
+    smtp_connection.send_messages([
+        build_verification_email(email, verification_code, language)
+    ])
+    delete_mail_ticket(ticket)
+
+    return f"Verification email sent successfully to {email}"
+
+
+@shared_task(ignore_result=True)
+def send_queued_emails() -> str:
+    """
+    Drains the mail queue in batches, sending every batch over the pooled
+    SMTP connection instead of one session per email.
+
+    If the connection is lost, even after reconnecting, the unsent messages
+    are put back at the front of the queue for the next run. A message the
+    server rejects is moved to the dead-letter list instead, so it cannot
+    block the messages behind it, and the drain goes on.
+
+    Returns:
+        str: A summary of the number of emails sent and rejected.
+    """
+    batch_size = getattr(settings, "EMAIL_BATCH_SIZE", 100)
+    sent = rejected = 0
+
+    while True:
+        messages = mail_queue.pop_batch(batch_size)
+        if not messages:
+            break
+        try:
+            sent += smtp_connection.send_messages(messages)
+        except EmailBatchError as error:
+            sent += error.sent
+            if is_connection_lost(error.error):
+                mail_queue.requeue(error.unsent)
+                raise
+
+            refused, *rest = error.unsent
+            logger.error(f"Email to {', '.join(refused.to)} rejected, moved to the dead-letter list: {error.error}")
+            mail_queue.dead_letter(refused, error.error)
+            mail_queue.requeue(rest)
+            rejected += 1
+
+    return f"Sent {sent} queued emails, {rejected} rejected"
+
+
+@shared_task(ignore_result=True)
+def purge_expired_verification_rows() -> str:
+    """
+    Deletes expired verification codes and rate-limit rows in primary-key
+    batches, so the tables and their email indexes stop growing forever.
+
+    Returns:
+        str: A summary of the number of rows purged.
+    """
+    batch_size = getattr(settings, "PURGE_BATCH_SIZE", 1000)
+    code_ttl = getattr(settings, "VERIFICATION_CODE_TTL", 180)
+
+    codes_deleted = delete_in_batches(
+        VerificationCode.objects.filter(
+            created_at__lte=now() - timedelta(seconds=code_ttl)
+        ),
+        batch_size
+    )
+    messages_deleted = delete_in_batches(
+        DailyMessage.objects.filter(
+            message_sent_at__lte=now() - DailyMessageLimit.get_solo().reset_time
+        ),
+        batch_size
+    )
+
+    return (
+        f"Purged {codes_deleted} verification codes "
+        f"and {messages_deleted} daily messages"
+    )
+
+
+@shared_task(ignore_result=True)
+def purge_expired_tokens() -> str:
+    """
+    Deletes expired outstanding refresh tokens and their blacklist entries in
+    primary-key batches. Expired tokens are rejected on their own, so the rows
+    serve no purpose once the expiry has passed.
+
+    Returns:
+        str: A summary of the number of rows purged.
+    """
+    batch_size = getattr(settings, "PURGE_BATCH_SIZE", 1000)
+    current_time = now()
+
+    blacklisted_deleted = delete_in_batches(
+        BlacklistedToken.objects.filter(token__expires_at__lte=current_time),
+        batch_size
+    )
+    outstanding_deleted = delete_in_batches(
+        OutstandingToken.objects.filter(expires_at__lte=current_time),
+        batch_size
+    )
+
+    return (
+        f"Purged {outstanding_deleted} outstanding tokens "
+        f"and {blacklisted_deleted} blacklisted tokens"
+    )
+
+
+@shared_task(ignore_result=True)
+def sync_token_blacklist_task() -> str:
+    """
+    Rebuilds the Redis mirror of the token blacklist if it has been lost.
+
+    Returns:
+        str: A summary of the number of tokens mirrored.
+    """
+    mirrored = sync_token_blacklist(getattr(settings, "PURGE_BATCH_SIZE", 1000))
+    return f"Mirrored {mirrored} blacklisted tokens"
+
+
+@shared_task(ignore_result=True)
+def relay_outbox_task() -> str:
+    """
+    Publishes outbox messages that were not published when their
+    transaction committed, e.g. because the broker was down.
+
+    Returns:
+        str: A summary of the number of messages published.
+    """
+    batch_size = getattr(settings, "OUTBOX_BATCH_SIZE", 100)
+    total = 0
+
+    while True:
+        relayed = relay_outbox(batch_size)
+        total += relayed
+        if relayed < batch_size:
+            break
+
+    return f"Relayed {total} outbox messages"
+
+
+@shared_task(ignore_result=True)
+def purge_dispatched_outbox() -> str:
+    """
+    Deletes outbox messages dispatched more than OUTBOX_RETENTION seconds
+    ago, in primary-key batches. Until then their dedupe keys still drop
+    duplicates.
 
     Returns:
-        str: A success message indicating that the email has been sent.
+        str: A summary of the number of rows purged.
     """
-    verification_code = create_verification_code(email)
-    sender_email = os.getenv("EMAIL_HOST_USER")
+    retention = getattr(settings, "OUTBOX_RETENTION", 3600)
 
-    send_mail(
-        "Email Verification",
-        f"Your verification code is: {verification_code}",
-        sender_email,
-        [email],
-        fail_silently=False,
+    deleted = delete_in_batches(
+        OutboxMessage.objects.filter(
+            dispatched_at__lte=now() - timedelta(seconds=retention)
+        ),
+        getattr(settings, "PURGE_BATCH_SIZE", 1000)
     )
 
-    return f"Verification email sent successfully to {email}"
\ No newline at end of file
+    return f"Purged {deleted} outbox messages"
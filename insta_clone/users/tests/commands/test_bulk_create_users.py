@@ -0,0 +1,106 @@
+import json
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+User = get_user_model()
+
+
+@pytest.fixture
+def csv_file(tmp_path) -> str:
+    """Writes a CSV file with two new users sharing a name and a repeated email."""
+
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "email,password,first_name,last_name,bio\n"
+        "john1@example.com,secret123,John,Smith,Hello\n"
+        "john2@example.com,secret123,John,Smith,\n"
+        "john1@EXAMPLE.COM,other,John,Smith,\n"
+    )
+    return str(path)
+
+
+@pytest.mark.django_db
+def test_bulk_create_from_csv(csv_file: str) -> None:
+    """Tests that users are created with hashed passwords and unique slugs."""
+
+    User.objects.create_user(email="taken@example.com", password="x", first_name="John", last_name="Smith")
+
+    call_command("bulk_create_users", csv_file, workers=2, batch_size=2)
+
+    john1 = User.objects.get(email="john1@example.com")
+    john2 = User.objects.get(email="john2@example.com")
+    assert john1.check_password("secret123")
+    assert john1.bio == "Hello"
+    assert john2.bio is None
+    assert {john1.slug, john2.slug} == {"john-smith-1", "john-smith-2"}
+    assert User.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_create_from_jsonl_skips_existing(tmp_path) -> None:
+    """Tests that JSONL rows are read and existing emails are left untouched."""
+
+    existing = User.objects.create_user(email="old@example.com", password="keep")
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in [
+        {"email": "old@example.com", "password": "changed"},
+        {"email": "new@example.com"},
+    ]))
+
+    call_command("bulk_create_users", str(path), workers=1)
+
+    existing.refresh_from_db()
+    assert existing.check_password("keep")
+    new_user = User.objects.get(email="new@example.com")
+    assert not new_user.has_usable_password()
+    assert new_user.slug == "new"
+
+
+@pytest.mark.django_db
+def test_bulk_create_retries_taken_slug(csv_file: str, mocker) -> None:
+    """Tests that a slug taken after the batch was built is reassigned."""
+
+    from users.management.commands.bulk_create_users import Command
+
+    original = Command.build_users
+
+    def build_then_register(self, *args, **kwargs):
+        users = original(self, *args, **kwargs)
+        User.objects.create(email="racer@example.com", slug=users[0].slug)
+        return users
+
+    mocker.patch.object(Command, "build_users", build_then_register)
+    call_command("bulk_create_users", csv_file, workers=1, batch_size=10)
+
+    slugs = set(User.objects.values_list("slug", flat=True))
+    assert len(slugs) == User.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_create_keeps_hashed_passwords(tmp_path) -> None:
+    """Tests that existing password hashes are stored without hashing them again."""
+
+    from django.contrib.auth.hashers import make_password
+
+    path = tmp_path / "users.jsonl"
+    path.write_text(json.dumps({"email": "moved@example.com", "password": make_password("secret123")}))
+
+    call_command("bulk_create_users", str(path), workers=1, hashed_passwords=True)
+
+    assert User.objects.get(email="moved@example.com").check_password("secret123")
+
+
+@pytest.mark.django_db
+def test_bulk_create_drops_cached_missing_slug(tmp_path) -> None:
+    """Tests that a slug looked up before it was provisioned resolves afterwards."""
+
+    from services.users import resolve_user
+
+    assert resolve_user("fresh") is None
+    path = tmp_path / "users.jsonl"
+    path.write_text(json.dumps({"email": "fresh@example.com"}))
+
+    call_command("bulk_create_users", str(path), workers=1)
+
+    assert resolve_user("fresh").email == "fresh@example.com"
@@ -0,0 +1,42 @@
+import pytest
+from django.core.management import call_command
+from users.models import CustomUser, Follow
+from utils.leaderboard import FOLLOWERS_LEADERBOARD, POST_LIKES_LEADERBOARD
+
+
+@pytest.fixture
+def users(db) -> list:
+    """
+    Creates and returns three users.
+    """
+    return [
+        CustomUser.objects.create_user(email=f"user{i}@example.com", password="password123")
+        for i in range(3)
+    ]
+
+@pytest.mark.django_db
+def test_rebuild_leaderboards(users: list) -> None:
+    """
+    Test that the rebuild recomputes scores and drops stale members.
+    """
+    Follow.objects.create(follower=users[1], followed=users[0])
+    Follow.objects.create(follower=users[2], followed=users[0])
+    Follow.objects.create(follower=users[0], followed=users[1])
+    FOLLOWERS_LEADERBOARD._incr(users[2].id, 5)
+
+    call_command("rebuild_leaderboards", batch_size=1)
+
+    assert FOLLOWERS_LEADERBOARD.top(10) == [(users[0].id, 2), (users[1].id, 1)]
+
+@pytest.mark.django_db
+def test_rebuild_single_leaderboard(users: list) -> None:
+    """
+    Test that --table only rebuilds the leaderboard of that table.
+    """
+    Follow.objects.create(follower=users[1], followed=users[0])
+    POST_LIKES_LEADERBOARD._incr(42, 3)
+
+    call_command("rebuild_leaderboards", table=["follows"])
+
+    assert FOLLOWERS_LEADERBOARD.top(10) == [(users[0].id, 1)]
+    assert POST_LIKES_LEADERBOARD.top(10) == [(42, 3)]
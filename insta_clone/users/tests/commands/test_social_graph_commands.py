@@ -0,0 +1,61 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from users.models import Follow
+from utils.leaderboard import FOLLOWERS_LEADERBOARD
+
+User = get_user_model()
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="COPY requires PostgreSQL."
+)
+
+
+@pytest.fixture
+def follows(db) -> list:
+    """Creates two follow relationships between three users."""
+
+    user1 = User.objects.create_user(email="user1@example.com", password="testpass")
+    user2 = User.objects.create_user(email="user2@example.com", password="testpass")
+    user3 = User.objects.create_user(email="user3@example.com", password="testpass")
+    return [
+        Follow.objects.create(follower=user1, followed=user2),
+        Follow.objects.create(follower=user2, followed=user3),
+    ]
+
+
+@requires_postgresql
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("file_format", ["csv", "binary"])
+def test_export_import_round_trip(follows: list, tmp_path, file_format: str) -> None:
+    """Tests that an exported table can be re-imported without duplicating rows."""
+
+    call_command(
+        "export_social_graph", "follows",
+        output_dir=str(tmp_path), format=file_format, gzip=True
+    )
+    extension = "csv" if file_format == "csv" else "bin"
+    path = tmp_path / f"follows.{extension}.gz"
+    assert path.exists()
+
+    follows[1].delete()
+    call_command("import_social_graph", "follows", str(path))
+
+    assert Follow.objects.count() == 2
+    assert dict(FOLLOWERS_LEADERBOARD.top(10)) == {
+        follows[0].followed_id: 1,
+        follows[1].followed_id: 1,
+    }
+
+
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="Checks non-PostgreSQL databases.")
+@pytest.mark.django_db
+def test_export_requires_postgresql(tmp_path) -> None:
+    """Tests that the export refuses to run on databases without COPY."""
+
+    with pytest.raises(CommandError):
+        call_command("export_social_graph", output_dir=str(tmp_path))
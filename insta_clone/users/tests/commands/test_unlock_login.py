@@ -0,0 +1,38 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from services.auth import login_throttle
+
+
+@pytest.fixture
+def locked_ip() -> str:
+    """Locks out an IP that failed to log in to many accounts."""
+
+    ip = "203.0.113.7"
+    login_throttle.unlock("ip", ip)
+    for i in range(login_throttle.limits["ip"]):
+        login_throttle.register_failure(ip, f"user{i}@example.com")
+    for i in range(login_throttle.limits["ip"]):
+        login_throttle.unlock("email", f"user{i}@example.com")
+    return ip
+
+
+def test_list_and_unlock_ip(locked_ip: str) -> None:
+    """Tests that a locked-out IP is listed and can be unlocked."""
+
+    out = StringIO()
+    call_command("unlock_login", "--list", stdout=out)
+    assert f"ip {locked_ip} locked for" in out.getvalue()
+
+    call_command("unlock_login", "--ip", locked_ip, stdout=StringIO())
+
+    assert login_throttle.retry_after(locked_ip, "new@example.com") == 0
+    assert locked_ip not in login_throttle.locked("ip")
+
+
+def test_unlock_requires_target() -> None:
+    """Tests that the command refuses to run without anything to do."""
+
+    with pytest.raises(CommandError):
+        call_command("unlock_login")
@@ -0,0 +1,80 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from users.models import Block, Mute, Follow
+from services.users import get_hidden_user_ids
+
+User = get_user_model()
+
+
+@pytest.fixture
+def users(db) -> list:
+    """Creates and returns three users."""
+
+    return [
+        User.objects.create_user(email=f"user{i}@example.com", password="testpass")
+        for i in range(1, 4)
+    ]
+
+
+@pytest.mark.django_db
+def test_toggle_block_removes_follows(users: list) -> None:
+    """
+    Test that blocking a user removes the follow relationship in both directions.
+    """
+    user1, user2, _ = users
+    Follow.objects.create(follower=user1, followed=user2)
+    Follow.objects.create(follower=user2, followed=user1)
+
+    assert Block.toggle_block(user1, user2) is True
+    assert Block.objects.filter(blocker=user1, blocked=user2).exists()
+    assert not Follow.objects.filter(follower=user1, followed=user2).exists()
+    assert not Follow.objects.filter(follower=user2, followed=user1).exists()
+
+    assert Block.toggle_block(user1, user2) is False
+    assert not Block.objects.filter(blocker=user1, blocked=user2).exists()
+
+
+@pytest.mark.django_db
+def test_self_block_validation(users: list) -> None:
+    """
+    Test that a user cannot block themselves.
+    """
+    block = Block(blocker=users[0], blocked=users[0])
+
+    with pytest.raises(ValidationError):
+        block.full_clean()
+
+
+@pytest.mark.django_db
+def test_toggle_mute(users: list) -> None:
+    """
+    Test that toggle_mute creates and removes a mute.
+    """
+    user1, user2, _ = users
+
+    assert Mute.toggle_mute(user1, user2) is True
+    assert Mute.objects.filter(muter=user1, muted=user2).exists()
+    assert Mute.toggle_mute(user1, user2) is False
+    assert not Mute.objects.filter(muter=user1, muted=user2).exists()
+
+
+@pytest.mark.django_db
+def test_hidden_user_ids(users: list, django_assert_num_queries) -> None:
+    """
+    Test that hidden user ids cover blocks in both directions and mutes,
+    are cached, and are invalidated when a block changes.
+    """
+    user1, user2, user3 = users
+    Block.objects.create(blocker=user2, blocked=user1)
+    Mute.objects.create(muter=user1, muted=user3)
+
+    assert get_hidden_user_ids(user1.id) == {user2.id, user3.id}
+
+    with django_assert_num_queries(0):
+        assert get_hidden_user_ids(user1.id, include_muted=False) == {user2.id}
+
+    Block.toggle_block(user2, user1)
+
+    assert get_hidden_user_ids(user1.id) == {user3.id}
+    assert get_hidden_user_ids(user3.id) == set()
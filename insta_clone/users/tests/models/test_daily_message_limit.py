@@ -42,3 +42,21 @@ class TestDailyMessageLimit:
 
         expected_str = "Daily Limit: 3 Expiration Time: 0:03:00 Reset Time: 1 day, 0:00:00"
         assert str(limit_obj) == expected_str
+
+    def test_get_solo_is_cached(self, django_assert_num_queries, django_capture_on_commit_callbacks):
+        """
+        Test that the configuration is read from the cache and reloaded after an edit.
+        """
+        limit_obj = DailyMessageLimit.get_solo()
+        assert limit_obj.id == 1
+
+        with django_assert_num_queries(0):
+            assert DailyMessageLimit.get_solo().limit == limit_obj.limit
+
+        with django_capture_on_commit_callbacks(execute=True):
+            limit_obj.limit = 10
+            limit_obj.save()
+
+        assert DailyMessageLimit.get_solo().limit == 10
+        with django_assert_num_queries(0):
+            assert DailyMessageLimit.get_solo().limit == 10
@@ -82,3 +82,26 @@ def test_toggle_follow_remove() -> None:
     
     assert Follow.toggle_follow(user1, user2) is False
     assert not Follow.objects.filter(follower=user1, followed=user2).exists()
+
+
+@pytest.mark.django_db
+def test_relationship_status(django_assert_num_queries) -> None:
+    """
+    Test the relationship_status method for a batch of slugs.
+
+    Asserts that follow-in and follow-out flags are correct and that the
+    lookup runs in exactly two queries.
+    """
+    user1 = User.objects.create_user(email="user1@example.com", password="testpass")
+    user2 = User.objects.create_user(email="user2@example.com", password="testpass")
+    user3 = User.objects.create_user(email="user3@example.com", password="testpass")
+
+    Follow.objects.create(follower=user1, followed=user2)
+    Follow.objects.create(follower=user3, followed=user1)
+
+    with django_assert_num_queries(2):
+        status = Follow.relationship_status(user1, [user2.slug, user3.slug, "unknown"])
+
+    assert status[user2.slug] == {"following": True, "followed_by": False}
+    assert status[user3.slug] == {"following": False, "followed_by": True}
+    assert status["unknown"] == {"following": False, "followed_by": False}
@@ -1,5 +1,7 @@
+from unittest import mock
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from utils.slug_manager import generate_unique_slug
 
 
 class UsersManagersTests(TestCase):
@@ -86,3 +88,78 @@ class CustomUserSlugTests(TestCase):
             last_name="Smith"
         )
         self.assertNotEqual(user1.slug, user2.slug)
+
+    def test_slug_uses_next_free_suffix_in_one_query(self) -> None:
+        """Slug should continue after the highest numeric suffix, ignoring non-numeric ones."""
+        self.User.objects.bulk_create([
+            self.User(email="a@example.com", slug="alice-smith"),
+            self.User(email="b@example.com", slug="alice-smith-7"),
+            self.User(email="c@example.com", slug="alice-smith-jr"),
+            self.User(email="d@example.com", slug="alice-smithson-9"),
+        ])
+
+        with self.assertNumQueries(1):
+            slug = generate_unique_slug("Alice Smith", self.User)
+
+        self.assertEqual(slug, "alice-smith-8")
+
+    def test_slug_ignores_suffixes_too_large_for_bigint(self) -> None:
+        """Slug generation should not fail on numeric suffixes that overflow a bigint."""
+        self.User.objects.bulk_create([
+            self.User(email="a@example.com", slug="john"),
+            self.User(email="b@example.com", slug="john-99999999999999999999"),
+            self.User(email="c@example.com", slug="john-9223372036854775807"),
+        ])
+
+        self.assertEqual(generate_unique_slug("John", self.User), "john-1")
+
+    def test_slug_falls_back_to_random_suffix_at_the_limit(self) -> None:
+        """Slug should still be free once the largest counted suffix is taken."""
+        self.User.objects.bulk_create([
+            self.User(email="a@example.com", slug="john"),
+            self.User(email="b@example.com", slug="john-999999999999999999"),
+        ])
+
+        slug = generate_unique_slug("John", self.User)
+
+        self.assertRegex(slug, r"^john-[1-9][0-9]*$")
+        self.assertFalse(self.User.objects.filter(slug=slug).exists())
+
+    def test_slug_skips_reserved_route_names(self) -> None:
+        """Slug should never be a word routed under users/, such as "relationships"."""
+        user = self.User.objects.create_user(
+            email="relationships@example.com",
+            password="password123"
+        )
+        self.assertEqual(user.slug, "relationships-1")
+
+    def test_slug_skips_leaderboard_route(self) -> None:
+        """Slug should never be "leaderboard", which users/leaderboard/ shadows."""
+        user = self.User.objects.create_user(
+            email="someone@example.com",
+            password="password123",
+            first_name="Leaderboard"
+        )
+        self.assertEqual(user.slug, "leaderboard-1")
+
+    def test_slug_retries_after_concurrent_registration(self) -> None:
+        """Slug should be regenerated when another registration takes it first."""
+        self.User.objects.create_user(
+            email="user1@example.com",
+            password="password123",
+            first_name="Alice",
+            last_name="Smith"
+        )
+
+        with mock.patch(
+            "users.models.user.generate_unique_slug",
+            side_effect=["alice-smith", "alice-smith-1"]
+        ):
+            user = self.User.objects.create_user(
+                email="user2@example.com",
+                password="password123",
+                first_name="Alice",
+                last_name="Smith"
+            )
+
+        self.assertEqual(user.slug, "alice-smith-1")
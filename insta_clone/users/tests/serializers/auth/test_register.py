@@ -9,6 +9,14 @@ from rest_framework.exceptions import ValidationError
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def database_verification_codes(settings) -> None:
+    """
+    Stores verification codes in the VerificationCode table, the fallback backend.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+
+
 @pytest.mark.django_db
 class TestRegisterSerializer:
     """
@@ -94,4 +102,4 @@ class TestRegisterSerializer:
         with pytest.raises(ValidationError) as exc_info:
             serializer.is_valid(raise_exception=True)
 
-        assert "Verification code is invalid or expired." in str(exc_info.value)
+        assert "Invalid or expired verification code." in str(exc_info.value)
@@ -7,6 +7,14 @@ from users.serializers import ResetPasswordSerializer
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def database_verification_codes(settings) -> None:
+    """
+    Stores verification codes in the VerificationCode table, the fallback backend.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+
+
 @pytest.fixture
 def user() -> User:
     """
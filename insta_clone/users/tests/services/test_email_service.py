@@ -0,0 +1,41 @@
+from django.template import engines
+from django.template.loaders.cached import Loader as CachedLoader
+from services.auth import build_verification_email
+
+
+def test_verification_email_is_multipart() -> None:
+    """
+    Test that the verification email has a text body and an HTML alternative with the code.
+    """
+    message = build_verification_email("test@example.com", "123456")
+
+    assert message.to == ["test@example.com"]
+    assert message.subject == "Email Verification"
+    assert "Your verification code is: 123456" in message.body
+
+    html_body, mimetype = message.alternatives[0]
+    assert mimetype == "text/html"
+    assert "123456" in html_body
+    assert '<html lang="en-us">' in html_body
+
+def test_verification_email_language() -> None:
+    """
+    Test that the email is rendered in the requested language.
+    """
+    message = build_verification_email("test@example.com", "123456", language="de")
+
+    assert '<html lang="de">' in message.alternatives[0][0]
+
+def test_templates_compiled_once() -> None:
+    """
+    Test that templates are loaded through the cached loader and parsed only once.
+    """
+    engine = engines["django"].engine
+    loader = engine.template_loaders[0]
+    assert isinstance(loader, CachedLoader)
+
+    build_verification_email("a@example.com", "111111")
+    template = engine.get_template("users/emails/verification_code.html")
+    build_verification_email("b@example.com", "222222")
+
+    assert engine.get_template("users/emails/verification_code.html") is template
@@ -0,0 +1,103 @@
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from services.auth import LoginThrottle
+from users.admin import CustomUserAdmin
+
+User = get_user_model()
+
+
+@pytest.fixture
+def throttle() -> LoginThrottle:
+    """
+    Provides a throttle that locks out after three failures.
+    """
+    return LoginThrottle(
+        limits={"ip": 10, "email": 3},
+        window=900,
+        lockout_base=60,
+        lockout_max=200
+    )
+
+def test_lockout_after_limit(throttle: LoginThrottle) -> None:
+    """
+    Test that an email is locked out once it reaches its failure limit.
+    """
+    assert throttle.register_failure("10.0.0.1", "a@example.com") == 0
+    assert throttle.register_failure("10.0.0.1", "a@example.com") == 0
+    assert throttle.retry_after("10.0.0.1", "a@example.com") == 0
+
+    assert throttle.register_failure("10.0.0.1", "A@example.com") == 60
+    assert throttle.retry_after("10.0.0.2", "a@example.com") == 60
+    assert throttle.retry_after("10.0.0.1", "b@example.com") == 0
+
+def test_lockout_doubles_up_to_max(throttle: LoginThrottle) -> None:
+    """
+    Test that every further lockout doubles, capped at the maximum.
+    """
+    durations = []
+    for _ in range(3):
+        for _ in range(3):
+            retry_after = throttle.register_failure(None, "a@example.com")
+        durations.append(retry_after)
+
+    assert durations == [60, 120, 200]
+
+def test_ip_locked_across_emails(throttle: LoginThrottle) -> None:
+    """
+    Test that one IP guessing many accounts is locked out by its own limit.
+    """
+    for i in range(10):
+        throttle.register_failure("10.0.0.1", f"user{i}@example.com")
+
+    assert throttle.retry_after("10.0.0.1", "new@example.com") == 60
+    assert throttle.retry_after("10.0.0.2", "new@example.com") == 0
+
+def test_unlock_clears_lockout(throttle: LoginThrottle) -> None:
+    """
+    Test that unlocking removes the lockout and its history.
+    """
+    for _ in range(3):
+        throttle.register_failure(None, "a@example.com")
+    throttle.unlock("email", "a@example.com")
+
+    assert throttle.retry_after(None, "a@example.com") == 0
+    for _ in range(3):
+        retry_after = throttle.register_failure(None, "a@example.com")
+    assert retry_after == 60
+
+@pytest.mark.django_db
+def test_locked_login_skips_authentication(mocker) -> None:
+    """
+    Test that a locked-out login answers 429 without hashing the password.
+    """
+    User.objects.create_user(email="locked@example.com", password="secret123")
+    client = APIClient()
+    for _ in range(5):
+        client.post("/api/v1/users/login/", {"email": "locked@example.com", "password": "wrong"})
+
+    authenticate = mocker.patch("users.serializers.auth.session_serializers.authenticate")
+    response = client.post("/api/v1/users/login/", {"email": "locked@example.com", "password": "secret123"})
+
+    assert response.status_code == 429
+    assert int(response["Retry-After"]) > 0
+    authenticate.assert_not_called()
+
+@pytest.mark.django_db
+def test_admin_unlock_action(rf) -> None:
+    """
+    Test that the admin action lets a locked-out user log in again.
+    """
+    user = User.objects.create_user(email="locked@example.com", password="secret123")
+    client = APIClient()
+    for _ in range(5):
+        client.post("/api/v1/users/login/", {"email": "locked@example.com", "password": "wrong"})
+
+    model_admin = CustomUserAdmin(User, AdminSite())
+    request = rf.post("/admin/")
+    model_admin.message_user = lambda *args, **kwargs: None
+    model_admin.unlock_login(request, User.objects.filter(pk=user.pk))
+
+    response = client.post("/api/v1/users/login/", {"email": "locked@example.com", "password": "secret123"})
+    assert response.status_code == 200
@@ -0,0 +1,88 @@
+import pytest
+from datetime import timedelta
+from django.utils.timezone import now
+from kombu.exceptions import OperationalError
+from services.outbox import enqueue_task, relay_outbox
+from users.models import OutboxMessage
+from users.tasks import purge_dispatched_outbox, relay_outbox_task
+from utils.metrics import metrics
+from utils.task_metrics import task_metrics
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def celery_app(mocker):
+    """
+    Replaces the Celery app used by the relay, so nothing reaches the broker.
+    """
+    metrics.clear()
+    task_metrics.clear()
+    return mocker.patch("services.outbox.dispatch.current_app")
+
+def test_enqueue_publishes_after_commit(celery_app, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that a message is only published once its transaction commits.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        assert enqueue_task("users.tasks.example", args=[1], kwargs={"a": 2})
+        celery_app.send_task.assert_not_called()
+
+    celery_app.send_task.assert_called_once_with("users.tasks.example", args=[1], kwargs={"a": 2})
+    assert OutboxMessage.objects.get().dispatched_at is not None
+    task_metrics.flush(force=True)
+    assert task_metrics.get("outbox_dispatched_total", "users.tasks.example") == 1
+    assert "outbox_relay_seconds_count 1" in task_metrics.render()
+
+def test_enqueue_drops_duplicates(celery_app) -> None:
+    """
+    Test that a second message with the same dedupe key is not written.
+    """
+    assert enqueue_task("users.tasks.example", dedupe_key="example:1")
+    assert not enqueue_task("users.tasks.example", dedupe_key="example:1")
+
+    assert OutboxMessage.objects.count() == 1
+    assert metrics.get("outbox_deduplicated_total") == 1
+
+def test_relay_publishes_in_order(celery_app) -> None:
+    """
+    Test that the relay publishes pending messages oldest first, in bounded batches.
+    """
+    OutboxMessage.objects.bulk_create([
+        OutboxMessage(task_name=f"users.tasks.task_{i}") for i in range(5)
+    ])
+
+    assert relay_outbox(batch_size=3) == 3
+
+    published = [call.args[0] for call in celery_app.send_task.call_args_list]
+    assert published == ["users.tasks.task_0", "users.tasks.task_1", "users.tasks.task_2"]
+    assert OutboxMessage.objects.filter(dispatched_at__isnull=True).count() == 2
+
+def test_relay_keeps_messages_when_broker_down(celery_app) -> None:
+    """
+    Test that messages stay pending when publishing fails, and are relayed later.
+    """
+    OutboxMessage.objects.bulk_create([
+        OutboxMessage(task_name=f"users.tasks.task_{i}") for i in range(3)
+    ])
+    celery_app.send_task.side_effect = [None, OperationalError("down"), None, None]
+
+    assert relay_outbox() == 1
+    assert OutboxMessage.objects.filter(dispatched_at__isnull=True).count() == 2
+    task_metrics.flush(force=True)
+    assert task_metrics.get("outbox_publish_failed_total", "users.tasks.task_1") == 1
+
+    assert relay_outbox_task() == "Relayed 2 outbox messages"
+    assert not OutboxMessage.objects.filter(dispatched_at__isnull=True).exists()
+
+def test_purge_dispatched_outbox(settings) -> None:
+    """
+    Test that only messages dispatched before the retention period are purged.
+    """
+    settings.OUTBOX_RETENTION = 3600
+    OutboxMessage.objects.create(task_name="old", dispatched_at=now() - timedelta(hours=2))
+    OutboxMessage.objects.create(task_name="recent", dispatched_at=now())
+    OutboxMessage.objects.create(task_name="pending")
+
+    assert purge_dispatched_outbox() == "Purged 1 outbox messages"
+    assert set(OutboxMessage.objects.values_list("task_name", flat=True)) == {"recent", "pending"}
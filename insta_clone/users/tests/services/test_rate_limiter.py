@@ -0,0 +1,82 @@
+import pytest
+from datetime import timedelta
+from users.models import DailyMessage, DailyMessageLimit
+from services.auth import check_message_rate_limit
+from utils.rate_limiter import SlidingWindowRateLimiter
+
+
+@pytest.fixture
+def limiter() -> SlidingWindowRateLimiter:
+    """
+    Provides a rate limiter with its own key prefix.
+    """
+    return SlidingWindowRateLimiter("ratelimit:test")
+
+@pytest.fixture
+def clock(mocker):
+    """
+    Freezes the limiter's clock; tests move it by changing return_value.
+    """
+    return mocker.patch("utils.rate_limiter.time.time", return_value=1_000_000.0)
+
+def test_limit_within_window(limiter: SlidingWindowRateLimiter, clock) -> None:
+    """
+    Test that hits over the limit are rejected until the oldest one leaves the window.
+    """
+    for _ in range(3):
+        assert limiter.hit("a@example.com", limit=3, window=60).allowed
+
+    result = limiter.hit("a@example.com", limit=3, window=60)
+    assert not result.allowed
+    assert result.reason == "limit"
+    assert result.retry_after == 60
+
+    clock.return_value += 61
+    assert limiter.hit("a@example.com", limit=3, window=60).allowed
+
+def test_cooldown_between_hits(limiter: SlidingWindowRateLimiter, clock) -> None:
+    """
+    Test that a hit inside the cooldown is rejected and not recorded.
+    """
+    assert limiter.hit("a@example.com", limit=3, window=60, cooldown=10).allowed
+
+    clock.return_value += 4
+    result = limiter.hit("a@example.com", limit=3, window=60, cooldown=10)
+    assert result == (False, "cooldown", 6)
+
+    clock.return_value += 6
+    assert limiter.hit("a@example.com", limit=3, window=60, cooldown=10).allowed
+    assert limiter.redis.zcard(limiter.get_key("a@example.com")) == 2
+
+def test_identifiers_are_independent(limiter: SlidingWindowRateLimiter, clock) -> None:
+    """
+    Test that each identifier has its own window.
+    """
+    assert limiter.hit("a@example.com", limit=1, window=60).allowed
+    assert limiter.hit("b@example.com", limit=1, window=60).allowed
+    assert not limiter.hit("a@example.com", limit=1, window=60).allowed
+
+    limiter.reset("a@example.com")
+    assert limiter.hit("a@example.com", limit=1, window=60).allowed
+
+@pytest.mark.django_db
+def test_check_message_rate_limit_uses_daily_limit(clock) -> None:
+    """
+    Test that the message limiter applies the DailyMessageLimit settings without writing rows.
+    """
+    DailyMessageLimit.objects.create(
+        id=1,
+        limit=2,
+        expiration_time=timedelta(minutes=3),
+        reset_time=timedelta(hours=24)
+    )
+
+    assert check_message_rate_limit("a@example.com") is None
+    assert "Please, try again in" in check_message_rate_limit("a@example.com")
+
+    clock.return_value += 180
+    assert check_message_rate_limit("a@example.com") is None
+
+    clock.return_value += 180
+    assert "You have reached your daily message limit" in check_message_rate_limit("a@example.com")
+    assert not DailyMessage.objects.exists()
@@ -0,0 +1,163 @@
+import json
+import smtplib
+import pytest
+from unittest.mock import MagicMock
+from django.core import mail
+from django.core.mail import EmailMessage
+from services.auth import RedisVerificationCodeStore, read_mail_ticket
+from users.tasks import send_queued_emails, send_verification_email
+from utils.mail_queue import mail_queue
+from utils.metrics import metrics
+from utils.smtp_pool import EmailBatchError, PooledSMTPConnection
+
+
+def make_message(i: int) -> EmailMessage:
+    return EmailMessage(f"Subject {i}", f"Body {i}", "noreply@example.com", [f"user{i}@example.com"])
+
+
+@pytest.fixture
+def pool() -> PooledSMTPConnection:
+    """
+    Provides an empty pool that checks its session after 30 idle seconds.
+    """
+    metrics.clear()
+    return PooledSMTPConnection(keepalive=30, max_messages=3)
+
+@pytest.fixture
+def backend(mocker) -> MagicMock:
+    """
+    Replaces the email backend with a mock SMTP backend.
+    """
+    connection = MagicMock()
+    connection.connection.noop.return_value = (250, b"OK")
+    mocker.patch("utils.smtp_pool.get_connection", return_value=connection)
+    return connection
+
+@pytest.fixture
+def empty_queue():
+    """
+    Empties the mail queue before and after the test.
+    """
+    mail_queue.redis.delete(mail_queue.key, mail_queue.dead_letter_key)
+    yield mail_queue
+    mail_queue.redis.delete(mail_queue.key, mail_queue.dead_letter_key)
+
+def test_connection_reused(pool: PooledSMTPConnection, backend: MagicMock) -> None:
+    """
+    Test that consecutive sends share one session until max_messages is reached.
+    """
+    assert pool.send_messages([make_message(i) for i in range(3)]) == 3
+    assert metrics.get("smtp_connections_opened_total") == 1
+
+    pool.send_messages([make_message(3)])
+    assert metrics.get("smtp_connections_opened_total") == 2
+    assert metrics.get("emails_sent_total") == 4
+
+def test_reconnect_on_disconnect(pool: PooledSMTPConnection, backend: MagicMock) -> None:
+    """
+    Test that a dropped session is replaced and the message is sent again.
+    """
+    backend.send_messages.side_effect = [smtplib.SMTPServerDisconnected("gone"), 1]
+
+    assert pool.send_messages([make_message(0)]) == 1
+    assert metrics.get("smtp_reconnects_total") == 1
+    assert metrics.get("smtp_connections_opened_total") == 2
+
+def test_idle_connection_checked(pool: PooledSMTPConnection, backend: MagicMock) -> None:
+    """
+    Test that a session idle for longer than keepalive is checked with NOOP.
+    """
+    pool.send_messages([make_message(0)])
+    pool._last_used -= 60
+    backend.connection.noop.return_value = (421, b"Timeout")
+
+    pool.send_messages([make_message(1)])
+    backend.connection.noop.assert_called_once()
+    assert metrics.get("smtp_connections_opened_total") == 2
+
+def test_rejected_message_not_retried(pool: PooledSMTPConnection, backend: MagicMock) -> None:
+    """
+    Test that a refused recipient fails the batch without reconnecting.
+    """
+    backend.send_messages.side_effect = [1, smtplib.SMTPRecipientsRefused({}), 1]
+    messages = [make_message(i) for i in range(3)]
+
+    with pytest.raises(EmailBatchError) as exc_info:
+        pool.send_messages(messages)
+
+    assert exc_info.value.sent == 1
+    assert exc_info.value.unsent == messages[1:]
+    assert metrics.get("smtp_reconnects_total") == 0
+
+def test_send_verification_email() -> None:
+    """
+    Test that the verification email carries the code kept under its ticket,
+    and that the ticket is removed once sent.
+    """
+    ticket = RedisVerificationCodeStore().save("test@example.com", "123456")
+    send_verification_email("test@example.com", ticket)
+
+    assert read_mail_ticket(ticket) is None
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["test@example.com"]
+    assert "123456" in mail.outbox[0].body
+    assert mail.outbox[0].alternatives[0][1] == "text/html"
+
+def test_send_verification_email_expired_ticket() -> None:
+    """
+    Test that nothing is sent once the ticket, and so the code, has expired.
+    """
+    assert send_verification_email("test@example.com", "expired") == (
+        "Verification code for test@example.com expired before it was sent"
+    )
+    assert not mail.outbox
+
+def test_send_queued_emails(settings, empty_queue) -> None:
+    """
+    Test that the queue is drained in batches and emptied.
+    """
+    settings.EMAIL_BATCH_SIZE = 2
+    for i in range(5):
+        empty_queue.push(f"Subject {i}", "Body", [f"user{i}@example.com"])
+
+    assert send_queued_emails() == "Sent 5 queued emails, 0 rejected"
+    assert [message.subject for message in mail.outbox] == [f"Subject {i}" for i in range(5)]
+    assert len(empty_queue) == 0
+
+def test_send_queued_emails_requeues_on_lost_connection(mocker, empty_queue) -> None:
+    """
+    Test that the messages of a batch cut off by a lost connection go back
+    to the front of the queue.
+    """
+    for i in range(3):
+        empty_queue.push(f"Subject {i}", "Body", [f"user{i}@example.com"])
+
+    def fail_after_first(messages):
+        raise EmailBatchError(1, messages[1:], smtplib.SMTPServerDisconnected("Connection lost"))
+
+    mocker.patch("users.tasks.smtp_connection.send_messages", side_effect=fail_after_first)
+    with pytest.raises(EmailBatchError):
+        send_queued_emails()
+
+    assert [message.subject for message in empty_queue.pop_batch(10)] == ["Subject 1", "Subject 2"]
+    assert not empty_queue.redis.llen(empty_queue.dead_letter_key)
+
+def test_send_queued_emails_dead_letters_rejected(
+    pool: PooledSMTPConnection, backend: MagicMock, empty_queue, mocker
+) -> None:
+    """
+    Test that a permanently rejected message is dead-lettered and the rest
+    of the queue is still sent.
+    """
+    mocker.patch("users.tasks.smtp_connection", pool)
+    for i in range(3):
+        empty_queue.push(f"Subject {i}", "Body", [f"user{i}@example.com"])
+    backend.send_messages.side_effect = [1, smtplib.SMTPDataError(554, b"Rejected"), 1]
+
+    assert send_queued_emails() == "Sent 2 queued emails, 1 rejected"
+
+    assert len(empty_queue) == 0
+    dead = [json.loads(entry) for entry in empty_queue.redis.lrange(empty_queue.dead_letter_key, 0, -1)]
+    assert [json.loads(entry["message"])["subject"] for entry in dead] == ["Subject 1"]
+    assert "Rejected" in dead[0]["error"]
+    assert backend.send_messages.call_count == 3
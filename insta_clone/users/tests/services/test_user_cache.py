@@ -0,0 +1,58 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from services.users import resolve_user, resolve_user_id
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_resolve_user_is_cached(django_assert_num_queries) -> None:
+    """Tests that a resolved slug is served from the cache on the next call."""
+
+    user = User.objects.create_user(email="cached@example.com", password="testpass")
+
+    assert resolve_user_id(user.slug) == user.id
+
+    with django_assert_num_queries(0):
+        cached_user = resolve_user(user.slug)
+
+    assert cached_user == user
+    assert cached_user.email == user.email
+
+
+@pytest.mark.django_db
+def test_unknown_slug_is_negatively_cached(django_assert_num_queries) -> None:
+    """Tests that unknown slugs only hit the database once."""
+
+    assert resolve_user("does-not-exist") is None
+
+    with django_assert_num_queries(0):
+        assert resolve_user("does-not-exist") is None
+
+
+@pytest.mark.django_db
+def test_slug_change_invalidates_cache() -> None:
+    """Tests that renaming a slug stops the old slug from resolving."""
+
+    user = User.objects.create_user(email="renamed@example.com", password="testpass")
+    old_slug = user.slug
+    assert resolve_user_id(old_slug) == user.id
+
+    user.slug = "new-slug"
+    user.save()
+
+    assert resolve_user_id(old_slug) is None
+    assert resolve_user_id("new-slug") == user.id
+
+
+@pytest.mark.django_db
+def test_new_user_clears_negative_entry() -> None:
+    """Tests that creating a user makes a previously unknown slug resolvable."""
+
+    assert resolve_user_id("fresh") is None
+
+    user = User.objects.create_user(email="fresh@example.com", password="testpass")
+
+    assert user.slug == "fresh"
+    assert resolve_user_id("fresh") == user.id
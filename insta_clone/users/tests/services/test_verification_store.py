@@ -0,0 +1,167 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from redis.exceptions import ConnectionError as RedisConnectionError
+from users.models import VerificationCode, OutboxMessage
+from users.serializers import RegisterSerializer
+from services.auth import (
+    VerificationCodeUnavailable,
+    RedisVerificationCodeStore,
+    DatabaseVerificationCodeStore,
+    create_verification_code,
+    validate_verification_code,
+    send_verification_code,
+    read_mail_ticket,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def store() -> RedisVerificationCodeStore:
+    """
+    Provides the Redis verification code store.
+    """
+    return RedisVerificationCodeStore()
+
+def test_code_is_consumed_once(store: RedisVerificationCodeStore) -> None:
+    """
+    Test that a valid code can only be used once.
+    """
+    store.save("a@example.com", "123456")
+
+    assert not store.consume("a@example.com", "654321")
+    assert store.consume("a@example.com", "123456")
+    assert not store.consume("a@example.com", "123456")
+
+def test_code_is_hashed_and_expires(store: RedisVerificationCodeStore) -> None:
+    """
+    Test that the plain code is never stored and the key carries the TTL.
+    """
+    store.save("a@example.com", "123456")
+
+    keys = [key.decode() for key in store.redis.keys("verification:*")]
+    assert not any("123456" in key for key in keys)
+    assert all(0 < store.redis.ttl(key) <= 180 for key in keys)
+
+def test_new_code_replaces_previous(store: RedisVerificationCodeStore) -> None:
+    """
+    Test that sending a new code invalidates the previous one.
+    """
+    store.save("a@example.com", "111111")
+    store.save("a@example.com", "222222")
+
+    assert not store.consume("a@example.com", "111111")
+    assert store.consume("a@example.com", "222222")
+
+def test_code_is_bound_to_email(store: RedisVerificationCodeStore) -> None:
+    """
+    Test that a code cannot be used for another email.
+    """
+    store.save("a@example.com", "123456")
+
+    assert not store.consume("b@example.com", "123456")
+
+def test_delete_removes_code(store: RedisVerificationCodeStore) -> None:
+    """
+    Test that deleting the codes of an email invalidates them.
+    """
+    store.save("a@example.com", "123456")
+    store.delete("a@example.com")
+
+    assert not store.consume("a@example.com", "123456")
+
+@pytest.mark.django_db
+def test_database_store_consumes_once() -> None:
+    """
+    Test that the database fallback marks the code as verified exactly once.
+    """
+    store = DatabaseVerificationCodeStore()
+    store.save("a@example.com", "123456")
+
+    assert store.consume("a@example.com", "123456")
+    assert not store.consume("a@example.com", "123456")
+    assert VerificationCode.objects.get(email="a@example.com").is_verified
+
+@pytest.mark.django_db
+def test_register_with_redis_code() -> None:
+    """
+    Test registering with a code stored in Redis, which then cannot be reused.
+    """
+    code, _ = create_verification_code("new@example.com")
+
+    serializer = RegisterSerializer(data={
+        "email": "new@example.com",
+        "verification_code": code,
+        "first_name": "Test",
+        "last_name": "User",
+        "password": "securepassword123",
+    })
+    assert serializer.is_valid(), serializer.errors
+    serializer.save()
+
+    assert User.objects.filter(email="new@example.com").exists()
+    assert not VerificationCode.objects.exists()
+    with pytest.raises(ValueError):
+        validate_verification_code("new@example.com", code)
+
+@pytest.mark.django_db
+def test_register_consumes_code_only_on_save() -> None:
+    """
+    Test that validating a registration checks the code without using it up.
+    """
+    code, _ = create_verification_code("new@example.com")
+    data = {
+        "email": "new@example.com",
+        "verification_code": code,
+        "first_name": "Test",
+        "last_name": "User",
+        "password": "securepassword123",
+    }
+
+    assert RegisterSerializer(data=data).is_valid()
+    assert RedisVerificationCodeStore().exists("new@example.com", code)
+
+def test_save_raises_when_redis_is_down(store: RedisVerificationCodeStore, mocker) -> None:
+    """
+    Test that a Redis outage surfaces as a service error rather than a RedisError.
+    """
+    redis = mocker.patch.object(RedisVerificationCodeStore, "redis", new_callable=mocker.PropertyMock)
+    redis.return_value.getset.side_effect = RedisConnectionError("down")
+
+    with pytest.raises(VerificationCodeUnavailable):
+        store.save("a@example.com", "123456")
+
+@pytest.mark.django_db
+def test_send_code_unavailable_returns_503(client, mocker) -> None:
+    """
+    Test that the send code endpoint answers 503 when codes cannot be stored.
+    """
+    mocker.patch.object(
+        RedisVerificationCodeStore,
+        "save",
+        side_effect=VerificationCodeUnavailable("Verification codes are temporarily unavailable.")
+    )
+
+    response = client.post(reverse("send_verification_code"), {"email": "new@example.com"})
+
+    assert response.status_code == 503
+
+@pytest.mark.django_db
+def test_database_store_sends_without_redis(settings, mocker) -> None:
+    """
+    Test that the database backend keeps the pending code in its row, so
+    sending a code does not need Redis.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+    mocker.patch(
+        "services.auth.verification_store.get_redis_connection",
+        side_effect=RedisConnectionError("down")
+    )
+
+    send_verification_code("a@example.com")
+
+    row = VerificationCode.objects.get(email="a@example.com")
+    ticket = OutboxMessage.objects.get().args[1]
+    assert ticket == str(row.pk)
+    assert read_mail_ticket(ticket) == row.verification_code
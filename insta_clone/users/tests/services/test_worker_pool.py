@@ -0,0 +1,101 @@
+import threading
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from utils.metrics import metrics
+from utils.worker_pool import BoundedWorkerPool, PoolOverloaded
+
+User = get_user_model()
+
+
+@pytest.fixture
+def pool() -> BoundedWorkerPool:
+    """
+    Provides a pool with one worker and room for one queued task.
+    """
+    metrics.clear()
+    return BoundedWorkerPool("test_pool", max_workers=1, max_queue=1)
+
+@pytest.fixture
+def blocked_pool(pool: BoundedWorkerPool):
+    """
+    Fills the pool with tasks that wait until the test releases them.
+    """
+    release = threading.Event()
+    threads = [
+        threading.Thread(target=pool.run, args=(release.wait,))
+        for _ in range(pool.max_workers + pool.max_queue)
+    ]
+    for thread in threads:
+        thread.start()
+    while pool.pending < len(threads):
+        pass
+
+    yield pool
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+def test_run_returns_result(pool: BoundedWorkerPool) -> None:
+    """
+    Test that a task runs on a pool thread and its result is returned.
+    """
+    assert pool.run(lambda: threading.current_thread().name).startswith("test_pool")
+    assert pool.pending == 0
+    assert metrics.get("test_pool_submitted_total") == 1
+    assert metrics.get_summary("test_pool_run_seconds")[0] == 1
+
+def test_run_raises_task_error(pool: BoundedWorkerPool) -> None:
+    """
+    Test that an exception raised by a task reaches the caller and frees its slot.
+    """
+    with pytest.raises(ZeroDivisionError):
+        pool.run(lambda: 1 / 0)
+    assert pool.pending == 0
+
+def test_full_pool_sheds_tasks(blocked_pool: BoundedWorkerPool) -> None:
+    """
+    Test that a task is rejected with a Retry-After hint once the queue is full.
+    """
+    with pytest.raises(PoolOverloaded) as exc_info:
+        blocked_pool.run(lambda: None)
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.wait >= 1
+    assert metrics.get("test_pool_rejected_total") == 1
+
+def test_nested_run_executes_inline(pool: BoundedWorkerPool) -> None:
+    """
+    Test that a task submitting to its own pool does not deadlock.
+    """
+    assert pool.run(lambda: pool.run(lambda: 42)) == 42
+
+@pytest.mark.django_db
+def test_user_password_hashed_on_pool(mocker) -> None:
+    """
+    Test that setting and checking a password both go through the hashing pool.
+    """
+    run = mocker.patch("users.models.user.password_hashing_pool.run", side_effect=lambda f, *a: f(*a))
+    user = User.objects.create_user(email="pool@example.com", password="secret123")
+
+    assert user.check_password("secret123")
+    assert not user.check_password("wrong")
+    assert run.call_count == 3
+
+@pytest.mark.django_db
+def test_outdated_hash_upgraded(settings) -> None:
+    """
+    Test that a hash made with an outdated hasher is replaced after a successful check.
+    """
+    settings.PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+    user = User.objects.create_user(email="upgrade@example.com", password="secret123")
+    User.objects.filter(pk=user.pk).update(password=make_password("secret123", hasher="md5"))
+    user.refresh_from_db()
+
+    assert user.check_password("secret123")
+    user.refresh_from_db()
+    assert user.password.startswith("pbkdf2_sha256$")
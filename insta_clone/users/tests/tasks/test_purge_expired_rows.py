@@ -0,0 +1,46 @@
+import pytest
+from datetime import timedelta
+from django.utils.timezone import now
+from users.models import VerificationCode, DailyMessage
+from users.tasks import purge_expired_verification_rows
+from utils.batch_delete import delete_in_batches
+
+
+@pytest.fixture
+def expired_rows(db) -> None:
+    """
+    Creates a mix of expired and fresh verification codes and daily messages.
+    """
+    for i in range(7):
+        VerificationCode.objects.create(email=f"old{i}@example.com", verification_code="123456")
+        DailyMessage.objects.create(email=f"old{i}@example.com")
+
+    VerificationCode.objects.update(created_at=now() - timedelta(minutes=10))
+    DailyMessage.objects.update(message_sent_at=now() - timedelta(days=2))
+
+    VerificationCode.objects.create(email="new@example.com", verification_code="123456")
+    DailyMessage.objects.create(email="new@example.com")
+
+@pytest.mark.django_db
+def test_purge_expired_verification_rows(settings, expired_rows: None) -> None:
+    """
+    Test that only expired rows are purged, across several batches.
+    """
+    settings.PURGE_BATCH_SIZE = 3
+
+    result = purge_expired_verification_rows()
+
+    assert result == "Purged 7 verification codes and 7 daily messages"
+    assert list(VerificationCode.objects.values_list("email", flat=True)) == ["new@example.com"]
+    assert list(DailyMessage.objects.values_list("email", flat=True)) == ["new@example.com"]
+
+@pytest.mark.django_db
+def test_delete_in_batches_bounds_each_query(expired_rows: None, django_assert_num_queries) -> None:
+    """
+    Test that one DELETE is issued per primary-key range.
+    """
+    queryset = VerificationCode.objects.filter(email__startswith="old")
+
+    # One aggregate for the bounds plus one DELETE per range of two keys.
+    with django_assert_num_queries(5):
+        assert delete_in_batches(queryset, batch_size=2) == 7
@@ -0,0 +1,110 @@
+import time
+import pytest
+from types import SimpleNamespace
+from services.auth import RedisVerificationCodeStore
+from users.tasks import send_verification_email
+from utils.task_metrics import TaskMetrics, task_metrics, record_task_start, stamp_enqueue_time
+
+TASK_NAME = "users.tasks.send_verification_email"
+
+
+@pytest.fixture(autouse=True)
+def clear_task_metrics():
+    """
+    Empties the task metrics before and after each test.
+    """
+    task_metrics.clear()
+    yield
+    task_metrics.clear()
+
+def test_histogram_rendered_cumulatively() -> None:
+    """
+    Test that observations land in cumulative buckets with their sum and count.
+    """
+    for value in (0.003, 0.2, 0.2, 400):
+        task_metrics.observe("celery_task_runtime_seconds", "example", value)
+    task_metrics.flush(force=True)
+
+    rendered = task_metrics.render()
+
+    assert "# TYPE celery_task_runtime_seconds histogram" in rendered
+    assert 'celery_task_runtime_seconds_bucket{task="example",le="0.005"} 1' in rendered
+    assert 'celery_task_runtime_seconds_bucket{task="example",le="0.25"} 3' in rendered
+    assert 'celery_task_runtime_seconds_bucket{task="example",le="300"} 3' in rendered
+    assert 'celery_task_runtime_seconds_bucket{task="example",le="+Inf"} 4' in rendered
+    assert 'celery_task_runtime_seconds_count{task="example"} 4' in rendered
+
+def test_flush_waits_for_interval() -> None:
+    """
+    Test that observations stay in memory until the flush interval has passed.
+    """
+    task_metrics.flush(force=True)
+    task_metrics.incr("celery_task_started_total", "example")
+    task_metrics.flush()
+
+    assert task_metrics.render() == ""
+
+    task_metrics.flush(force=True)
+    assert 'celery_task_started_total{task="example"} 1' in task_metrics.render()
+
+def test_flusher_flushes_idle_process() -> None:
+    """
+    Test that the background thread flushes observations without another task running.
+    """
+    metrics = TaskMetrics("metrics:celery:test", flush_interval=0.05)
+    metrics.clear()
+    metrics.incr("celery_task_started_total", "example")
+    metrics.start_flusher()
+    try:
+        deadline = time.monotonic() + 2
+        while not metrics.render() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        metrics.stop_flusher()
+
+    assert 'celery_task_started_total{task="example"} 1' in metrics.render()
+    metrics.clear()
+
+def test_task_run_recorded() -> None:
+    """
+    Test that running a task records its start, success and runtime.
+    """
+    send_verification_email.apply(args=("test@example.com", RedisVerificationCodeStore().save("test@example.com", "123456")))
+    task_metrics.flush(force=True)
+
+    rendered = task_metrics.render()
+
+    assert f'celery_task_started_total{{task="{TASK_NAME}"}} 1' in rendered
+    assert f'celery_task_succeeded_total{{task="{TASK_NAME}"}} 1' in rendered
+    assert f'celery_task_runtime_seconds_count{{task="{TASK_NAME}"}} 1' in rendered
+
+def test_task_failure_recorded(mocker) -> None:
+    """
+    Test that a task raising an exception is counted as failed.
+    """
+    mocker.patch("users.tasks.build_verification_email", side_effect=RuntimeError("boom"))
+
+    send_verification_email.apply(args=("test@example.com", RedisVerificationCodeStore().save("test@example.com", "123456")))
+    task_metrics.flush(force=True)
+
+    rendered = task_metrics.render()
+
+    assert f'celery_task_failed_total{{task="{TASK_NAME}"}} 1' in rendered
+    assert "celery_task_succeeded_total" not in rendered
+
+def test_queue_wait_recorded() -> None:
+    """
+    Test that the enqueue time stamped on publish is turned into a queue wait.
+    """
+    headers = {}
+    stamp_enqueue_time(headers=headers)
+    headers["enqueued_at"] -= 2
+
+    task = SimpleNamespace(name="example", request=SimpleNamespace(**headers))
+    record_task_start(task_id="1", task=task)
+    task_metrics.flush(force=True)
+
+    rendered = task_metrics.render()
+
+    assert 'celery_task_queue_wait_seconds_bucket{task="example",le="1"} 0' in rendered
+    assert 'celery_task_queue_wait_seconds_bucket{task="example",le="2.5"} 1' in rendered
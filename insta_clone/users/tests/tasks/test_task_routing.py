@@ -0,0 +1,38 @@
+import pytest
+from insta_clone.celery import app
+from users import tasks
+
+
+@pytest.mark.parametrize("task_name, queue", [
+    ("users.tasks.send_verification_email", "email"),
+    ("users.tasks.send_queued_emails", "fanout"),
+    ("users.tasks.purge_expired_verification_rows", "maintenance"),
+    ("users.tasks.purge_expired_tokens", "maintenance"),
+    ("users.tasks.sync_token_blacklist_task", "maintenance"),
+    ("users.tasks.purge_dispatched_outbox", "maintenance"),
+    ("users.tasks.relay_outbox_task", "default"),
+    ("stories.tasks.sweep_expired_stories", "maintenance"),
+    ("stories.tasks.delete_story_media", "media"),
+    ("uploads.tasks.purge_stale_upload_sessions", "maintenance"),
+    ("unrouted.tasks.example", "default"),
+])
+def test_task_routed_to_queue(task_name: str, queue: str) -> None:
+    """
+    Test that each task is published to its dedicated queue.
+    """
+    assert app.amqp.router.route({}, task_name)["queue"].name == queue
+
+def test_fire_and_forget_tasks_store_no_result() -> None:
+    """
+    Test that tasks whose results are never read do not write to the result backend.
+    """
+    for task in (
+        tasks.send_verification_email,
+        tasks.send_queued_emails,
+        tasks.purge_expired_verification_rows,
+        tasks.purge_expired_tokens,
+        tasks.sync_token_blacklist_task,
+        tasks.relay_outbox_task,
+        tasks.purge_dispatched_outbox,
+    ):
+        assert task.ignore_result
@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from services.auth import CachedRefreshToken
+from services.users.user_cache import SUMMARY_KEY, _cache_get
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db) -> User:
+    """
+    Creates and returns a test user.
+    """
+    return User.objects.create_user(email="testuser@example.com", password="testpassword")
+
+@pytest.fixture
+def refresh(user: User) -> CachedRefreshToken:
+    """
+    Issues a refresh token for the test user.
+    """
+    return CachedRefreshToken.for_user(user)
+
+@pytest.fixture
+def api_client(refresh: CachedRefreshToken) -> APIClient:
+    """
+    Provides an APIClient sending the test user's access token.
+    """
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    return client
+
+@pytest.mark.django_db
+def test_authenticated_request_skips_user_query(api_client: APIClient, django_assert_num_queries) -> None:
+    """
+    Test that the user is only loaded from the database on the first request.
+    """
+    url = reverse("relationship-status") + "?slugs=someone"
+
+    # Summary load plus the two relationship queries.
+    with django_assert_num_queries(3):
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    with django_assert_num_queries(2):
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+def test_deactivated_user_is_rejected(api_client: APIClient, user: User) -> None:
+    """
+    Test that deactivating a user invalidates the cached record.
+    """
+    url = reverse("relationship-status") + "?slugs=someone"
+    assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    user.is_active = False
+    user.save()
+
+    assert api_client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+@pytest.mark.django_db
+def test_password_change_invalidates_cached_user(api_client: APIClient, user: User) -> None:
+    """
+    Test that changing the password through the cached user works and drops the cache entry.
+    """
+    response = api_client.post(reverse("change-password"), {
+        "old_password": "testpassword",
+        "new_password": "newpassword123",
+        "confirm_password": "newpassword123",
+    })
+
+    assert response.status_code == status.HTTP_200_OK
+    assert _cache_get(SUMMARY_KEY.format(user.id)) is None
+    user.refresh_from_db()
+    assert user.check_password("newpassword123")
+
+@pytest.mark.django_db
+def test_logout_invalidates_cached_user(api_client: APIClient, user: User, refresh: CachedRefreshToken) -> None:
+    """
+    Test that logging out drops the cached user record.
+    """
+    api_client.get(reverse("relationship-status") + "?slugs=someone")
+    assert _cache_get(SUMMARY_KEY.format(user.id)) is not None
+
+    response = api_client.post("/api/v1/users/logout/", {"refresh": str(refresh)})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert _cache_get(SUMMARY_KEY.format(user.id)) is None
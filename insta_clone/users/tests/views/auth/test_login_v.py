@@ -70,3 +70,23 @@ def test_login_missing_fields(api_client: APIClient) -> None:
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "email" in response.data
     assert "password" in response.data
+
+@pytest.mark.django_db
+def test_login_shed_when_hashing_pool_full(api_client: APIClient, create_user: Model, mocker) -> None:
+    """Tests that login answers 503 with Retry-After when the hashing pool is full.
+
+    Args:
+        api_client (APIClient): The test client.
+        create_user (Model): The created user for testing.
+    """
+    from utils.worker_pool import PoolOverloaded
+
+    mocker.patch(
+        "users.models.user.password_hashing_pool.run",
+        side_effect=PoolOverloaded(3)
+    )
+    data = {"email": "test@example.com", "password": "testpassword"}
+    response: Response = api_client.post("/api/v1/users/login/", data)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "3"
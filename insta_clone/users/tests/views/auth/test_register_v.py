@@ -6,6 +6,14 @@ from rest_framework.test import APIClient
 from typing import Callable
 
 
+@pytest.fixture(autouse=True)
+def database_verification_codes(settings) -> None:
+    """
+    Stores verification codes in the VerificationCode table, the fallback backend.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+
+
 @pytest.fixture
 def create_verification_code() -> Callable[[str], str]:
     """
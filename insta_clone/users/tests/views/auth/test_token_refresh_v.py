@@ -0,0 +1,112 @@
+import pytest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from services.auth import CachedRefreshToken, is_token_blacklisted, sync_token_blacklist
+from users.tasks import purge_expired_tokens
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Provides a new instance of APIClient for making requests.
+    """
+    return APIClient()
+
+@pytest.fixture
+def user(db) -> User:
+    """
+    Creates and returns a test user.
+    """
+    return User.objects.create_user(email="testuser@example.com", password="testpassword")
+
+@pytest.mark.django_db
+def test_rotated_refresh_token_is_rejected(api_client: APIClient, user: User) -> None:
+    """
+    Test that a refresh token cannot be reused after rotation, via the Redis mirror.
+    """
+    sync_token_blacklist()
+    refresh = str(CachedRefreshToken.for_user(user))
+
+    response = api_client.post("/api/token/refresh/", {"refresh": refresh})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["refresh"] != refresh
+
+    response = api_client.post("/api/token/refresh/", {"refresh": refresh})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+@pytest.mark.django_db
+def test_blacklist_check_skips_database(user: User, django_assert_num_queries) -> None:
+    """
+    Test that blacklist membership is answered from Redis once the mirror is synced.
+    """
+    sync_token_blacklist()
+    token = CachedRefreshToken.for_user(user)
+    jti = token.payload["jti"]
+
+    with django_assert_num_queries(0):
+        assert not is_token_blacklisted(jti)
+
+    token.blacklist()
+    with django_assert_num_queries(0):
+        assert is_token_blacklisted(jti)
+
+@pytest.mark.django_db
+def test_lost_mirror_falls_back_and_resyncs(user: User, django_assert_num_queries) -> None:
+    """
+    Test that the database answers while the mirror is missing, until it is rebuilt.
+    """
+    token = CachedRefreshToken.for_user(user)
+    token.blacklist()
+    get_redis_connection("default").flushdb()
+
+    with django_assert_num_queries(1):
+        assert is_token_blacklisted(token.payload["jti"])
+
+    assert sync_token_blacklist() == 1
+    assert sync_token_blacklist() == 0
+    with django_assert_num_queries(0):
+        assert is_token_blacklisted(token.payload["jti"])
+
+@pytest.mark.django_db
+def test_failed_mirror_write_falls_back_to_database(user: User, mocker, django_assert_num_queries) -> None:
+    """
+    Test that a token whose mirror write failed is still rejected, via the database.
+    """
+    sync_token_blacklist()
+    redis = get_redis_connection("default")
+    assert 0 < redis.ttl("jwt:blacklist:synced") <= 3600
+
+    token = CachedRefreshToken.for_user(user)
+    mocker.patch.object(redis, "set", side_effect=RedisConnectionError("down"))
+    token.blacklist()
+    mocker.stopall()
+
+    assert not redis.exists("jwt:blacklist:synced")
+    with django_assert_num_queries(1):
+        assert is_token_blacklisted(token.payload["jti"])
+
+@pytest.mark.django_db
+def test_purge_expired_tokens(user: User) -> None:
+    """
+    Test that only expired outstanding and blacklisted tokens are purged.
+    """
+    expired = [CachedRefreshToken.for_user(user) for _ in range(3)]
+    active = CachedRefreshToken.for_user(user)
+    expired[0].blacklist()
+    active.blacklist()
+    OutstandingToken.objects.filter(
+        jti__in=[token.payload["jti"] for token in expired]
+    ).update(expires_at=now() - timedelta(minutes=1))
+
+    assert purge_expired_tokens() == "Purged 3 outstanding tokens and 1 blacklisted tokens"
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [active.payload["jti"]]
+    assert BlacklistedToken.objects.count() == 1
@@ -0,0 +1,44 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Provides a new instance of APIClient for making requests.
+    """
+    return APIClient()
+
+def test_metrics_with_token(api_client: APIClient, settings) -> None:
+    """
+    Test that a scraper presenting the static token can read the metrics.
+    """
+    settings.METRICS_TOKEN = "scrape-secret"
+    settings.METRICS_ALLOWED_IPS = []
+
+    response = api_client.get("/metrics/", HTTP_AUTHORIZATION="Bearer scrape-secret")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain")
+
+def test_metrics_with_wrong_token(api_client: APIClient, settings) -> None:
+    """
+    Test that a wrong token from an address outside the allowlist is refused.
+    """
+    settings.METRICS_TOKEN = "scrape-secret"
+    settings.METRICS_ALLOWED_IPS = []
+
+    response = api_client.get("/metrics/", HTTP_AUTHORIZATION="Bearer guess")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+def test_metrics_from_allowed_network(api_client: APIClient, settings) -> None:
+    """
+    Test that an address inside an allowed network needs no token.
+    """
+    settings.METRICS_TOKEN = ""
+    settings.METRICS_ALLOWED_IPS = ["10.0.0.0/8"]
+
+    assert api_client.get("/metrics/", REMOTE_ADDR="10.1.2.3").status_code == status.HTTP_200_OK
+    assert api_client.get("/metrics/", REMOTE_ADDR="192.168.1.1").status_code == status.HTTP_403_FORBIDDEN
@@ -5,6 +5,14 @@ from django.utils.timezone import now
 from datetime import timedelta
 
 
+@pytest.fixture(autouse=True)
+def database_verification_codes(settings) -> None:
+    """
+    Stores verification codes in the VerificationCode table, the fallback backend.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+
+
 @pytest.fixture
 def create_user() -> CustomUser:
     """
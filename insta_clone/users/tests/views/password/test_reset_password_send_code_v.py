@@ -2,11 +2,20 @@ import pytest
 from users.models import CustomUser 
 from rest_framework.test import APIClient
 from users.models import VerificationCode
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
+from services.auth import read_mail_ticket
 
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture(autouse=True)
+def database_verification_codes(settings) -> None:
+    """
+    Stores verification codes in the VerificationCode table, the fallback backend.
+    """
+    settings.VERIFICATION_CODE_BACKEND = "database"
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """
@@ -33,7 +42,8 @@ def test_user() -> CustomUser:
 
 
 @pytest.mark.django_db
-def test_reset_password_send_code_success(api_client: APIClient, test_user: CustomUser) -> None:
+def test_reset_password_send_code_success(api_client: APIClient, test_user: CustomUser,
+                                          django_capture_on_commit_callbacks) -> None:
     """
     Test for successfully sending a reset password verification code.
 
@@ -45,22 +55,30 @@ def test_reset_password_send_code_success(api_client: APIClient, test_user: Cust
         - A 200 status code is returned.
         - The response contains the correct email and message.
         - A verification code is created in the database.
-        - The email sending function is called once with the correct email.
+        - The email task is published once, after commit, with the email and the stored code.
     """
-    with patch("services.auth.verification_service.send_verification_email.delay") as mock_send_email:
-        response = api_client.post(
-            "/api/v1/users/reset-password-send-code/", 
-            {
-                "email": "test@example.com" 
-            }
-        )
+    with patch("services.outbox.dispatch.current_app") as mock_app:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                "/api/v1/users/reset-password-send-code/", 
+                {
+                    "email": "test@example.com" 
+                }
+            )
 
         assert response.status_code == 200
         assert response.data["email"] == "test@example.com"
         assert response.data["message"] == "Verification code sent."
-        assert VerificationCode.objects.filter(email="test@example.com").exists()
+        code = VerificationCode.objects.get(email="test@example.com")
 
-        mock_send_email.assert_called_once_with("test@example.com")
+        mock_app.send_task.assert_called_once_with(
+            "users.tasks.send_verification_email",
+            args=["test@example.com", ANY, "en-us"],
+            kwargs={}
+        )
+        ticket = mock_app.send_task.call_args.kwargs["args"][1]
+        assert ticket == str(code.pk)
+        assert read_mail_ticket(ticket) == code.verification_code
 
 
 @pytest.mark.django_db
@@ -0,0 +1,101 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import CustomUser, Block, Mute, Follow
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Provides a new instance of APIClient for making requests.
+    """
+    return APIClient()
+
+@pytest.fixture
+def user1(db) -> CustomUser:
+    """
+    Creates and returns a user instance for user1.
+    """
+    return CustomUser.objects.create_user(email="user1@example.com", password="password123")
+
+@pytest.fixture
+def user2(db) -> CustomUser:
+    """
+    Creates and returns a user instance for user2.
+    """
+    return CustomUser.objects.create_user(email="user2@example.com", password="password123")
+
+@pytest.mark.django_db
+def test_block_user(api_client: APIClient, user1: CustomUser, user2: CustomUser) -> None:
+    """
+    Test blocking and unblocking another user.
+    """
+    api_client.force_authenticate(user=user1)
+    url = reverse("block-toggle", kwargs={"username": user2.slug})
+
+    response = api_client.post(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["message"] == "Blocked successfully"
+    assert Block.objects.filter(blocker=user1, blocked=user2).exists()
+
+    response = api_client.post(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["message"] == "Unblocked successfully"
+    assert not Block.objects.filter(blocker=user1, blocked=user2).exists()
+
+@pytest.mark.django_db
+def test_mute_user(api_client: APIClient, user1: CustomUser, user2: CustomUser) -> None:
+    """
+    Test muting another user.
+    """
+    api_client.force_authenticate(user=user1)
+    url = reverse("mute-toggle", kwargs={"username": user2.slug})
+    response = api_client.post(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["message"] == "Muted successfully"
+    assert Mute.objects.filter(muter=user1, muted=user2).exists()
+
+@pytest.mark.django_db
+def test_cannot_block_self(api_client: APIClient, user1: CustomUser) -> None:
+    """
+    Test that a user cannot block themselves.
+    """
+    api_client.force_authenticate(user=user1)
+    url = reverse("block-toggle", kwargs={"username": user1.slug})
+    response = api_client.post(url)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["error"] == "You cannot block yourself"
+
+@pytest.mark.django_db
+def test_mute_non_existent_user(api_client: APIClient, user1: CustomUser) -> None:
+    """
+    Test muting a non-existent user.
+    """
+    api_client.force_authenticate(user=user1)
+    url = reverse("mute-toggle", kwargs={"username": "nonexistent-user"})
+    response = api_client.post(url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_blocked_user_cannot_follow_or_view_blocker(api_client: APIClient, user1: CustomUser, user2: CustomUser) -> None:
+    """
+    Test that after a block neither user can follow or view the other.
+    """
+    api_client.force_authenticate(user=user1)
+    api_client.post(reverse("block-toggle", kwargs={"username": user2.slug}))
+
+    api_client.force_authenticate(user=user2)
+    response = api_client.post(reverse("follow-toggle", kwargs={"username": user1.slug}))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not Follow.objects.filter(follower=user2, followed=user1).exists()
+
+    response = api_client.get(reverse("user-profile", kwargs={"username": user1.slug}))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    api_client.force_authenticate(user=user1)
+    response = api_client.get(reverse("user-profile", kwargs={"username": user2.slug}))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
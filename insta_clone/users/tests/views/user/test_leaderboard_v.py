@@ -0,0 +1,117 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import CustomUser, Follow, Block
+from posts.models import Post
+from likes.models import PostLike
+from utils.leaderboard import FOLLOWERS_LEADERBOARD, POST_LIKES_LEADERBOARD
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Provides a new instance of APIClient for making requests.
+    """
+    return APIClient()
+
+@pytest.fixture
+def users(db) -> list:
+    """
+    Creates and returns three users.
+    """
+    return [
+        CustomUser.objects.create_user(email=f"user{i}@example.com", password="password123")
+        for i in range(3)
+    ]
+
+@pytest.fixture
+def post(users: list) -> Post:
+    """
+    Creates and returns a post owned by the first user.
+    """
+    image = SimpleUploadedFile("test.jpg", b"file_content", content_type="image/jpeg")
+    return Post.objects.create(user=users[0], image=image, caption="Test post")
+
+@pytest.mark.django_db
+def test_toggle_follow_updates_leaderboard(users: list, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that following and unfollowing adjust the followers leaderboard.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        Follow.toggle_follow(users[1], users[0])
+        Follow.toggle_follow(users[2], users[0])
+        Follow.toggle_follow(users[0], users[1])
+    assert FOLLOWERS_LEADERBOARD.top(10) == [(users[0].id, 2), (users[1].id, 1)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Follow.toggle_follow(users[0], users[1])
+    assert FOLLOWERS_LEADERBOARD.top(10) == [(users[0].id, 2)]
+
+@pytest.mark.django_db
+def test_block_removes_follows_from_leaderboard(users: list, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that follows removed by a block are removed from the leaderboard.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        Follow.toggle_follow(users[1], users[0])
+        Block.toggle_block(users[0], users[1])
+    assert FOLLOWERS_LEADERBOARD.top(10) == []
+
+@pytest.mark.django_db
+def test_rolled_back_follow_is_not_counted(users: list, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that the leaderboard is only updated once the transaction commits.
+    """
+    with django_capture_on_commit_callbacks(execute=False):
+        Follow.toggle_follow(users[1], users[0])
+    assert FOLLOWERS_LEADERBOARD.top(10) == []
+
+@pytest.mark.django_db
+def test_top_users_view(api_client: APIClient, users: list, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that the most-followed users are returned in order.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        Follow.toggle_follow(users[1], users[0])
+        Follow.toggle_follow(users[2], users[0])
+        Follow.toggle_follow(users[0], users[2])
+
+    api_client.force_authenticate(user=users[1])
+    response = api_client.get(reverse("user-leaderboard"), {"limit": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [(entry["slug"], entry["followers_count"]) for entry in response.data] == [
+        (users[0].slug, 2),
+        (users[2].slug, 1),
+    ]
+
+@pytest.mark.django_db
+def test_top_users_view_invalid_limit(api_client: APIClient, users: list) -> None:
+    """
+    Test that an out-of-range limit is rejected.
+    """
+    api_client.force_authenticate(user=users[0])
+    response = api_client.get(reverse("user-leaderboard"), {"limit": 1000})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.django_db
+def test_top_posts_view(api_client: APIClient, users: list, post: Post, django_capture_on_commit_callbacks) -> None:
+    """
+    Test that liking a post ranks it and deleting it removes it.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        PostLike.toggle_like(users[1], post)
+        PostLike.toggle_like(users[2], post)
+
+    api_client.force_authenticate(user=users[1])
+    response = api_client.get(reverse("post-leaderboard"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [(entry["id"], entry["like_count"]) for entry in response.data] == [(post.id, 2)]
+
+    api_client.force_authenticate(user=users[0])
+    api_client.delete(reverse("post-delete", kwargs={"id": post.id}))
+    assert POST_LIKES_LEADERBOARD.top(10) == []
@@ -0,0 +1,74 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from users.models import CustomUser, Follow
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Provides a new instance of APIClient for making requests.
+    """
+    return APIClient()
+
+@pytest.fixture
+def users(db) -> list:
+    """
+    Creates and returns three user instances.
+    """
+    return [
+        CustomUser.objects.create_user(email=f"user{i}@example.com", password="password123")
+        for i in range(1, 4)
+    ]
+
+@pytest.mark.django_db
+def test_relationship_status(api_client: APIClient, users: list) -> None:
+    """
+    Test fetching relationship flags for a batch of users.
+    
+    Verifies that each requested slug is returned with the correct
+    "following" and "followed_by" flags.
+    """
+    user1, user2, user3 = users
+    Follow.objects.create(follower=user1, followed=user2)
+    Follow.objects.create(follower=user2, followed=user1)
+    Follow.objects.create(follower=user3, followed=user1)
+
+    api_client.force_authenticate(user=user1)
+    url = reverse("relationship-status")
+    response = api_client.get(url, {"slugs": f"{user2.slug},{user3.slug}"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data[user2.slug] == {"following": True, "followed_by": True}
+    assert response.data[user3.slug] == {"following": False, "followed_by": True}
+
+@pytest.mark.django_db
+def test_relationship_status_missing_slugs(api_client: APIClient, users: list) -> None:
+    """
+    Test that the "slugs" query parameter is required.
+    """
+    api_client.force_authenticate(user=users[0])
+    response = api_client.get(reverse("relationship-status"))
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.django_db
+def test_relationship_status_too_many_slugs(api_client: APIClient, users: list) -> None:
+    """
+    Test that more than 100 slugs are rejected.
+    """
+    api_client.force_authenticate(user=users[0])
+    slugs = ",".join(f"user-{i}" for i in range(101))
+    response = api_client.get(reverse("relationship-status"), {"slugs": slugs})
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.django_db
+def test_relationship_status_unauthenticated(api_client: APIClient) -> None:
+    """
+    Test that unauthenticated users cannot look up relationships.
+    """
+    response = api_client.get(reverse("relationship-status"), {"slugs": "user1"})
+    
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
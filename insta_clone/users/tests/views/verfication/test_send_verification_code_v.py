@@ -5,6 +5,7 @@ from datetime import timedelta
 
 from users.models.daily_messages import DailyMessage
 from users.models.daily_message_limit import DailyMessageLimit
+from users.models.outbox import OutboxMessage
 
 
 @pytest.mark.django_db
@@ -13,7 +14,7 @@ def test_send_verification_code_success(client, mocker) -> None:
     Test successful verification code sending.
 
     Verifies that the verification code is sent successfully, the correct status code 
-    is returned, and a DailyMessage record is created for the given email.
+    is returned, and no DailyMessage row is written for the given email.
     """
     email = "test@example.com"
     mocker.patch("users.tasks.send_verification_email.delay")
@@ -27,7 +28,7 @@ def test_send_verification_code_success(client, mocker) -> None:
     
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "Verification code sent."}
-    assert DailyMessage.objects.filter(email=email).exists()
+    assert not DailyMessage.objects.filter(email=email).exists()
 
 
 @pytest.mark.django_db
@@ -83,7 +84,8 @@ def test_send_verification_code_expiration_time_not_passed(client, mocker) -> No
         expiration_time=timedelta(seconds=300)
     )
 
-    DailyMessage.objects.create(email=email)
+    mocker.patch("users.tasks.send_verification_email.delay")
+    client.post(reverse("send_verification_code"), {"email": email})
     
     response = client.post(
         reverse("send_verification_code"), 
@@ -112,4 +114,27 @@ def test_send_verification_code_invalid_email(client) -> None:
     )
     
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert "email" in response.json()
\ No newline at end of file
+    assert "email" in response.json()
+
+
+@pytest.mark.django_db
+def test_send_verification_code_stored_once(client, mocker) -> None:
+    """
+    Test that the code is stored once and the outbox message only carries a ticket for it.
+    """
+    from services.auth import RedisVerificationCodeStore, read_mail_ticket
+
+    email = "test@example.com"
+    save = mocker.spy(RedisVerificationCodeStore, "save")
+
+    response = client.post(reverse("send_verification_code"), {"email": email})
+
+    assert response.status_code == status.HTTP_200_OK
+    save.assert_called_once()
+    code = save.call_args.args[2]
+    message = OutboxMessage.objects.get()
+    assert message.task_name == "users.tasks.send_verification_email"
+    assert code not in message.args
+    assert message.args[0::2] == [email, "en-us"]
+    assert read_mail_ticket(message.args[1]) == code
+    assert RedisVerificationCodeStore().consume(email, code)
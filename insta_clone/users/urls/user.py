@@ -3,6 +3,18 @@ from users.views import *
 
 urlpatterns = [
     # User endpoints
+    path(
+        "users/relationships/", 
+        RelationshipStatusView.as_view(), 
+        name="relationship-status"
+    ),
+
+    path(
+        "users/leaderboard/", 
+        TopUsersView.as_view(), 
+        name="user-leaderboard"
+    ),
+
     path(
         "users/<slug:username>/", 
         UserProfileView.as_view(), 
@@ -15,6 +27,18 @@ urlpatterns = [
         name="follow-toggle"
     ),
 
+    path(
+        "users/<slug:username>/block/", 
+        BlockToggleView.as_view(), 
+        name="block-toggle"
+    ),
+
+    path(
+        "users/<slug:username>/mute/", 
+        MuteToggleView.as_view(), 
+        name="mute-toggle"
+    ),
+
     path(
         "update-profile/", 
         UpdateProfileView.as_view(), 
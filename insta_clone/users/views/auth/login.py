@@ -30,7 +30,10 @@ class LoginView(APIView):
         """
         logger.info("Login request received")  
 
-        serializer = LoginSerializer(data=request.data)
+        serializer = LoginSerializer(
+            data=request.data,
+            context={"request": request}
+        )
 
         if serializer.is_valid():
             logger.info("Login successful") 
@@ -1,10 +1,12 @@
 import logging
 from rest_framework.views import APIView, Response, status
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from drf_yasg.utils import swagger_auto_schema
 
 from users.serializers.auth import LogoutSerializer
+from services.auth import CachedRefreshToken
+from services.users import invalidate_user_cache
 
 __all__ = ["LogoutView"]
 
@@ -43,8 +45,11 @@ class LogoutView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
+            user_id = token.payload.get(api_settings.USER_ID_CLAIM)
+            if user_id:
+                invalidate_user_cache(user_id)
 
             logger.info("User logged out successfully, token blacklisted") 
             return Response({
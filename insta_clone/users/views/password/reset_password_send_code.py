@@ -3,6 +3,7 @@ from rest_framework.views import APIView, Response, status
 from drf_yasg.utils import swagger_auto_schema
 
 from users.serializers.password import ResetPasswordSendCodeSerializer
+from services.auth import VerificationCodeUnavailable
 
 __all__ = ["ResetPasswordSendCodeView"]
 
@@ -33,7 +34,13 @@ class ResetPasswordSendCodeView(APIView):
         serializer = ResetPasswordSendCodeSerializer(data=request.data)
 
         if serializer.is_valid():
-            response_data = serializer.save()
+            try:
+                response_data = serializer.save()
+            except VerificationCodeUnavailable as e:
+                return Response(
+                    {"error": str(e)},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
             logger.info(
                 "Password reset code sent successfully to email: %s", 
                 request.data.get("email")
@@ -1,2 +1,5 @@
 from .followers import *
+from .blocks import *
+from .leaderboard import *
+from .relationships import *
 from .user_view import *
\ No newline at end of file
@@ -0,0 +1,116 @@
+import logging
+from rest_framework.views import APIView, Response, status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+
+from users.models import Block, Mute
+from services.users import resolve_user
+
+__all__ = [
+    "BlockToggleView",
+    "MuteToggleView"
+]
+
+logger = logging.getLogger(__name__)
+
+
+class BlockToggleView(APIView):
+    """
+    API view to toggle block/unblock status for a user.
+
+    Blocking a user removes the follow relationship in both directions and
+    hides each user's posts, stories and comments from the other.
+
+    Methods:
+        POST: Toggles block/unblock status for the specified user.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Toggle block/unblock user",
+        responses={200: "Block toggled successfully", 400: "Invalid request", 404: "User not found"}
+    )
+    def post(self, request, username: str) -> Response:
+        """
+        Handles the POST request to toggle block/unblock status for a user.
+
+        Args:
+            request: The HTTP request object.
+            username: The username (slug) of the user to block/unblock.
+
+        Returns:
+            Response: The HTTP response object containing the result of the operation.
+        """
+        blocked_user = resolve_user(username)
+
+        if blocked_user is None:
+            logger.error(f"User {username} not found.")
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.user == blocked_user:
+            logger.warning(f"User {request.user.id} attempted to block themselves.")
+            return Response(
+                {"error": "You cannot block yourself"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        blocked = Block.toggle_block(request.user, blocked_user)
+
+        action = "Blocked" if blocked else "Unblocked"
+        logger.info(f"User {request.user.id} has {action} {blocked_user.id} successfully.")
+
+        return Response(
+            {"message": f"{action} successfully"},
+            status=status.HTTP_200_OK
+        )
+
+
+class MuteToggleView(APIView):
+    """
+    API view to toggle mute/unmute status for a user.
+
+    Muting a user hides their posts and stories from the feed without
+    unfollowing them.
+
+    Methods:
+        POST: Toggles mute/unmute status for the specified user.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Toggle mute/unmute user",
+        responses={200: "Mute toggled successfully", 400: "Invalid request", 404: "User not found"}
+    )
+    def post(self, request, username: str) -> Response:
+        """
+        Handles the POST request to toggle mute/unmute status for a user.
+
+        Args:
+            request: The HTTP request object.
+            username: The username (slug) of the user to mute/unmute.
+
+        Returns:
+            Response: The HTTP response object containing the result of the operation.
+        """
+        muted_user = resolve_user(username)
+
+        if muted_user is None:
+            logger.error(f"User {username} not found.")
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.user == muted_user:
+            logger.warning(f"User {request.user.id} attempted to mute themselves.")
+            return Response(
+                {"error": "You cannot mute yourself"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        muted = Mute.toggle_mute(request.user, muted_user)
+
+        action = "Muted" if muted else "Unmuted"
+        logger.info(f"User {request.user.id} has {action} {muted_user.id} successfully.")
+
+        return Response(
+            {"message": f"{action} successfully"},
+            status=status.HTTP_200_OK
+        )
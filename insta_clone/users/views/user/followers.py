@@ -4,8 +4,8 @@ from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
 
 from users.models import Follow
-from users.models import CustomUser
 from users.serializers.user import FollowSerializer
+from services.users import resolve_user, get_hidden_user_ids
 
 __all__ = ["FollowToggleView"]
 
@@ -19,7 +19,8 @@ class FollowToggleView(APIView):
 
     This view allows authenticated users to follow or unfollow another user.
     If the user tries to follow themselves, an error is returned.
-    If the user is not found, a 404 error is returned.
+    If the user is not found, or a block exists between the two users,
+    a 404 error is returned.
 
     Methods:
         POST: Toggles follow/unfollow status for the specified user.
@@ -41,32 +42,37 @@ class FollowToggleView(APIView):
         Returns:
             Response: The HTTP response object containing the result of the operation.
         """
-        try:
-            # Log the attempt to follow/unfollow
-            logger.info(f"User {request.user.username} is attempting to follow/unfollow {username}.")
+        # Log the attempt to follow/unfollow
+        logger.info(f"User {request.user.username} is attempting to follow/unfollow {username}.")
 
-            # Retrieve the followed user by their slug
-            followed_user = CustomUser.objects.get(slug=username)
+        # Retrieve the followed user by their slug through the lookup cache
+        followed_user = resolve_user(username)
 
-            # Check if the user is trying to follow themselves
-            if request.user == followed_user:
-                logger.warning(f"User {request.user.username} attempted to follow themselves.")
-                return Response(
-                    {"error": "You cannot follow yourself"}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-            # Toggle follow/unfollow status
-            followed = Follow.toggle_follow(request.user, followed_user)
+        if followed_user is None:
+            logger.error(f"User {username} not found.")
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
-            # Log success or failure
-            action = "Followed" if followed else "Unfollowed"
-            logger.info(f"User {request.user.username} has {action} {followed_user.username} successfully.")
+        # A block in either direction hides the user, so they cannot be followed again
+        if followed_user.id in get_hidden_user_ids(request.user.id, include_muted=False):
+            logger.warning(f"User {request.user.id} attempted to follow {followed_user.id} across a block.")
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
+        # Check if the user is trying to follow themselves
+        if request.user == followed_user:
+            logger.warning(f"User {request.user.username} attempted to follow themselves.")
             return Response(
-                {"message": f"{action} successfully"},
-                status=status.HTTP_200_OK
+                {"error": "You cannot follow yourself"}, 
+                status=status.HTTP_400_BAD_REQUEST
             )
-        except CustomUser.DoesNotExist:
-            logger.error(f"User {username} not found.")
-            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        # Toggle follow/unfollow status
+        followed = Follow.toggle_follow(request.user, followed_user)
+
+        # Log success or failure
+        action = "Followed" if followed else "Unfollowed"
+        logger.info(f"User {request.user.username} has {action} {followed_user.username} successfully.")
+
+        return Response(
+            {"message": f"{action} successfully"},
+            status=status.HTTP_200_OK
+        )
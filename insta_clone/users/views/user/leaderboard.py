@@ -0,0 +1,93 @@
+import logging
+from rest_framework.views import APIView, Response, status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from django.contrib.auth import get_user_model
+
+from services.users import exclude_hidden_users
+from utils.leaderboard import FOLLOWERS_LEADERBOARD
+
+__all__ = ["TopUsersView"]
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+DEFAULT_LEADERBOARD_LIMIT = 10
+MAX_LEADERBOARD_LIMIT = 100
+
+
+class TopUsersView(APIView):
+    """
+    API view to list the most-followed users.
+
+    The ranking is read from a Redis sorted set kept up to date by
+    Follow.toggle_follow, so the cost does not grow with the follows table.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Get the most-followed users",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Number of users to return (max {MAX_LEADERBOARD_LIMIT})",
+                type=openapi.TYPE_INTEGER,
+                required=False
+            ),
+        ],
+        responses={200: "Most-followed users", 400: "Invalid request"}
+    )
+    def get(self, request) -> Response:
+        """
+        Handles the GET request to fetch the most-followed users.
+
+        Args:
+            request: The HTTP request object with an optional "limit" query parameter.
+
+        Returns:
+            Response: The users in descending order of follower count.
+        """
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LEADERBOARD_LIMIT))
+        except ValueError:
+            return Response(
+                {"error": "The \"limit\" query parameter must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not 1 <= limit <= MAX_LEADERBOARD_LIMIT:
+            return Response(
+                {"error": f"The \"limit\" query parameter must be between 1 and {MAX_LEADERBOARD_LIMIT}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        entries = FOLLOWERS_LEADERBOARD.top(limit)
+        users = exclude_hidden_users(
+            User.objects.filter(
+                id__in=[user_id for user_id, _ in entries],
+                is_active=True
+            ),
+            request.user.id,
+            field="id"
+        ).in_bulk()
+
+        results = [
+            {
+                "slug": users[user_id].slug,
+                "first_name": users[user_id].first_name,
+                "last_name": users[user_id].last_name,
+                "profile_picture": (
+                    request.build_absolute_uri(users[user_id].profile_picture.url)
+                    if users[user_id].profile_picture else None
+                ),
+                "followers_count": followers_count,
+            }
+            for user_id, followers_count in entries
+            if user_id in users
+        ]
+        logger.info(f"Fetched top {len(results)} users by followers for user {request.user.id}.")
+
+        return Response(results, status=status.HTTP_200_OK)
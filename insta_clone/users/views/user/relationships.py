@@ -0,0 +1,70 @@
+import logging
+from rest_framework.views import APIView, Response, status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from users.models import Follow
+
+__all__ = ["RelationshipStatusView"]
+
+logger = logging.getLogger(__name__)
+
+MAX_RELATIONSHIP_SLUGS = 100
+
+
+class RelationshipStatusView(APIView):
+    """
+    API view to look up the follow relationship with a batch of users.
+
+    Clients rendering lists of user cards pass up to 100 comma-separated slugs
+    and receive, for each one, whether the current user follows them and
+    whether they follow the current user back.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Get follow status for a batch of users",
+        manual_parameters=[
+            openapi.Parameter(
+                "slugs",
+                openapi.IN_QUERY,
+                description="Comma-separated user slugs (max 100)",
+                type=openapi.TYPE_STRING,
+                required=True
+            ),
+        ],
+        responses={200: "Relationship status per slug", 400: "Invalid request"}
+    )
+    def get(self, request) -> Response:
+        """
+        Handles the GET request to fetch relationship flags for the given slugs.
+
+        Args:
+            request: The HTTP request object with a "slugs" query parameter.
+
+        Returns:
+            Response: A mapping of slug to its "following" and "followed_by" flags.
+        """
+        slugs = [
+            slug.strip()
+            for slug in request.query_params.get("slugs", "").split(",")
+            if slug.strip()
+        ]
+
+        if not slugs:
+            return Response(
+                {"error": "The \"slugs\" query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(set(slugs)) > MAX_RELATIONSHIP_SLUGS:
+            return Response(
+                {"error": f"At most {MAX_RELATIONSHIP_SLUGS} slugs can be requested at once."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        relationships = Follow.relationship_status(request.user, slugs)
+        logger.info(f"Fetched relationship status of {len(relationships)} users for user {request.user.id}.")
+
+        return Response(relationships, status=status.HTTP_200_OK)
@@ -4,11 +4,11 @@ from rest_framework.views import APIView, Response, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import permissions
 from drf_yasg.utils import swagger_auto_schema
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from drf_yasg import openapi
 
-from users.models import CustomUser
 from users.serializers import UserSerializer, UpdateProfileSerializer
+from services.users import resolve_user, get_hidden_user_ids
 
 __all__ = [
     "UserProfileView",
@@ -24,7 +24,8 @@ class UserProfileView(APIView):
     API view to retrieve user profile details.
     
     This view is accessible only to authenticated users. It fetches the user's profile based
-    on the provided username (slug) and returns the user data.
+    on the provided username (slug) and returns the user data. Users blocked
+    in either direction are reported as not found.
     """
     permission_classes = [IsAuthenticated]
     
@@ -43,7 +44,10 @@ class UserProfileView(APIView):
         Returns:
             Response: The serialized user data, or an error if the user is not found.
         """
-        user = get_object_or_404(CustomUser, slug=username)
+        user = resolve_user(username)
+        if user is None or user.id in get_hidden_user_ids(request.user.id, include_muted=False):
+            raise Http404("User not found.")
+
         serializer = UserSerializer(user)
         logger.info(f"Fetched profile for user: {username}")
         return Response(serializer.data, status=status.HTTP_200_OK)
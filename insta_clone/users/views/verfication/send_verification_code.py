@@ -3,8 +3,7 @@ from rest_framework.views import APIView, Response, status
 from drf_yasg.utils import swagger_auto_schema
 
 from users.serializers.verification import SendVerificationCodeSerializer
-from users.models import DailyMessage
-from users.tasks import send_verification_email
+from services.auth import check_message_rate_limit, VerificationCodeUnavailable
 
 __all__ = ["SendVerificationCodeView"]
 
@@ -42,9 +41,9 @@ class SendVerificationCodeView(APIView):
             email = serializer.validated_data["email"]
             logger.info("Email validated: %s", email)
 
-            message_response = DailyMessage.send_message(email)
+            message_response = check_message_rate_limit(email)
 
-            if message_response != "Message sent successfully!":
+            if message_response:
                 logger.warning(
                     "Too many requests for email: %s. Response: %s", 
                     email,
@@ -56,7 +55,13 @@ class SendVerificationCodeView(APIView):
                     status=status.HTTP_429_TOO_MANY_REQUESTS
                 )
 
-            send_verification_email.delay(email)
+            try:
+                serializer.save()
+            except VerificationCodeUnavailable as e:
+                return Response(
+                    {"error": str(e)},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
             logger.info("Verification code sent to email: %s", email)
 
             return Response(
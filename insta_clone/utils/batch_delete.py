@@ -0,0 +1,45 @@
+import logging
+import time
+from django.db.models import Max, Min, QuerySet
+
+__all__ = ["delete_in_batches"]
+
+logger = logging.getLogger(__name__)
+
+
+def delete_in_batches(queryset: QuerySet, batch_size: int = 1000) -> int:
+    """
+    Deletes the rows of a queryset in bounded primary-key ranges.
+
+    Each batch is a separate DELETE over at most `batch_size` consecutive
+    primary keys, committed on its own. This keeps every lock short, unlike a
+    single DELETE over the whole table.
+
+    Args:
+        queryset (QuerySet): The rows to delete, e.g. filtered by an expiry cutoff.
+        batch_size (int): The width of each primary-key range.
+
+    Returns:
+        int: The number of rows deleted.
+    """
+    model_name = queryset.model.__name__
+    bounds = queryset.aggregate(low=Min("pk"), high=Max("pk"))
+
+    if bounds["low"] is None:
+        logger.info(f"No expired {model_name} rows to purge.")
+        return 0
+
+    started = time.monotonic()
+    total = 0
+
+    for low in range(bounds["low"], bounds["high"] + 1, batch_size):
+        deleted, _ = queryset.filter(pk__gte=low, pk__lt=low + batch_size).delete()
+        total += deleted
+
+    elapsed = time.monotonic() - started
+    rate = total / elapsed if elapsed else total
+    logger.info(
+        f"Purged {total} {model_name} rows in {elapsed:.2f}s ({rate:.0f} rows/s)."
+    )
+
+    return total
@@ -0,0 +1,127 @@
+import logging
+from typing import Iterable, List, Tuple
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = [
+    "Leaderboard",
+    "FOLLOWERS_LEADERBOARD",
+    "POST_LIKES_LEADERBOARD",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Leaderboard:
+    """
+    A ranking of ids by score kept in a Redis sorted set.
+
+    Scores are updated incrementally as the underlying rows change, so reading
+    the top k entries costs O(log n + k) instead of a GROUP BY over the table.
+    Members whose score drops to zero are removed to keep the set small.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        Args:
+            key (str): The Redis key of the sorted set.
+        """
+        self.key = key
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    def _incr(self, member_id: int, amount: int) -> None:
+        """
+        Changes the score of a member right away.
+        """
+        try:
+            pipe = self.redis.pipeline()
+            pipe.zincrby(self.key, amount, member_id)
+            pipe.zremrangebyscore(self.key, "-inf", 0)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Could not update leaderboard {self.key}: {e}")
+
+    def incr(self, member_id: int, amount: int = 1) -> None:
+        """
+        Changes the score of a member once the current transaction commits,
+        so rolled-back writes never reach the leaderboard.
+
+        Args:
+            member_id (int): The id of the ranked object.
+            amount (int): The change in score, negative to decrease it.
+        """
+        transaction.on_commit(lambda: self._incr(member_id, amount))
+
+    def remove(self, member_id: int) -> None:
+        """
+        Removes a member, e.g. when the ranked object is deleted.
+        """
+        try:
+            self.redis.zrem(self.key, member_id)
+        except RedisError as e:
+            logger.warning(f"Could not update leaderboard {self.key}: {e}")
+
+    def top(self, limit: int = 10) -> List[Tuple[int, int]]:
+        """
+        Returns the highest-scoring members.
+
+        Args:
+            limit (int): The number of members to return.
+
+        Returns:
+            List[Tuple[int, int]]: (member id, score) pairs in descending score order.
+        """
+        try:
+            entries = self.redis.zrevrange(self.key, 0, limit - 1, withscores=True)
+        except RedisError as e:
+            logger.warning(f"Could not read leaderboard {self.key}: {e}")
+            return []
+        return [(int(member), int(score)) for member, score in entries]
+
+    def rebuild(self, scores: Iterable[Tuple[int, int]], batch_size: int = 5000) -> int:
+        """
+        Replaces the whole leaderboard with freshly computed scores.
+
+        The new set is written to a temporary key in batches and swapped in
+        with a single RENAME, so readers never see a partial leaderboard.
+
+        Args:
+            scores (Iterable[Tuple[int, int]]): (member id, score) pairs.
+            batch_size (int): The number of members written per round trip.
+
+        Returns:
+            int: The number of members written.
+        """
+        temp_key = f"{self.key}:rebuild"
+        redis = self.redis
+        redis.delete(temp_key)
+
+        total = 0
+        batch = {}
+        for member_id, score in scores:
+            if score <= 0:
+                continue
+            batch[member_id] = score
+            if len(batch) >= batch_size:
+                redis.zadd(temp_key, batch)
+                total += len(batch)
+                batch = {}
+
+        if batch:
+            redis.zadd(temp_key, batch)
+            total += len(batch)
+
+        if total:
+            redis.rename(temp_key, self.key)
+        else:
+            redis.delete(self.key)
+
+        return total
+
+
+FOLLOWERS_LEADERBOARD = Leaderboard("leaderboard:followers")
+POST_LIKES_LEADERBOARD = Leaderboard("leaderboard:post_likes")
@@ -0,0 +1,72 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+__all__ = ["LocalLRUCache"]
+
+
+class LocalLRUCache:
+    """
+    A small thread-safe, process-local LRU cache with a per-entry TTL.
+
+    It is meant to sit in front of Redis for very hot keys. Entries are only
+    visible to the current process, so the TTL should be kept short enough
+    that other processes' invalidations are picked up quickly.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 10) -> None:
+        """
+        Args:
+            maxsize (int): The maximum number of entries kept in memory.
+            ttl (float): The number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Returns the cached value for the key, or the default if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes the key from the cache if it is present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,100 @@
+import json
+from typing import List, Optional, Sequence
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django_redis import get_redis_connection
+
+__all__ = ["MailQueue", "mail_queue"]
+
+
+class MailQueue:
+    """
+    A Redis list of emails waiting to be sent in batches.
+
+    Producers push messages without touching SMTP at all. The
+    send_queued_emails task pops them in batches and sends each batch over
+    a single pooled connection. Messages the server refuses for good are
+    moved to a dead-letter list, capped at `dead_letter_size` entries.
+    """
+
+    def __init__(self, key: str, dead_letter_size: int = 1000) -> None:
+        """
+        Args:
+            key (str): The Redis key of the list, e.g. "mail:queue".
+            dead_letter_size (int): The number of rejected messages kept.
+        """
+        self.key = key
+        self.dead_letter_key = f"{key}:dead"
+        self.dead_letter_size = dead_letter_size
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    @staticmethod
+    def serialize(message: EmailMessage) -> str:
+        return json.dumps({
+            "subject": message.subject,
+            "body": message.body,
+            "from_email": message.from_email,
+            "to": list(message.to),
+            "alternatives": [list(alternative) for alternative in getattr(message, "alternatives", [])],
+        })
+
+    @staticmethod
+    def deserialize(payload: bytes) -> EmailMessage:
+        return EmailMultiAlternatives(**json.loads(payload))
+
+    def push(
+        self,
+        subject: str,
+        body: str,
+        recipient_list: List[str],
+        from_email: Optional[str] = None,
+        html_message: Optional[str] = None
+    ) -> None:
+        """
+        Queues one email, with an HTML alternative if `html_message` is given.
+        """
+        message = EmailMultiAlternatives(subject, body, from_email, recipient_list)
+        if html_message:
+            message.attach_alternative(html_message, "text/html")
+        self.redis.rpush(self.key, self.serialize(message))
+
+    def pop_batch(self, size: int) -> List[EmailMessage]:
+        """
+        Removes and returns up to `size` of the oldest queued emails.
+
+        The read and the trim run in one MULTI/EXEC, so concurrent drains
+        never receive the same message.
+        """
+        pipe = self.redis.pipeline()
+        pipe.lrange(self.key, 0, size - 1)
+        pipe.ltrim(self.key, size, -1)
+        payloads, _ = pipe.execute()
+        return [self.deserialize(payload) for payload in payloads]
+
+    def requeue(self, messages: Sequence[EmailMessage]) -> None:
+        """
+        Puts emails back at the front of the queue, in their original order.
+        """
+        if messages:
+            self.redis.lpush(self.key, *[self.serialize(message) for message in reversed(messages)])
+
+    def dead_letter(self, message: EmailMessage, error: Exception) -> None:
+        """
+        Keeps a rejected email, with the reason, for inspection instead of
+        retrying it.
+        """
+        pipe = self.redis.pipeline()
+        pipe.rpush(self.dead_letter_key, json.dumps({
+            "message": self.serialize(message),
+            "error": str(error),
+        }))
+        pipe.ltrim(self.dead_letter_key, -self.dead_letter_size, -1)
+        pipe.execute()
+
+    def __len__(self) -> int:
+        return self.redis.llen(self.key)
+
+
+mail_queue = MailQueue("mail:queue")
@@ -0,0 +1,112 @@
+import threading
+from typing import Dict, Tuple
+
+__all__ = ["MetricsRegistry", "metrics"]
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """
+    A small thread-safe registry of counters, gauges and summaries.
+
+    Values live in the memory of the current process, so every web or
+    Celery worker reports its own numbers. They are rendered in the
+    Prometheus text format, which lets a scraper aggregate them per process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+        self._summaries: Dict[Tuple[str, LabelKey], list] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> Tuple[str, LabelKey]:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def incr(self, name: str, amount: float = 1, **labels) -> None:
+        """
+        Increases a counter.
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Sets a gauge to its current value.
+        """
+        with self._lock:
+            self._gauges[self._key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        Records one observation of a summary, e.g. a duration in seconds.
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            count, total, maximum = self._summaries.get(key, (0, 0.0, 0.0))
+            self._summaries[key] = (count + 1, total + value, max(maximum, value))
+
+    def get(self, name: str, **labels) -> float:
+        """
+        Returns the current value of a counter or gauge, or 0 if unset.
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key, 0))
+
+    def get_summary(self, name: str, **labels) -> Tuple[int, float, float]:
+        """
+        Returns the count, sum and maximum of a summary.
+        """
+        with self._lock:
+            return self._summaries.get(self._key(name, labels), (0, 0.0, 0.0))
+
+    def clear(self) -> None:
+        """
+        Forgets every recorded value.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+    def render(self) -> str:
+        """
+        Returns every metric in the Prometheus text exposition format.
+        """
+        def format_labels(labels: LabelKey, **extra) -> str:
+            pairs = list(labels) + list(extra.items())
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            summaries = sorted(self._summaries.items())
+
+        lines = []
+        for kind, items in (("counter", counters), ("gauge", gauges)):
+            declared = set()
+            for (name, labels), value in items:
+                if name not in declared:
+                    lines.append(f"# TYPE {name} {kind}")
+                    declared.add(name)
+                lines.append(f"{name}{format_labels(labels)} {value:g}")
+
+        declared = set()
+        for (name, labels), (count, total, maximum) in summaries:
+            if name not in declared:
+                lines.append(f"# TYPE {name} summary")
+                declared.add(name)
+            lines.append(f"{name}_count{format_labels(labels)} {count}")
+            lines.append(f"{name}_sum{format_labels(labels)} {total:g}")
+            lines.append(f"{name}{format_labels(labels, quantile='1')} {maximum:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
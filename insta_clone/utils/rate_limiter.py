@@ -0,0 +1,114 @@
+import logging
+import time
+import uuid
+from typing import NamedTuple, Optional
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = [
+    "RateLimitResult",
+    "SlidingWindowRateLimiter",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitResult(NamedTuple):
+    """
+    The outcome of a rate limiter hit.
+
+    Attributes:
+        allowed (bool): Whether the action may proceed.
+        reason (Optional[str]): "limit" or "cooldown" when the action was rejected.
+        retry_after (int): Seconds until the action would be allowed again.
+    """
+    allowed: bool
+    reason: Optional[str] = None
+    retry_after: int = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    A sliding-window rate limiter backed by one Redis sorted set per identifier.
+
+    Each allowed hit is stored with its timestamp as the score. A hit is
+    rejected when the window already holds `limit` hits, or when the previous
+    hit is more recent than the cooldown. Everything is checked in a single
+    MULTI/EXEC round trip and the key expires with the window, so nothing has
+    to be cleaned up afterwards.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """
+        Args:
+            prefix (str): The prefix of the Redis keys, e.g. "ratelimit:messages".
+        """
+        self.prefix = prefix
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    def get_key(self, identifier: str) -> str:
+        return f"{self.prefix}:{identifier}"
+
+    def hit(
+        self,
+        identifier: str,
+        limit: int,
+        window: float,
+        cooldown: float = 0
+    ) -> RateLimitResult:
+        """
+        Records a hit for an identifier if the limits allow it.
+
+        The hit is added optimistically and removed again when it turns out to
+        be over the limit, so concurrent requests can never exceed the limit.
+
+        Args:
+            identifier (str): What is being limited, e.g. an email address.
+            limit (int): The maximum number of hits within the window.
+            window (float): The length of the sliding window in seconds.
+            cooldown (float): The minimum number of seconds between two hits.
+
+        Returns:
+            RateLimitResult: Whether the hit was allowed and, if not, why and
+            for how long.
+        """
+        key = self.get_key(identifier)
+        now = time.time()
+        member = f"{now}:{uuid.uuid4().hex}"
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.zremrangebyscore(key, "-inf", now - window)
+            pipe.zadd(key, {member: now})
+            pipe.zcard(key)
+            pipe.zrange(key, 0, 0, withscores=True)
+            pipe.zrevrange(key, 1, 1, withscores=True)
+            pipe.expire(key, max(int(window), 1))
+            _, _, count, oldest, previous, _ = pipe.execute()
+
+            if count > limit:
+                self.redis.zrem(key, member)
+                retry_after = oldest[0][1] + window - now
+                return RateLimitResult(False, "limit", max(int(retry_after), 0))
+
+            if previous and now - previous[0][1] < cooldown:
+                self.redis.zrem(key, member)
+                retry_after = previous[0][1] + cooldown - now
+                return RateLimitResult(False, "cooldown", max(int(retry_after), 0))
+
+        except RedisError as e:
+            logger.error(f"Rate limiter {self.prefix} is unavailable, allowing {identifier}: {e}")
+
+        return RateLimitResult(True)
+
+    def reset(self, identifier: str) -> None:
+        """
+        Forgets all hits recorded for an identifier.
+        """
+        try:
+            self.redis.delete(self.get_key(identifier))
+        except RedisError as e:
+            logger.warning(f"Could not reset rate limiter {self.prefix} for {identifier}: {e}")
@@ -1,18 +1,38 @@
+import re
 import logging
+import secrets
 from utils.slug import convert_to_slug
+from typing import Collection
 from django.db import models
+from django.db.models import BigIntegerField, Max, Value
+from django.db.models.functions import Cast, Coalesce, NullIf, Substr
 
 __all__ = ["generate_unique_slug"]
 
 logger = logging.getLogger(__name__)
 
+# Suffixes are user-controlled (a last name of digits), so only those that
+# fit a bigint, at most 18 digits without a leading zero, are counted.
+MAX_SUFFIX = 10 ** 18 - 1
 
-def generate_unique_slug(base_name: str, model_class: type[models.Model]) -> str:
+
+def generate_unique_slug(
+    base_name: str,
+    model_class: type[models.Model],
+    reserved: Collection[str] = ()
+) -> str:
     """
     Provides a unique slug generation based on the given model class.
 
+    Finds the highest numeric suffix already taken for the base slug in a
+    single query, instead of probing "slug", "slug-1", "slug-2", ... one at
+    a time. Two concurrent callers can still get the same slug, so callers
+    must retry when saving fails on the unique constraint. Once MAX_SUFFIX
+    is taken, a random suffix is used instead.
+
     :param base_name: Base name to create the slug from
     :param model_class: Model class, e.g. Author, Category, etc.
+    :param reserved: Slugs treated as taken even if no row has them
     :return: Unique slug
     """
     logger.info(
@@ -20,16 +40,29 @@ def generate_unique_slug(base_name: str, model_class: type[models.Model]) -> str
     )
 
     base_slug = convert_to_slug(base_name)
-    slug = base_slug
-    counter = 1
 
-    # Log if a slug already exists
-    while model_class.objects.filter(slug=slug).exists():
+    # "base" counts as suffix 0, "base-<n>" as suffix n.
+    suffix = Cast(
+        Coalesce(NullIf(Substr("slug", len(base_slug) + 2), Value("")), Value("0")),
+        BigIntegerField()
+    )
+    max_suffix = model_class.objects.filter(
+        slug__startswith=base_slug,
+        slug__regex=rf"^{re.escape(base_slug)}(-[1-9][0-9]{{0,17}})?$"
+    ).aggregate(max_suffix=Max(suffix))["max_suffix"]
+    if max_suffix is None and base_slug in reserved:
+        max_suffix = 0
+
+    if max_suffix is None:
+        slug = base_slug
+    elif max_suffix >= MAX_SUFFIX:
+        logger.warning(f"Slug \"{base_slug}\" has no sequential suffix left, using a random one.")
+        slug = f"{base_slug}-{secrets.randbelow(MAX_SUFFIX) + 1}"
+    else:
         logger.debug(
-            f"Slug \"{slug}\" already exists, generating new one with counter {counter}."
+            f"Slug \"{base_slug}\" already exists, highest suffix in use is {max_suffix}."
         )
-        slug = f"{base_slug}-{counter}"
-        counter += 1
+        slug = f"{base_slug}-{max_suffix + 1}"
 
     logger.info(f"Generated unique slug: {slug}")
-    return slug
\ No newline at end of file
+    return slug
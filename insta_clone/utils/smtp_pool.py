@@ -0,0 +1,179 @@
+import logging
+import os
+import smtplib
+import threading
+import time
+from typing import List, Sequence
+from celery.signals import worker_process_shutdown
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from utils.metrics import metrics
+
+__all__ = [
+    "EmailBatchError",
+    "PooledSMTPConnection",
+    "smtp_connection",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class EmailBatchError(Exception):
+    """
+    Raised when a message of a batch cannot be sent, even on a fresh
+    connection. The messages before it have already been sent.
+
+    Attributes:
+        sent (int): The number of messages sent before the failure.
+        unsent (List[EmailMessage]): The failed message and every one after it.
+        error (Exception): The error the failed message raised.
+    """
+
+    def __init__(self, sent: int, unsent: List[EmailMessage], error: Exception) -> None:
+        super().__init__(f"Sent {sent} message(s) before failing: {error}")
+        self.sent = sent
+        self.unsent = unsent
+        self.error = error
+
+
+def is_connection_lost(error: Exception) -> bool:
+    """
+    Tells apart a dropped or timed-out SMTP session, which a new connection
+    fixes, from a rejected message, which it does not.
+    """
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 421: the server is closing the transmission channel.
+        return error.smtp_code == 421
+    # SMTPException subclasses OSError, plain socket errors do not subclass it.
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class PooledSMTPConnection:
+    """
+    One email backend connection per process, kept open between sends.
+
+    Opening an SMTP session costs a TCP connect, the TLS handshake and a
+    login, which used to be paid for every verification email. The session
+    is now opened once per worker process and reused. After `keepalive`
+    idle seconds it is checked with NOOP before use, it is recycled after
+    `max_messages` messages, and a send that fails because the server
+    dropped the session is retried once on a new connection.
+    """
+
+    def __init__(self, keepalive: float, max_messages: int) -> None:
+        """
+        Args:
+            keepalive (float): Idle seconds after which the session is checked before reuse.
+            max_messages (int): Messages sent on one session before it is replaced.
+        """
+        self.keepalive = keepalive
+        self.max_messages = max_messages
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        self._last_used = 0.0
+        self._sent_on_connection = 0
+
+    def _open(self):
+        connection = get_connection(fail_silently=False)
+        connection.open()
+        metrics.incr("smtp_connections_opened_total")
+        self._sent_on_connection = 0
+        return connection
+
+    @staticmethod
+    def _is_alive(connection) -> bool:
+        if not hasattr(connection, "connection"):
+            # Console, locmem and file backends hold no socket.
+            return True
+        if connection.connection is None:
+            return False
+        try:
+            return connection.connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _discard(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _get(self):
+        if self._pid != os.getpid():
+            # A session inherited from the parent process belongs to the
+            # parent, so it is dropped without sending QUIT over it.
+            self._connection = None
+            self._pid = os.getpid()
+
+        if self._connection is not None and (
+            self._sent_on_connection >= self.max_messages
+            or (
+                time.monotonic() - self._last_used > self.keepalive
+                and not self._is_alive(self._connection)
+            )
+        ):
+            self._discard()
+
+        if self._connection is None:
+            self._connection = self._open()
+        return self._connection
+
+    def _send(self, message: EmailMessage) -> None:
+        try:
+            self._get().send_messages([message])
+        except Exception as error:
+            if not is_connection_lost(error):
+                raise
+            logger.warning(f"SMTP connection lost ({error}), reconnecting.")
+            metrics.incr("smtp_reconnects_total")
+            self._discard()
+            self._get().send_messages([message])
+        finally:
+            self._last_used = time.monotonic()
+        self._sent_on_connection += 1
+        metrics.incr("emails_sent_total")
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> int:
+        """
+        Sends messages in order over the pooled connection.
+
+        Returns:
+            int: The number of messages sent.
+
+        Raises:
+            EmailBatchError: If a message could not be sent.
+        """
+        messages = list(messages)
+        with self._lock:
+            for index, message in enumerate(messages):
+                try:
+                    self._send(message)
+                except Exception as error:
+                    metrics.incr("emails_failed_total")
+                    raise EmailBatchError(index, messages[index:], error) from error
+        return len(messages)
+
+    def close(self) -> None:
+        """
+        Closes the session of the current process, if one is open.
+        """
+        with self._lock:
+            if self._pid == os.getpid():
+                self._discard()
+
+
+smtp_connection = PooledSMTPConnection(
+    keepalive=getattr(settings, "SMTP_KEEPALIVE", 30),
+    max_messages=getattr(settings, "SMTP_CONNECTION_MAX_MESSAGES", 100)
+)
+
+
+@worker_process_shutdown.connect
+def close_smtp_connection(**kwargs) -> None:
+    smtp_connection.close()
@@ -0,0 +1,251 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Tuple
+from celery.signals import (
+    before_task_publish,
+    task_prerun,
+    task_postrun,
+    task_failure,
+    task_retry,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = ["TaskMetrics", "task_metrics"]
+
+logger = logging.getLogger(__name__)
+
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+class TaskMetrics:
+    """
+    Counters and histograms of Celery tasks, shared by every worker process.
+
+    Each process adds up its observations in memory and merges them into a
+    single Redis hash at most once per `flush_interval` seconds, so a task
+    costs a few dictionary updates and the web process can render the
+    totals of every worker next to its own metrics. A background thread
+    flushes every `flush_interval` seconds as well, so the last tasks of an
+    idle process show up without waiting for its next task.
+
+    Besides the Celery signals, tasks record their own results here, e.g.
+    the bytes a cleanup reclaimed, since the in-process `metrics` registry
+    of a worker is never rendered. An empty task name leaves the label out.
+
+    Fields of the hash are named "<metric>|<task name>|<bucket>", where the
+    bucket is empty for counters and for the histogram sum and count.
+    """
+
+    def __init__(self, key: str, flush_interval: float) -> None:
+        """
+        Args:
+            key (str): The Redis key of the hash, e.g. "metrics:celery".
+            flush_interval (float): The minimum number of seconds between two flushes.
+        """
+        self.key = key
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, float] = defaultdict(float)
+        self._last_flush = time.monotonic()
+        self._flusher_pid = None
+        self._stop = threading.Event()
+
+    @property
+    def redis(self):
+        return get_redis_connection("default")
+
+    def incr(self, name: str, task_name: str, amount: float = 1) -> None:
+        """
+        Increases a counter of a task.
+        """
+        with self._lock:
+            self._pending[f"{name}|{task_name}|"] += amount
+
+    def observe(self, name: str, task_name: str, value: float) -> None:
+        """
+        Records one observation of a histogram of a task, in seconds.
+        """
+        bucket = bisect_left(BUCKETS, value)
+        le = str(BUCKETS[bucket]) if bucket < len(BUCKETS) else "+Inf"
+        with self._lock:
+            self._pending[f"{name}|{task_name}|{le}"] += 1
+            self._pending[f"{name}_sum|{task_name}|"] += value
+            self._pending[f"{name}_count|{task_name}|"] += 1
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Merges the observations of this process into Redis, unless the
+        previous flush is more recent than `flush_interval`.
+        """
+        with self._lock:
+            if not self._pending or (
+                not force and time.monotonic() - self._last_flush < self.flush_interval
+            ):
+                return
+            pending, self._pending = self._pending, defaultdict(float)
+            self._last_flush = time.monotonic()
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for field, amount in pending.items():
+                pipe.hincrbyfloat(self.key, field, amount)
+            pipe.execute()
+        except RedisError as error:
+            logger.warning(f"Failed to flush task metrics: {error}")
+            with self._lock:
+                for field, amount in pending.items():
+                    self._pending[field] += amount
+
+    def get(self, name: str, task_name: str = "") -> float:
+        """
+        Returns the flushed total of a counter of a task, or 0 if unset.
+        """
+        value = self.redis.hget(self.key, f"{name}|{task_name}|")
+        return float(value) if value is not None else 0
+
+    def start_flusher(self) -> None:
+        """
+        Starts the thread that flushes this process every `flush_interval`
+        seconds. Threads do not survive a fork, so each worker process
+        starts its own; calling it again in the same process does nothing.
+        """
+        if self._flusher_pid == os.getpid():
+            return
+        self._flusher_pid = os.getpid()
+        self._stop = threading.Event()
+
+        def run(stop: threading.Event) -> None:
+            while not stop.wait(self.flush_interval):
+                self.flush()
+
+        threading.Thread(target=run, args=(self._stop,), name="task-metrics-flusher", daemon=True).start()
+
+    def stop_flusher(self) -> None:
+        """
+        Stops the flusher thread of this process, if it runs.
+        """
+        self._stop.set()
+        self._flusher_pid = None
+
+    def render(self) -> str:
+        """
+        Returns the totals of every worker in the Prometheus text format.
+        """
+        try:
+            stored = self.redis.hgetall(self.key)
+        except RedisError as error:
+            logger.warning(f"Failed to read task metrics: {error}")
+            return ""
+
+        values: Dict[str, Dict[Tuple[str, str], float]] = defaultdict(dict)
+        for field, value in stored.items():
+            name, task_name, le = field.decode().split("|")
+            values[name][(task_name, le)] = float(value)
+
+        histograms = sorted(
+            name[:-len("_count")] for name in values
+            if name.endswith("_count") and f"{name[:-len('_count')]}_sum" in values
+        )
+        derived = {f"{name}{suffix}" for name in histograms for suffix in ("", "_sum", "_count")}
+        counters = sorted(name for name in values if name not in derived)
+
+        def labels(task_name: str, le: str = "") -> str:
+            pairs = [f'task="{task_name}"'] if task_name else []
+            if le:
+                pairs.append(f'le="{le}"')
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        lines = []
+        for name in counters:
+            lines.append(f"# TYPE {name} counter")
+            for (task_name, _), value in sorted(values[name].items()):
+                lines.append(f"{name}{labels(task_name)} {value:g}")
+
+        for name in histograms:
+            lines.append(f"# TYPE {name} histogram")
+            for (task_name, _), count in sorted(values[f"{name}_count"].items()):
+                cumulative = 0.0
+                for le in [str(bucket) for bucket in BUCKETS] + ["+Inf"]:
+                    cumulative += values[name].get((task_name, le), 0)
+                    lines.append(f"{name}_bucket{labels(task_name, le)} {cumulative:g}")
+                total = values[f"{name}_sum"].get((task_name, ""), 0)
+                lines.append(f"{name}_sum{labels(task_name)} {total:g}")
+                lines.append(f"{name}_count{labels(task_name)} {count:g}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def clear(self) -> None:
+        """
+        Forgets every pending and stored value.
+        """
+        with self._lock:
+            self._pending.clear()
+        self.redis.delete(self.key)
+
+
+task_metrics = TaskMetrics(
+    "metrics:celery",
+    flush_interval=getattr(settings, "TASK_METRICS_FLUSH_INTERVAL", 10)
+)
+
+_started: Dict[str, float] = {}
+
+
+@before_task_publish.connect
+def stamp_enqueue_time(headers: dict = None, **kwargs) -> None:
+    # Wall-clock time, as the publisher and the worker are different hosts.
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
+@task_prerun.connect
+def record_task_start(task_id: str = None, task=None, **kwargs) -> None:
+    enqueued_at = getattr(task.request, "enqueued_at", None)
+    if enqueued_at is not None:
+        task_metrics.observe(
+            "celery_task_queue_wait_seconds", task.name, max(time.time() - enqueued_at, 0)
+        )
+    task_metrics.incr("celery_task_started_total", task.name)
+    _started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def record_task_end(task_id: str = None, task=None, state: str = None, **kwargs) -> None:
+    started = _started.pop(task_id, None)
+    if started is not None:
+        task_metrics.observe("celery_task_runtime_seconds", task.name, time.perf_counter() - started)
+    if state == "SUCCESS":
+        task_metrics.incr("celery_task_succeeded_total", task.name)
+    task_metrics.flush()
+
+
+@task_failure.connect
+def record_task_failure(sender=None, **kwargs) -> None:
+    task_metrics.incr("celery_task_failed_total", sender.name)
+
+
+@task_retry.connect
+def record_task_retry(sender=None, **kwargs) -> None:
+    task_metrics.incr("celery_task_retried_total", sender.name)
+
+
+@worker_init.connect
+@worker_process_init.connect
+def start_task_metrics_flusher(**kwargs) -> None:
+    # worker_init covers the solo and thread pools, which run tasks in the
+    # main process; worker_process_init covers each prefork child.
+    task_metrics.start_flusher()
+
+
+@worker_process_shutdown.connect
+def flush_task_metrics(**kwargs) -> None:
+    task_metrics.stop_flusher()
+    task_metrics.flush(force=True)
@@ -0,0 +1,160 @@
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from utils.metrics import metrics
+
+__all__ = [
+    "PoolOverloaded",
+    "BoundedWorkerPool",
+    "password_hashing_pool",
+]
+
+logger = logging.getLogger(__name__)
+
+_worker_state = threading.local()
+
+
+class PoolOverloaded(APIException):
+    """
+    Raised when a worker pool sheds a task because its queue is full.
+
+    DRF turns it into a 503 response whose Retry-After header is `wait`.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("The server is busy, please try again shortly.")
+    default_code = "service_unavailable"
+
+    def __init__(self, wait: int, detail: Optional[str] = None) -> None:
+        super().__init__(detail)
+        self.wait = wait
+
+
+class BoundedWorkerPool:
+    """
+    A fixed number of threads with a bounded queue in front of them.
+
+    CPU-heavy work such as password hashing runs on these threads instead
+    of the request thread, so at most `max_workers` cores are ever spent on
+    it and the remaining request threads keep serving other endpoints. When
+    `max_workers + max_queue` tasks are already waiting or running, new
+    tasks are rejected straight away with PoolOverloaded instead of queueing
+    without limit.
+
+    Tasks must not touch the database: worker threads have their own
+    connections, outside of the caller's transaction.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        """
+        Args:
+            name (str): The metric prefix, e.g. "password_hashing".
+            max_workers (int): The number of worker threads.
+            max_queue (int): How many tasks may wait for a free worker.
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._pending = 0
+        self._average_runtime = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor, creating it on first use in each process, so
+        pools imported before a fork do not share dead threads.
+        """
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name
+                )
+                self._pid = os.getpid()
+                self._pending = 0
+            return self._executor
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of tasks currently waiting or running.
+        """
+        return self._pending
+
+    def retry_after(self) -> int:
+        """
+        Estimates how many seconds it takes to drain the current queue.
+        """
+        backlog = self._pending * self._average_runtime / self.max_workers
+        return max(math.ceil(backlog), 1)
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a function on the pool and waits for its result.
+
+        Calls made from inside a pool task run inline, so nested calls
+        cannot deadlock the pool.
+
+        Raises:
+            PoolOverloaded: If the queue is full.
+        """
+        if getattr(_worker_state, "pool", None) is self:
+            return func(*args, **kwargs)
+
+        executor = self.executor
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                metrics.incr(f"{self.name}_rejected_total")
+                retry_after = self.retry_after()
+                logger.warning(
+                    f"{self.name} pool is full ({self._pending} pending), "
+                    f"shedding task, retry after {retry_after}s."
+                )
+                raise PoolOverloaded(retry_after)
+            self._pending += 1
+            metrics.set_gauge(f"{self.name}_pending", self._pending)
+
+        metrics.incr(f"{self.name}_submitted_total")
+        try:
+            future = executor.submit(self._call, func, time.perf_counter(), args, kwargs)
+        except RuntimeError:
+            self._done()
+            raise
+        return future.result()
+
+    def _call(self, func: Callable[..., Any], queued_at: float, args: tuple, kwargs: dict) -> Any:
+        started = time.perf_counter()
+        metrics.observe(f"{self.name}_wait_seconds", started - queued_at)
+        _worker_state.pool = self
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _worker_state.pool = None
+            runtime = time.perf_counter() - started
+            metrics.observe(f"{self.name}_run_seconds", runtime)
+            # Exponentially weighted, so Retry-After follows the current load.
+            self._average_runtime = self._average_runtime * 0.9 + runtime * 0.1
+            self._done()
+
+    def _done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            metrics.set_gauge(f"{self.name}_pending", self._pending)
+
+
+password_hashing_pool = BoundedWorkerPool(
+    "password_hashing",
+    max_workers=getattr(settings, "PASSWORD_HASHING_WORKERS", 2),
+    max_queue=getattr(settings, "PASSWORD_HASHING_QUEUE_SIZE", 16)
+)